@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+
 from data.enums._compat import StrEnum
 
 
@@ -26,3 +28,46 @@ class OrderHistoryAction(StrEnum):
     MANAGER_ASSIGNED = "Manager Assigned"
     MANAGER_UNASSIGNED = "Manager Unassigned"
     REOPENED = "Order reopened"
+
+
+# Status changes the backend allows (orderMiddleware.ts / OrderService) and the history action each records.
+# "In Process" additionally needs a scheduled delivery; the receive endpoint moves an order to
+# "Partially Received" or "Received".
+ORDER_STATUS_TRANSITIONS: dict[OrderStatus, dict[OrderStatus, OrderHistoryAction]] = {
+    OrderStatus.DRAFT: {
+        OrderStatus.IN_PROCESS: OrderHistoryAction.PROCESSED,
+        OrderStatus.CANCELED: OrderHistoryAction.CANCELED,
+    },
+    OrderStatus.IN_PROCESS: {
+        OrderStatus.RECEIVED: OrderHistoryAction.RECEIVED_ALL,
+        OrderStatus.PARTIALLY_RECEIVED: OrderHistoryAction.RECEIVED,
+        OrderStatus.CANCELED: OrderHistoryAction.CANCELED,
+    },
+    OrderStatus.PARTIALLY_RECEIVED: {OrderStatus.RECEIVED: OrderHistoryAction.RECEIVED_ALL},
+    OrderStatus.RECEIVED: {},
+    OrderStatus.CANCELED: {OrderStatus.DRAFT: OrderHistoryAction.REOPENED},
+}
+
+
+def order_status_path(source: OrderStatus, target: OrderStatus) -> list[OrderStatus]:
+    """Return the shortest sequence of statuses leading from *source* to *target*, without *source*.
+
+    Raises:
+        ValueError: If *target* cannot be reached from *source*.
+    """
+    previous: dict[OrderStatus, OrderStatus | None] = {source: None}
+    queue = deque([source])
+    while queue:
+        status = queue.popleft()
+        if status is target:
+            path: list[OrderStatus] = []
+            step: OrderStatus | None = status
+            while step is not None and step is not source:
+                path.append(step)
+                step = previous[step]
+            return path[::-1]
+        for following in ORDER_STATUS_TRANSITIONS[status]:
+            if following not in previous:
+                previous[following] = status
+                queue.append(following)
+    raise ValueError(f"Order status '{target}' cannot be reached from '{source}'")
@@ -8,6 +8,7 @@ from faker import Faker
 
 from data.enums.country import Country
 from data.models.customer import CustomerData
+from variables.constants import TEST_DATA_PREFIX
 
 _faker = Faker()
 
@@ -41,13 +42,16 @@ def generate_customer_data(
     phone: str | None = None,
     notes: str | None = None,
 ) -> CustomerData:
-    """Generate a valid CustomerData instance with optional field overrides."""
-    raw_name = f"{_faker.first_name()} {_faker.last_name()}"
+    """Generate a valid CustomerData instance with optional field overrides.
+
+    Generated names and emails start with ``TEST_DATA_PREFIX``.
+    """
+    raw_name = f"{TEST_DATA_PREFIX} {_faker.first_name()} {_faker.last_name()}"
     raw_city = _faker.city()
     raw_street = f"{_faker.street_name()} {random.randint(1, 99)}"
 
     return CustomerData(
-        email=email or _faker.unique.email(),
+        email=email or f"{TEST_DATA_PREFIX.lower()}.{_faker.unique.email()}",
         name=name or _only_letters(raw_name, 40),
         country=country or random.choice(list(Country)),
         city=city or _only_letters(raw_city, 20),
@@ -8,6 +8,7 @@ from faker import Faker
 
 from data.enums.manufacturers import Manufacturers
 from data.models.product import ProductData
+from variables.constants import TEST_DATA_PREFIX
 
 _faker = Faker()
 
@@ -19,9 +20,12 @@ def generate_product_data(
     manufacturer: str | None = None,
     notes: str | None = None,
 ) -> ProductData:
-    """Generate a valid ProductData instance with optional field overrides."""
+    """Generate a valid ProductData instance with optional field overrides.
+
+    Generated names start with ``TEST_DATA_PREFIX``.
+    """
     return ProductData(
-        name=name or _faker.unique.bothify(text="Product ????####"),
+        name=name or _faker.unique.bothify(text=f"{TEST_DATA_PREFIX} Product ????####"),
         amount=amount if amount is not None else random.randint(0, 999),
         price=price if price is not None else random.randint(1, 99999),
         manufacturer=manufacturer or random.choice(list(Manufacturers)),
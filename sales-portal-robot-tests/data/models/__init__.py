@@ -2,9 +2,18 @@
 
 from data.models.credentials import Credentials
 from data.models.customer import Customer, CustomerData
-from data.models.order import Comment, Delivery, DeliveryAddress, DeliveryData, Order, OrderData, OrderProduct
+from data.models.order import (
+    Comment,
+    Delivery,
+    DeliveryAddress,
+    DeliveryData,
+    Order,
+    OrderData,
+    OrderHistoryEntry,
+    OrderProduct,
+)
 from data.models.product import Product, ProductData
-from data.models.user import CreateUserPayload, User
+from data.models.user import CreateUserPayload, Performer, User
 
 __all__ = [
     "Comment",
@@ -17,7 +26,9 @@ __all__ = [
     "DeliveryData",
     "Order",
     "OrderData",
+    "OrderHistoryEntry",
     "OrderProduct",
+    "Performer",
     "Product",
     "ProductData",
     "User",
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from data.enums.country import Country
+from data.models.fields import WholeNumber
 
 
 class CustomerData(BaseModel):
@@ -13,8 +16,8 @@ class CustomerData(BaseModel):
     country: str
     city: str
     street: str
-    house: int
-    flat: int
+    house: WholeNumber
+    flat: WholeNumber
     phone: str
     notes: str | None = None
 
@@ -22,7 +25,9 @@ class CustomerData(BaseModel):
 class Customer(CustomerData):
     """Full customer as returned by the backend (includes _id and createdOn)."""
 
-    id: str  # mapped from _id
-    created_on: str | None = None  # mapped from createdOn
+    id: str = Field(alias="_id")
+    country: Country
+    notes: str = ""
+    created_on: str = Field(alias="createdOn")
 
     model_config = {"populate_by_name": True}
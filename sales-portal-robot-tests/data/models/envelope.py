@@ -0,0 +1,39 @@
+"""Response envelope models — the ``IsSuccess`` / ``ErrorMessage`` wrapper around every API payload."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+from pydantic import BaseModel, Field, create_model
+
+
+class ResponseEnvelope(BaseModel):
+    """Fields every backend response carries; list endpoints add paging fields, which are allowed."""
+
+    is_success: bool = Field(alias="IsSuccess")
+    error_message: str | None = Field(alias="ErrorMessage")
+
+    model_config = {"populate_by_name": True}
+
+
+class StrictResponseEnvelope(ResponseEnvelope):
+    """Closed envelope: no fields besides the payload and the two above."""
+
+    model_config = {"extra": "forbid"}
+
+
+@functools.cache
+def envelope_model(
+    model: type[BaseModel] | None, key: str = "", many: bool = False, strict: bool = False
+) -> type[ResponseEnvelope]:
+    """Return the (cached) envelope holding *model* under *key*, as a list when *many*.
+
+    With no *model* the bare envelope is returned (login, delete and error responses).  *strict*
+    forbids fields beyond the payload (``additionalProperties: false`` in the JSON schema).
+    """
+    if model is None:
+        return ResponseEnvelope
+    base = StrictResponseEnvelope if strict else ResponseEnvelope
+    payload: Any = list[model] if many else model  # type: ignore[valid-type]
+    return create_model(f"{key}Response", __base__=base, payload=(payload, Field(alias=key)))
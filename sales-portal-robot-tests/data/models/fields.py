@@ -0,0 +1,10 @@
+"""Field types shared by the data models."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+# Parsed as ``int``; published as JSON-schema ``number``, the contract the response schemas have always checked
+WholeNumber = Annotated[int, Field(json_schema_extra={"type": "number"})]
@@ -2,25 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any
-
 from pydantic import BaseModel, Field
 
+from data.enums.delivery_condition import DeliveryCondition
+from data.enums.order_status import OrderHistoryAction, OrderStatus
 from data.models.customer import Customer
+from data.models.fields import WholeNumber
+from data.models.user import Performer, User
 
 
 class OrderProduct(BaseModel):
     """A product line item inside an order."""
 
-    id: str  # _id
+    id: str = Field(alias="_id")
     name: str
-    amount: int
-    price: int
+    amount: WholeNumber
+    price: WholeNumber
     manufacturer: str
-    notes: str
+    notes: str = ""
     received: bool
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "forbid"}
 
 
 class DeliveryAddress(BaseModel):
@@ -29,18 +31,20 @@ class DeliveryAddress(BaseModel):
     country: str
     city: str
     street: str
-    house: int
-    flat: int
+    house: WholeNumber
+    flat: WholeNumber
+
+    model_config = {"extra": "forbid"}
 
 
 class Delivery(BaseModel):
     """Delivery info attached to an order."""
 
     address: DeliveryAddress
-    condition: str
-    final_date: str  # finalDate from backend
+    condition: DeliveryCondition
+    final_date: str = Field(alias="finalDate")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "forbid"}
 
 
 class DeliveryData(BaseModel):
@@ -56,11 +60,11 @@ class DeliveryData(BaseModel):
 class Comment(BaseModel):
     """Order comment."""
 
-    id: str  # _id
+    id: str = Field(alias="_id")
     text: str
-    created_on: str  # createdOn
+    created_on: str = Field(alias="createdOn")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "forbid"}
 
 
 class OrderData(BaseModel):
@@ -70,20 +74,37 @@ class OrderData(BaseModel):
     products: list[str]  # list of product _ids
 
 
+class OrderHistoryEntry(BaseModel):
+    """Snapshot of an order recorded with every change."""
+
+    status: OrderStatus
+    customer: str  # customer _id
+    products: list[OrderProduct]
+    total_price: float
+    delivery: Delivery | None
+    assigned_manager: User | None = Field(alias="assignedManager")
+    changed_on: str = Field(alias="changedOn")
+    action: OrderHistoryAction
+    performer: Performer
+
+    model_config = {"populate_by_name": True, "extra": "forbid"}
+
+
 class Order(BaseModel):
     """Full order as returned by the backend."""
 
-    id: str  # _id
-    status: str
+    id: str = Field(alias="_id")
+    status: OrderStatus
     customer: Customer
     products: list[OrderProduct]
+    delivery: Delivery | None
     total_price: float
-    created_on: str  # createdOn
+    created_on: str = Field(alias="createdOn")
     comments: list[Comment]
-    delivery: Delivery | None = None
-    assigned_manager: dict[str, Any] | None = None  # assignedManager (User)
+    history: list[OrderHistoryEntry]
+    assigned_manager: User | None = Field(alias="assignedManager")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "forbid"}
 
 
 __all__ = [
@@ -93,5 +114,6 @@ __all__ = [
     "DeliveryData",
     "Order",
     "OrderData",
+    "OrderHistoryEntry",
     "OrderProduct",
 ]
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from data.enums.manufacturers import Manufacturers
+from data.models.fields import WholeNumber
 
 
 class ProductData(BaseModel):
     """Payload for creating / updating a product."""
 
     name: str
-    amount: int
-    price: int
+    amount: WholeNumber
+    price: WholeNumber
     manufacturer: str
     notes: str | None = None
 
@@ -18,7 +21,9 @@ class ProductData(BaseModel):
 class Product(ProductData):
     """Full product as returned by the backend (includes _id and createdOn)."""
 
-    id: str  # mapped from _id
-    created_on: str | None = None  # mapped from createdOn
+    id: str = Field(alias="_id")
+    manufacturer: Manufacturers
+    notes: str = ""
+    created_on: str = Field(alias="createdOn")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "forbid"}
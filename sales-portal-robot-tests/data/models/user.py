@@ -1,21 +1,36 @@
-"""User Pydantic model."""
+"""User Pydantic models."""
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 
 class User(BaseModel):
-    """User as returned by the backend."""
+    """User as returned by the backend (``assignedManager`` of an order)."""
 
-    id: str  # _id
+    id: str = Field(alias="_id")
     username: str
-    first_name: str  # firstName
-    last_name: str  # lastName
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(alias="lastName")
+    roles: list[Literal["ADMIN", "USER"]]
+    created_on: str = Field(alias="createdOn")
+
+    model_config = {"populate_by_name": True, "extra": "forbid"}
+
+
+class Performer(BaseModel):
+    """User who made an order change, as embedded in the order history (roles are not restricted)."""
+
+    id: str = Field(alias="_id")
+    username: str
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(alias="lastName")
     roles: list[str]
-    created_on: str  # createdOn
+    created_on: str = Field(alias="createdOn")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "forbid"}
 
 
 class CreateUserPayload(BaseModel):
@@ -0,0 +1,56 @@
+"""Lazy access to the response JSON schemas generated from ``data/models`` (``response_schemas.json``).
+
+Nothing is read at import time.  The artifact is loaded on first use and every schema gets one
+validator instance, built when it is first needed and reused for every later validation.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+ARTIFACT_PATH = Path(__file__).with_name("response_schemas.json")
+
+
+@functools.cache
+def load_schemas() -> dict[str, dict[str, Any]]:
+    """Return all generated schemas by name."""
+    if not ARTIFACT_PATH.exists():
+        raise FileNotFoundError(f"{ARTIFACT_PATH} is missing; generate it with 'make schemas'")
+    schemas: dict[str, dict[str, Any]] = json.loads(ARTIFACT_PATH.read_text(encoding="utf-8"))["schemas"]
+    return schemas
+
+
+@functools.cache
+def schema_validator(name: str) -> Any:
+    """Return the validator for schema *name*; the generated schemas are trusted, so they are not re-checked."""
+    from jsonschema.validators import validator_for
+
+    schema = load_schemas()[name]
+    return validator_for(schema)(schema)
+
+
+class LazySchema(Mapping[str, Any]):
+    """A generated schema, read from the artifact only when it is first accessed or validated against."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @property
+    def validator(self) -> Any:
+        return schema_validator(self.name)
+
+    def __getitem__(self, key: str) -> Any:
+        return load_schemas()[self.name][key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(load_schemas()[self.name])
+
+    def __len__(self) -> int:
+        return len(load_schemas()[self.name])
+
+    def __repr__(self) -> str:
+        return f"LazySchema({self.name!r})"
@@ -1,25 +1,7 @@
-"""Customer object JSON schema."""
+"""Customer object JSON schema — generated from ``data.models.Customer`` (see ``scripts/generate_schemas.py``)."""
 
 from __future__ import annotations
 
-from typing import Any
+from data.schemas.compiled import LazySchema
 
-from data.enums.country import Country
-
-CUSTOMER_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "_id": {"type": "string"},
-        "email": {"type": "string"},
-        "name": {"type": "string"},
-        "country": {"type": "string", "enum": list(Country)},
-        "city": {"type": "string"},
-        "street": {"type": "string"},
-        "house": {"type": "number"},
-        "flat": {"type": "number"},
-        "phone": {"type": "string"},
-        "createdOn": {"type": "string"},
-        "notes": {"type": "string"},
-    },
-    "required": ["_id", "email", "name", "country", "city", "street", "house", "flat", "phone", "createdOn"],
-}
+CUSTOMER_SCHEMA = LazySchema("CUSTOMER_SCHEMA")
@@ -1,34 +1,9 @@
-"""Delivery JSON schemas."""
+"""Delivery JSON schemas — generated from ``data.models.order`` (see ``scripts/generate_schemas.py``)."""
 
 from __future__ import annotations
 
-from typing import Any
+from data.schemas.compiled import LazySchema
 
-from data.enums.delivery_condition import DeliveryCondition
+DELIVERY_ADDRESS_SCHEMA = LazySchema("DELIVERY_ADDRESS_SCHEMA")
 
-DELIVERY_ADDRESS_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "country": {"type": "string"},
-        "city": {"type": "string"},
-        "street": {"type": "string"},
-        "house": {"type": "number"},
-        "flat": {"type": "number"},
-    },
-    "required": ["country", "city", "street", "house", "flat"],
-    "additionalProperties": False,
-}
-
-DELIVERY_INFO_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "address": DELIVERY_ADDRESS_SCHEMA,
-        "finalDate": {"type": "string"},
-        "condition": {
-            "type": "string",
-            "enum": list(DeliveryCondition),
-        },
-    },
-    "required": ["address", "condition", "finalDate"],
-    "additionalProperties": False,
-}
+DELIVERY_INFO_SCHEMA = LazySchema("DELIVERY_INFO_SCHEMA")
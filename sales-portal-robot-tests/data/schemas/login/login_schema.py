@@ -1,15 +1,7 @@
-"""Login response JSON schema."""
+"""Login response JSON schema — the bare ``IsSuccess`` / ``ErrorMessage`` envelope."""
 
 from __future__ import annotations
 
-from typing import Any
+from data.schemas.compiled import LazySchema
 
-from data.schemas.core_schema import OBLIGATORY_FIELDS_SCHEMA, OBLIGATORY_REQUIRED_FIELDS
-
-LOGIN_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        **OBLIGATORY_FIELDS_SCHEMA,
-    },
-    "required": [*OBLIGATORY_REQUIRED_FIELDS],
-}
+LOGIN_SCHEMA = LazySchema("LOGIN_SCHEMA")
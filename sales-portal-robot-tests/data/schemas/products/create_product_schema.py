@@ -1,20 +1,10 @@
-"""Create product response JSON schema."""
+"""Create product response JSON schema — generated from ``data.models.Product``."""
 
 from __future__ import annotations
 
-from typing import Any
+from data.schemas.compiled import LazySchema
 
-from data.schemas.core_schema import OBLIGATORY_FIELDS_SCHEMA, OBLIGATORY_REQUIRED_FIELDS
-from data.schemas.products.product_schema import PRODUCT_SCHEMA
-
-CREATE_PRODUCT_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "Product": PRODUCT_SCHEMA,
-        **OBLIGATORY_FIELDS_SCHEMA,
-    },
-    "required": ["Product", *OBLIGATORY_REQUIRED_FIELDS],
-}
+CREATE_PRODUCT_SCHEMA = LazySchema("CREATE_PRODUCT_SCHEMA")
 
 # GET response has the same structure as CREATE
-GET_PRODUCT_SCHEMA: dict[str, Any] = CREATE_PRODUCT_SCHEMA
+GET_PRODUCT_SCHEMA = LazySchema("GET_PRODUCT_SCHEMA")
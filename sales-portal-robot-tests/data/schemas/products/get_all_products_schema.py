@@ -1,20 +1,7 @@
-"""Get all products response JSON schema."""
+"""Get all products response JSON schema — generated from ``data.models.Product``."""
 
 from __future__ import annotations
 
-from typing import Any
+from data.schemas.compiled import LazySchema
 
-from data.schemas.core_schema import OBLIGATORY_FIELDS_SCHEMA, OBLIGATORY_REQUIRED_FIELDS
-from data.schemas.products.product_schema import PRODUCT_SCHEMA
-
-GET_ALL_PRODUCTS_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "Products": {
-            "type": "array",
-            "items": PRODUCT_SCHEMA,
-        },
-        **OBLIGATORY_FIELDS_SCHEMA,
-    },
-    "required": ["Products", *OBLIGATORY_REQUIRED_FIELDS],
-}
+GET_ALL_PRODUCTS_SCHEMA = LazySchema("GET_ALL_PRODUCTS_SCHEMA")
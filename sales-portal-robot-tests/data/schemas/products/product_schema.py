@@ -1,28 +1,7 @@
-"""Product JSON schemas."""
+"""Product JSON schema — generated from ``data.models.Product`` (see ``scripts/generate_schemas.py``)."""
 
 from __future__ import annotations
 
-from typing import Any
+from data.schemas.compiled import LazySchema
 
-from data.enums.manufacturers import Manufacturers
-
-# --------------------------------------------------------------------------- #
-# Shared product object schema
-# --------------------------------------------------------------------------- #
-PRODUCT_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "_id": {"type": "string"},
-        "name": {"type": "string"},
-        "amount": {"type": "number"},
-        "price": {"type": "number"},
-        "createdOn": {"type": "string"},
-        "notes": {"type": "string"},
-        "manufacturer": {
-            "type": "string",
-            "enum": list(Manufacturers),
-        },
-    },
-    "required": ["_id", "name", "amount", "price", "manufacturer", "createdOn"],
-    "additionalProperties": False,
-}
+PRODUCT_SCHEMA = LazySchema("PRODUCT_SCHEMA")
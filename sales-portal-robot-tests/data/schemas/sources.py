@@ -0,0 +1,42 @@
+"""The model each response JSON schema is generated from — input of ``scripts/generate_schemas.py``.
+
+Only the generator imports this module; tests load the generated ``response_schemas.json`` through
+``data.schemas.compiled``.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from data.models.customer import Customer
+from data.models.envelope import ResponseEnvelope, envelope_model
+from data.models.order import Comment, Delivery, DeliveryAddress, Order, OrderHistoryEntry, OrderProduct
+from data.models.product import Product
+from data.models.user import Performer, User
+
+SCHEMA_SOURCES: dict[str, type[BaseModel]] = {
+    # Entities
+    "PRODUCT_SCHEMA": Product,
+    "CUSTOMER_SCHEMA": Customer,
+    "USER_SCHEMA": User,
+    "PERFORMER_SCHEMA": Performer,
+    "DELIVERY_ADDRESS_SCHEMA": DeliveryAddress,
+    "DELIVERY_INFO_SCHEMA": Delivery,
+    "ORDER_PRODUCT_SCHEMA": OrderProduct,
+    "COMMENT_SCHEMA": Comment,
+    "ORDER_HISTORY_SCHEMA": OrderHistoryEntry,
+    "ORDER_FROM_RESPONSE_SCHEMA": Order,
+    # Response bodies; strict envelopes are the ones that have always been closed (additionalProperties: false)
+    "LOGIN_SCHEMA": ResponseEnvelope,
+    "CREATE_PRODUCT_SCHEMA": envelope_model(Product, "Product"),
+    "GET_PRODUCT_SCHEMA": envelope_model(Product, "Product"),
+    "GET_ALL_PRODUCTS_SCHEMA": envelope_model(Product, "Products", many=True),
+    "CREATE_CUSTOMER_SCHEMA": envelope_model(Customer, "Customer"),
+    "GET_CUSTOMER_SCHEMA": envelope_model(Customer, "Customer"),
+    "GET_ALL_CUSTOMERS_SCHEMA": envelope_model(Customer, "Customers", many=True),
+    "CREATE_ORDER_SCHEMA": envelope_model(Order, "Order", strict=True),
+    "GET_ORDER_SCHEMA": envelope_model(Order, "Order", strict=True),
+    "GET_ALL_ORDERS_SCHEMA": envelope_model(Order, "Orders", many=True),
+    "GET_USER_SCHEMA": envelope_model(User, "User", strict=True),
+    "GET_ALL_USERS_SCHEMA": envelope_model(User, "Users", many=True, strict=True),
+}
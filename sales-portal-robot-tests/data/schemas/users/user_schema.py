@@ -1,50 +1,11 @@
-"""User JSON schemas."""
+"""User JSON schemas — generated from ``data.models.User`` (see ``scripts/generate_schemas.py``)."""
 
 from __future__ import annotations
 
-from typing import Any
+from data.schemas.compiled import LazySchema
 
-from data.schemas.core_schema import OBLIGATORY_FIELDS_SCHEMA, OBLIGATORY_REQUIRED_FIELDS
+USER_SCHEMA = LazySchema("USER_SCHEMA")
 
-USER_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "_id": {"type": "string"},
-        "username": {"type": "string"},
-        "firstName": {"type": "string"},
-        "lastName": {"type": "string"},
-        "roles": {
-            "type": "array",
-            "items": {
-                "type": "string",
-                "enum": ["ADMIN", "USER"],
-            },
-        },
-        "createdOn": {"type": "string"},
-    },
-    "required": ["_id", "username", "firstName", "lastName", "roles", "createdOn"],
-    "additionalProperties": False,
-}
+GET_USER_SCHEMA = LazySchema("GET_USER_SCHEMA")
 
-GET_USER_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "User": USER_SCHEMA,
-        **OBLIGATORY_FIELDS_SCHEMA,
-    },
-    "required": ["User", *OBLIGATORY_REQUIRED_FIELDS],
-    "additionalProperties": False,
-}
-
-GET_ALL_USERS_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "Users": {
-            "type": "array",
-            "items": USER_SCHEMA,
-        },
-        **OBLIGATORY_FIELDS_SCHEMA,
-    },
-    "required": ["Users", *OBLIGATORY_REQUIRED_FIELDS],
-    "additionalProperties": False,
-}
+GET_ALL_USERS_SCHEMA = LazySchema("GET_ALL_USERS_SCHEMA")
@@ -3,14 +3,28 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, cast
+from urllib.parse import urlsplit
 
 import requests
 from robot.api import logger
 from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
 
+from libraries.api.metrics import RouteMetrics
 from libraries.api.response import ApiResponse
+from libraries.api.response_cache import CacheKey, ResponseCache, make_cache_key
+from libraries.api.retry import RetryPolicy, RetryStats
+from libraries.api.routes import ROUTES, family_of
+from libraries.api.single_flight import SingleFlight
+from libraries.api.throttle import AdaptiveConcurrencyLimiter, ApiThrottle, TokenBucket
+from libraries.api.transport import Http2Transport, RawResponse, RequestsTransport, Transport
 
 _SECRET_PATTERN = re.compile(r'"(password|token|Authorization)":\s*"[^"]*"', re.IGNORECASE)
+_STATS_FILE = "api-client-stats.json"
 
 
 def _mask_secrets(text: str) -> str:
@@ -19,10 +33,34 @@ def _mask_secrets(text: str) -> str:
 
 @library(scope="GLOBAL")
 class ApiClientLibrary:
-    """Low-level HTTP client keyword library — wraps requests.Session."""
+    """Low-level HTTP client keyword library — wraps requests.Session (or httpx for HTTP/2).
+
+    Every request is attributed to its route template from ``libraries/api/routes.py``; per-route
+    counts and latencies are available via ``Get API Client Stats`` and are written to
+    ``<outputdir>/api-client-stats.json`` when the run ends.
+
+    Identical GETs (same route, path, params and token) issued concurrently from several threads share
+    one network call; every caller gets its own copy of the decoded ``ApiResponse``.  GET responses
+    can optionally be cached (``Enable Response Cache``); any non-GET request invalidates the cached
+    responses of its resource family.  ``Configure API Throttling`` adds a rate limit and an adaptive
+    concurrency limit shared by every thread of the process.  Retries are off unless enabled with
+    ``Configure API Retries`` (or ``API_RETRY_ATTEMPTS``); then connection errors, timeouts and
+    502/503/504 responses of GET/HEAD/OPTIONS requests are retried with backoff.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
 
     def __init__(self) -> None:
-        self._session = requests.Session()
+        self._transport: Transport = RequestsTransport()
+        self._metrics = RouteMetrics()
+        self._stats_path: Path | None = None
+        self._cache: ResponseCache | None = None
+        self._in_flight: SingleFlight[CacheKey, ApiResponse] = SingleFlight()
+        self._throttle: ApiThrottle | None = None
+        self._retry_policy = RetryPolicy()
+        self._retry_stats = RetryStats()
+        self._timeout: float | None = None
+        self.ROBOT_LIBRARY_LISTENER = self
 
     @keyword("Send API Request")
     def send_api_request(
@@ -32,30 +70,344 @@ class ApiClientLibrary:
         token: str | None = None,
         body: dict | None = None,  # type: ignore[type-arg]
         params: dict | None = None,  # type: ignore[type-arg]
+        use_cache: bool = True,
+        retry: bool | None = None,
     ) -> ApiResponse:
+        """Send an HTTP request and wrap the result in an ``ApiResponse``.
+
+        A GET joins an identical request already in flight, and with the response cache enabled is served
+        from the cache when possible; pass ``use_cache=False`` to force a dedicated round trip (e.g. when
+        asserting a freshly written value).
+
+        With retries enabled, transient failures are retried for GET/HEAD/OPTIONS only; ``retry=True``
+        also allows it for POST/PUT/PATCH/DELETE (use only for requests that are safe to repeat),
+        ``retry=False`` disables it.
+        """
+        method = method.upper()
         headers: dict[str, str] = {"Content-Type": "application/json"}
         if token:
             headers["Authorization"] = f"Bearer {token}"
 
-        logger.info(f"{method.upper()} {url}")
+        match = ROUTES.match(method, url)
+        route = match.route.template if match else urlsplit(url).path
+
+        logger.info(f"{method} {url}")
         if body:
             logger.debug(f"Request Body: {_mask_secrets(json.dumps(body, indent=2))}")
 
-        resp = self._session.request(
-            method=method.upper(),
-            url=url,
-            headers=headers,
-            json=body,
-            params=params,
+        cache = self._cache
+        cache_key: CacheKey | None = None
+        if method == "GET" and use_cache:
+            cache_key = make_cache_key(route, urlsplit(url).path, params, token)
+            cached = cache.get(cache_key) if cache is not None else None
+            if cached is not None:
+                logger.info(f"Response {cached.status} (cached): {_mask_secrets(json.dumps(cached.body, indent=2))}")
+                return cached
+
+        family = family_of(route)
+
+        def execute() -> ApiResponse:
+            # Taken before sending: a write to the family that lands meanwhile makes this response unsafe to cache
+            generation = cache.generation(family) if cache is not None and cache_key is not None else None
+            response = self._execute(method, url, route, headers, body, params, retry)
+            if cache is not None and cache_key is not None and response.status == 200:
+                cache.put(cache_key, family, response, generation)
+            return response
+
+        if cache_key is not None:
+            response, shared = self._in_flight.do(cache_key, execute)
+            if shared:
+                # The executing caller owns the original; nobody else may see changes made to its body
+                response = response.copy()
+        else:
+            response, shared = execute(), False
+            if cache is not None and method != "GET":
+                cache.invalidate(family)
+        logger.info(
+            f"Response {response.status}{' (coalesced)' if shared else ''}: "
+            f"{_mask_secrets(json.dumps(response.body, indent=2))}"
         )
-        response = ApiResponse(
+        return response
+
+    @keyword("Get API Client Stats")
+    def get_api_client_stats(self) -> dict[str, Any]:
+        """Return request statistics collected so far.
+
+        ``routes`` maps ``METHOD /template`` to ``count``, ``errors`` (exceptions and 5xx),
+        ``avg_ms``, ``max_ms`` and ``total_ms``, slowest route first.  ``coalescing`` counts GETs that
+        joined an identical in-flight request (``saved``); ``retries`` counts retries, how many requests
+        eventually ``recovered`` or were ``exhausted``, and the time retries cost (failed attempts plus
+        backoff).  ``cache`` and ``throttle`` are present while caching / throttling is enabled.
+        """
+        stats: dict[str, Any] = {
+            "routes": self._metrics.snapshot(),
+            "coalescing": self._in_flight.stats(),
+            "retries": self._retry_stats.snapshot(),
+            "transport": {"name": self._transport.name, "protocols": self._metrics.protocols()},
+        }
+        if self._cache is not None:
+            stats["cache"] = self._cache.stats()
+        if self._throttle is not None:
+            stats["throttle"] = self._throttle.stats()
+        return stats
+
+    @keyword("Log API Client Stats")
+    def log_api_client_stats(self) -> None:
+        """Write the current request statistics to log.html as formatted JSON."""
+        logger.info(json.dumps(self.get_api_client_stats(), indent=2))
+
+    @keyword("Reset API Client Stats")
+    def reset_api_client_stats(self) -> None:
+        """Discard all statistics collected so far."""
+        self._metrics.reset()
+        self._in_flight.reset()
+        self._retry_stats.reset()
+
+    @keyword("Enable Response Cache")
+    def enable_response_cache(self, ttl: float = 30.0, max_entries: int = 512) -> None:
+        """Cache successful GET responses for ``ttl`` seconds, keeping at most ``max_entries`` (LRU).
+
+        Entries are keyed by route template, path, query params and token, so users never share
+        responses.  POST/PUT/PATCH/DELETE requests drop the cached responses of the affected resource
+        family; ``POST /api/logout`` drops everything.  Calling this again replaces the cache.
+        """
+        self._cache = ResponseCache(ttl=float(ttl), max_entries=int(max_entries))
+
+    @keyword("Disable Response Cache")
+    def disable_response_cache(self) -> None:
+        """Stop caching and discard all cached responses."""
+        self._cache = None
+
+    @keyword("Clear Response Cache")
+    def clear_response_cache(self) -> None:
+        """Discard all cached responses, keeping the cache enabled and its counters."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @keyword("Send API Requests Concurrently")
+    def send_api_requests_concurrently(
+        self,
+        request_list: list[dict],  # type: ignore[type-arg]
+        max_workers: int = 16,
+    ) -> list[ApiResponse]:
+        """Send several requests in parallel and return their responses in input order.
+
+        Each item is a dict with ``method`` and ``url`` and optionally ``token``, ``body`` and
+        ``params``.  With the HTTP/2 transport the requests are multiplexed over a single connection;
+        with HTTP/1.1 each worker uses its own pooled keep-alive connection.
+        """
+        if not request_list:
+            return []
+
+        def send(item: dict[str, Any]) -> ApiResponse:
+            return cast(
+                ApiResponse,
+                self.send_api_request(
+                    item["method"],
+                    item["url"],
+                    token=item.get("token"),
+                    body=item.get("body"),
+                    params=item.get("params"),
+                ),
+            )
+
+        workers = min(int(max_workers), len(request_list))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-bulk") as pool:
+            return list(pool.map(send, request_list))
+
+    @keyword("Use HTTP2 Transport")
+    def use_http2_transport(self, prior_knowledge: bool = False, max_connections: int = 10) -> bool:
+        """Switch to an HTTP/2 capable httpx transport; return ``False`` if it is unavailable.
+
+        Requires the optional ``http2`` extra (``pip install -e ".[http2]"``).  Without it the client
+        logs a warning and stays on HTTP/1.1.  HTTPS servers negotiate the protocol (falling back to
+        HTTP/1.1 per connection); for plain ``http://`` pass ``prior_knowledge=True`` when the server
+        speaks cleartext HTTP/2.
+        """
+        try:
+            transport = Http2Transport(prior_knowledge=prior_knowledge, max_connections=int(max_connections))
+        except ImportError as exc:
+            logger.warn(f"HTTP/2 transport unavailable ({exc}); staying on HTTP/1.1")
+            return False
+        self._replace_transport(transport)
+        return True
+
+    @keyword("Use HTTP1 Transport")
+    def use_http1_transport(self, pool_maxsize: int = 10) -> None:
+        """Switch to the default requests transport with up to ``pool_maxsize`` keep-alive connections per host."""
+        self._replace_transport(RequestsTransport(pool_maxsize=int(pool_maxsize)))
+
+    @keyword("Configure API Retries")
+    def configure_api_retries(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.2,
+        max_backoff: float = 5.0,
+        retry_statuses: list[int] | None = None,
+        timeout: float | None = None,
+        jitter: bool = True,
+    ) -> None:
+        """Enable retries of transient failures; ``attempts=1`` (the library default) disables them.
+
+        ``attempts`` includes the first try.  Backoff before retry *n* is a random delay of up to
+        ``backoff * 2 ** (n - 1)`` seconds (exactly that with ``jitter=False``), capped at
+        ``max_backoff``; a numeric ``Retry-After`` header raises it.  ``retry_statuses`` defaults to
+        502, 503 and 504.  ``timeout`` is the per-attempt timeout in seconds (``None`` waits forever);
+        timeouts are retried like connection errors.  Only GET/HEAD/OPTIONS are retried unless a
+        request passes ``retry=True``.
+        """
+        self._retry_policy = RetryPolicy(
+            attempts=int(attempts),
+            backoff=float(backoff),
+            max_backoff=float(max_backoff),
+            retry_statuses=frozenset(retry_statuses) if retry_statuses is not None else RetryPolicy.retry_statuses,
+            jitter=bool(jitter),
+        )
+        self._timeout = float(timeout) if timeout is not None else None
+
+    @keyword("Configure API Throttling")
+    def configure_api_throttling(
+        self,
+        rate: float = 0,
+        burst: int = 10,
+        max_concurrency: int = 0,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """Throttle all requests of this process; ``0`` disables the respective limit.
+
+        ``rate`` is the sustained requests per second with bursts of up to ``burst``.  With
+        ``max_concurrency`` set, the number of requests in flight starts at ``initial_concurrency`` and
+        grows additively while responses stay fast and healthy; a 429/5xx/transport error, or recent
+        latency above ``latency_tolerance`` times the long-run average, halves it (at most once per second,
+        never below ``min_concurrency``).
+
+        Example: ``Configure API Throttling    rate=50    max_concurrency=16``
+        """
+        bucket = TokenBucket(float(rate), int(burst)) if float(rate) > 0 else None
+        limiter = (
+            AdaptiveConcurrencyLimiter(
+                initial=int(initial_concurrency),
+                min_limit=int(min_concurrency),
+                max_limit=int(max_concurrency),
+                latency_tolerance=float(latency_tolerance),
+            )
+            if int(max_concurrency) > 0
+            else None
+        )
+        self._throttle = ApiThrottle(bucket, limiter) if bucket or limiter else None
+
+    @keyword("Disable API Throttling")
+    def disable_api_throttling(self) -> None:
+        """Remove any rate and concurrency limit."""
+        self._throttle = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _replace_transport(self, transport: Transport) -> None:
+        previous, self._transport = self._transport, transport
+        previous.close()
+
+    def _execute(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        headers: dict[str, str],
+        body: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        retry: bool | None = None,
+    ) -> ApiResponse:
+        policy = self._retry_policy
+        route_key = f"{method} {route}"
+        retryable = policy.allows(method, retry)
+        attempt = 1
+        while True:
+            start = time.perf_counter()
+            try:
+                resp = self._send_once(method, url, route_key, headers, body, params)
+            except requests.RequestException as exc:
+                if not (retryable and policy.is_retryable_error(exc)) or attempt >= policy.attempts:
+                    if attempt > 1:
+                        self._retry_stats.record_outcome(route_key, recovered=False)
+                    raise
+                reason, retry_headers = type(exc).__name__, None
+            else:
+                transient = policy.is_retryable_status(resp.status_code)
+                if not (retryable and transient) or attempt >= policy.attempts:
+                    if attempt > 1:
+                        self._retry_stats.record_outcome(route_key, recovered=not transient)
+                    break
+                reason, retry_headers = f"HTTP {resp.status_code}", resp.headers
+            delay = policy.delay(attempt, retry_headers)
+            logger.info(f"{route_key} failed ({reason}); retry {attempt}/{policy.attempts - 1} in {delay:.2f}s")
+            time.sleep(delay)
+            self._retry_stats.record_retry(route_key, reason, time.perf_counter() - start)
+            attempt += 1
+
+        return ApiResponse(
             status=resp.status_code,
-            body=resp.json() if resp.text else {},
+            body=json.loads(resp.text) if resp.text else {},
             headers=dict(resp.headers),
             text=resp.text,
+            method=method,
+            url=url,
+            route=route,
+            content=resp.content,
         )
-        logger.info(
-            f"Response {response.status}: "
-            f"{_mask_secrets(json.dumps(response.body, indent=2))}"
-        )
-        return response
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        route_key: str,
+        headers: dict[str, str],
+        body: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+    ) -> RawResponse:
+        throttle = self._throttle
+        if throttle is not None:
+            throttle.acquire()
+        status = 0
+        start = time.perf_counter()
+        try:
+            resp = self._transport.request(method, url, headers, body, params, self._timeout)
+            status = resp.status_code
+        finally:
+            elapsed = time.perf_counter() - start
+            self._metrics.record(route_key, status, elapsed, resp.http_version if status else "")
+            if throttle is not None:
+                throttle.release(status, elapsed)
+        return resp
+
+    # ------------------------------------------------------------------
+    # Library listener (API v3)
+    # ------------------------------------------------------------------
+
+    def end_suite(self, data: object, result: object) -> None:
+        if self._stats_path is None:
+            output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}")
+            pabot_index = BuiltIn().get_variable_value("${PABOTQUEUEINDEX}")
+            name = _STATS_FILE if pabot_index is None else f"api-client-stats-{pabot_index}.json"
+            self._stats_path = Path(output_dir) / name
+
+    def close(self) -> None:
+        if self._stats_path is not None and self._metrics.snapshot():
+            self._stats_path.parent.mkdir(parents=True, exist_ok=True)
+            self._stats_path.write_text(json.dumps(self.get_api_client_stats(), indent=2), encoding="utf-8")
+        retry_stats = self._retry_stats.snapshot()
+        if retry_stats["retries"]:
+            logger.console(
+                f"API retries: {retry_stats['retries']} retries, {retry_stats['recovered']} recovered, "
+                f"{retry_stats['exhausted']} exhausted, {retry_stats['cost_ms'] / 1000:.2f}s spent"
+            )
+        if self._cache is not None:
+            cache_stats = self._cache.stats()
+            logger.console(
+                f"API response cache: {cache_stats['hits']} hits / "
+                f"{cache_stats['hits'] + cache_stats['misses']} lookups "
+                f"(hit ratio {cache_stats['hit_ratio']:.1%})"
+            )
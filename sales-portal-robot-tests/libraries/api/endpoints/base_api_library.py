@@ -0,0 +1,40 @@
+"""Shared base for endpoint keyword libraries — resolves the ApiClient instance once per library scope."""
+from __future__ import annotations
+
+from typing import cast
+
+from robot.libraries.BuiltIn import BuiltIn
+
+from libraries.api.api_client import ApiClientLibrary
+
+
+class BaseApiLibrary:
+    """Base class for the ``*ApiLibrary`` endpoint libraries.
+
+    ``BuiltIn().get_library_instance()`` is a namespace lookup; doing it on every request adds measurable
+    overhead in DDT and load runs.  The client is therefore looked up on first use and kept for the
+    lifetime of the endpoint library.  Endpoint libraries are SUITE-scoped and ``ApiClient`` is GLOBAL,
+    so the cached reference never outlives the suite that resolved it and always points at the single
+    process-wide client.
+    """
+
+    CLIENT_LIBRARY_NAME = "ApiClient"
+
+    def __init__(self) -> None:
+        self._client_instance: ApiClientLibrary | None = None
+
+    def resolve_client(self) -> ApiClientLibrary:
+        """Return the ``ApiClient`` instance, looking it up on the first call.
+
+        The lookup needs Robot's execution context, so code that later sends requests from worker
+        threads calls this on Robot's thread first.
+        """
+        client = self._client_instance
+        if client is None:
+            client = cast(ApiClientLibrary, BuiltIn().get_library_instance(self.CLIENT_LIBRARY_NAME))
+            self._client_instance = client
+        return client
+
+    @property
+    def _client(self) -> ApiClientLibrary:
+        return self.resolve_client()
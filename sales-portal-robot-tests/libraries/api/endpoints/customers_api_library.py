@@ -1,24 +1,20 @@
 """Customers API keyword library — Phase 6."""
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
 from robot.api.deco import keyword, library
-from robot.libraries.BuiltIn import BuiltIn
 
 import variables.api_config as api
-from libraries.api.api_client import ApiClientLibrary
+from libraries.api.endpoints.base_api_library import BaseApiLibrary
+from libraries.api.pagination import PageIterator, collect_items, find_item
 from libraries.api.response import ApiResponse
 
 
 @library(scope="SUITE")
-class CustomersApiLibrary:
+class CustomersApiLibrary(BaseApiLibrary):
     """Keywords for /api/customers endpoints."""
 
-    @property
-    def _client(self) -> ApiClientLibrary:
-        return cast(ApiClientLibrary, BuiltIn().get_library_instance("ApiClient"))
-
     @keyword("Create Customer")
     def create_customer(self, token: str, body: dict) -> ApiResponse:  # type: ignore[type-arg]
         return cast(ApiResponse, self._client.send_api_request("POST", api.CUSTOMERS, token=token, body=body))
@@ -35,6 +31,48 @@ class CustomersApiLibrary:
     def get_customers_list(self, token: str, params: dict | None = None) -> ApiResponse:  # type: ignore[type-arg]
         return cast(ApiResponse, self._client.send_api_request("GET", api.CUSTOMERS, token=token, params=params))
 
+    @keyword("Get Customers Paginated")
+    def get_customers_paginated(
+        self,
+        token: str,
+        params: dict | None = None,  # type: ignore[type-arg]
+        page_size: int = 100,
+        max_items: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Walk ``GET /api/customers`` page by page and return the collected customers.
+
+        The next page is prefetched while the current one is processed.  Iteration stops after
+        *max_items* customers (all pages when ``None``); the backend clamps *page_size* to 10-100.
+        """
+        return collect_items(self.iter_customers(token, params, page_size), max_items)
+
+    @keyword("Find Customer In Pages")
+    def find_customer_in_pages(
+        self,
+        token: str,
+        field: str,
+        value: str,
+        params: dict | None = None,  # type: ignore[type-arg]
+        page_size: int = 100,
+    ) -> dict[str, Any] | None:
+        """Return the first customer whose *field* equals *value*, or ``None``; stops paging once found."""
+        return find_item(self.iter_customers(token, params, page_size), field, value)
+
+    def iter_customers(
+        self,
+        token: str,
+        params: dict | None = None,  # type: ignore[type-arg]
+        page_size: int = 100,
+    ) -> PageIterator:
+        """Python-side iterator over all customers of ``GET /api/customers`` (used by other libraries)."""
+        client = self._client  # resolve on the caller's thread, not in the prefetch worker
+        return PageIterator(
+            lambda page_params: client.send_api_request("GET", api.CUSTOMERS, token=token, params=page_params),
+            items_key="Customers",
+            params=params,
+            page_size=page_size,
+        )
+
     @keyword("Update Customer")
     def update_customer(self, token: str, customer_id: str, body: dict) -> ApiResponse:  # type: ignore[type-arg]
         return cast(
@@ -4,21 +4,16 @@ from __future__ import annotations
 from typing import cast
 
 from robot.api.deco import keyword, library
-from robot.libraries.BuiltIn import BuiltIn
 
 import variables.api_config as api
-from libraries.api.api_client import ApiClientLibrary
+from libraries.api.endpoints.base_api_library import BaseApiLibrary
 from libraries.api.response import ApiResponse
 
 
 @library(scope="SUITE")
-class LoginApiLibrary:
+class LoginApiLibrary(BaseApiLibrary):
     """Keywords for /api/login and /api/logout."""
 
-    @property
-    def _client(self) -> ApiClientLibrary:
-        return cast(ApiClientLibrary, BuiltIn().get_library_instance("ApiClient"))
-
     @keyword("Login User")
     def login_user(self, username: str, password: str) -> ApiResponse:
         return cast(
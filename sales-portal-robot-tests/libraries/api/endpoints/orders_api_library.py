@@ -4,21 +4,16 @@ from __future__ import annotations
 from typing import cast
 
 from robot.api.deco import keyword, library
-from robot.libraries.BuiltIn import BuiltIn
 
 import variables.api_config as api
-from libraries.api.api_client import ApiClientLibrary
+from libraries.api.endpoints.base_api_library import BaseApiLibrary
 from libraries.api.response import ApiResponse
 
 
 @library(scope="SUITE")
-class OrdersApiLibrary:
+class OrdersApiLibrary(BaseApiLibrary):
     """Keywords for /api/orders endpoints."""
 
-    @property
-    def _client(self) -> ApiClientLibrary:
-        return cast(ApiClientLibrary, BuiltIn().get_library_instance("ApiClient"))
-
     @keyword("Create Order")
     def create_order(self, token: str, body: dict) -> ApiResponse:  # type: ignore[type-arg]
         return cast(ApiResponse, self._client.send_api_request("POST", api.ORDERS, token=token, body=body))
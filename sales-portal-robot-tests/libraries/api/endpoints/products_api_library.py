@@ -1,28 +1,38 @@
 """Products API keyword library — Phase 6."""
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
 from robot.api.deco import keyword, library
-from robot.libraries.BuiltIn import BuiltIn
 
 import variables.api_config as api
-from libraries.api.api_client import ApiClientLibrary
+from libraries.api.endpoints.base_api_library import BaseApiLibrary
+from libraries.api.pagination import PageIterator, collect_items, find_item
 from libraries.api.response import ApiResponse
 
 
 @library(scope="SUITE")
-class ProductsApiLibrary:
+class ProductsApiLibrary(BaseApiLibrary):
     """Keywords for /api/products endpoints."""
 
-    @property
-    def _client(self) -> ApiClientLibrary:
-        return cast(ApiClientLibrary, BuiltIn().get_library_instance("ApiClient"))
-
     @keyword("Create Product")
     def create_product(self, token: str, body: dict) -> ApiResponse:  # type: ignore[type-arg]
         return cast(ApiResponse, self._client.send_api_request("POST", api.PRODUCTS, token=token, body=body))
 
+    @keyword("Create Products Concurrently")
+    def create_products_concurrently(
+        self,
+        token: str,
+        bodies: list[dict],  # type: ignore[type-arg]
+        max_workers: int = 16,
+    ) -> list[ApiResponse]:
+        """POST every body to /api/products in parallel; responses are returned in input order."""
+        request_list = [{"method": "POST", "url": api.PRODUCTS, "token": token, "body": body} for body in bodies]
+        return cast(
+            list[ApiResponse],
+            self._client.send_api_requests_concurrently(request_list, max_workers=int(max_workers)),
+        )
+
     @keyword("Get Product By Id")
     def get_product_by_id(self, token: str, product_id: str) -> ApiResponse:
         return cast(ApiResponse, self._client.send_api_request("GET", api.product_by_id(product_id), token=token))
@@ -35,6 +45,48 @@ class ProductsApiLibrary:
     def get_products_list(self, token: str, params: dict | None = None) -> ApiResponse:  # type: ignore[type-arg]
         return cast(ApiResponse, self._client.send_api_request("GET", api.PRODUCTS, token=token, params=params))
 
+    @keyword("Get Products Paginated")
+    def get_products_paginated(
+        self,
+        token: str,
+        params: dict | None = None,  # type: ignore[type-arg]
+        page_size: int = 100,
+        max_items: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Walk ``GET /api/products`` page by page and return the collected products.
+
+        The next page is prefetched while the current one is processed.  Iteration stops after
+        *max_items* products (all pages when ``None``); the backend clamps *page_size* to 10-100.
+        """
+        return collect_items(self.iter_products(token, params, page_size), max_items)
+
+    @keyword("Find Product In Pages")
+    def find_product_in_pages(
+        self,
+        token: str,
+        field: str,
+        value: str,
+        params: dict | None = None,  # type: ignore[type-arg]
+        page_size: int = 100,
+    ) -> dict[str, Any] | None:
+        """Return the first product whose *field* equals *value*, or ``None``; stops paging once found."""
+        return find_item(self.iter_products(token, params, page_size), field, value)
+
+    def iter_products(
+        self,
+        token: str,
+        params: dict | None = None,  # type: ignore[type-arg]
+        page_size: int = 100,
+    ) -> PageIterator:
+        """Python-side iterator over all products of ``GET /api/products`` (used by other libraries)."""
+        client = self._client  # resolve on the caller's thread, not in the prefetch worker
+        return PageIterator(
+            lambda page_params: client.send_api_request("GET", api.PRODUCTS, token=token, params=page_params),
+            items_key="Products",
+            params=params,
+            page_size=page_size,
+        )
+
     @keyword("Update Product")
     def update_product(self, token: str, product_id: str, body: dict) -> ApiResponse:  # type: ignore[type-arg]
         return cast(
@@ -0,0 +1,61 @@
+"""Per-route request metrics collected by ApiClientLibrary."""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class _RouteStat:
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class RouteMetrics:
+    """Thread-safe request counters keyed by route (``GET /api/orders/{order_id}``).
+
+    A request counts as an error when it raised (``status`` 0) or the backend answered 5xx.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, _RouteStat] = {}
+        self._protocols: dict[str, int] = {}
+
+    def record(self, route_key: str, status: int, elapsed: float, protocol: str = "") -> None:
+        with self._lock:
+            if protocol:
+                self._protocols[protocol] = self._protocols.get(protocol, 0) + 1
+            stat = self._routes.setdefault(route_key, _RouteStat())
+            stat.count += 1
+            stat.total_seconds += elapsed
+            stat.max_seconds = max(stat.max_seconds, elapsed)
+            if status == 0 or status >= 500:
+                stat.errors += 1
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return ``{route: {count, errors, avg_ms, max_ms, total_ms}}`` sorted by total time, slowest first."""
+        with self._lock:
+            items = sorted(self._routes.items(), key=lambda kv: kv[1].total_seconds, reverse=True)
+            return {
+                key: {
+                    "count": stat.count,
+                    "errors": stat.errors,
+                    "avg_ms": round(stat.total_seconds / stat.count * 1000, 2),
+                    "max_ms": round(stat.max_seconds * 1000, 2),
+                    "total_ms": round(stat.total_seconds * 1000, 2),
+                }
+                for key, stat in items
+            }
+
+    def protocols(self) -> dict[str, int]:
+        """Return the number of responses received per HTTP version (``HTTP/1.1``, ``HTTP/2``)."""
+        with self._lock:
+            return dict(self._protocols)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self._protocols.clear()
@@ -0,0 +1,180 @@
+"""RF keyword library that builds orders in a requested status over the HTTP API."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+from data.enums.order_status import OrderStatus, order_status_path
+from libraries.api.endpoints.customers_api_library import CustomersApiLibrary
+from libraries.api.endpoints.orders_api_library import OrdersApiLibrary
+from libraries.api.endpoints.products_api_library import ProductsApiLibrary
+from libraries.api.response import ApiResponse
+from libraries.stores.entity_store_library import EntityStoreLibrary
+from libraries.utils.data_generator_library import DataGeneratorLibrary
+
+# Statuses reached after "In Process", which the backend only allows once a delivery is scheduled
+_NEEDS_DELIVERY = {OrderStatus.IN_PROCESS, OrderStatus.PARTIALLY_RECEIVED, OrderStatus.RECEIVED}
+# Orders whose status chains run at the same time in Create Orders In State
+DEFAULT_MAX_WORKERS = 8
+
+
+@library(scope="SUITE")
+class OrderFactoryLibrary:
+    """Order factory: customers, products and orders walked to a status along the shortest path.
+
+    Reuses ``OrdersApiLibrary``, ``CustomersApiLibrary``, ``ProductsApiLibrary`` and
+    ``DataGeneratorLibrary``.  Every created entity is tracked in an ``EntityStore`` — the test-scoped
+    one for ``Create Orders In State`` — so the usual ``Full Delete Entities`` teardown cleans up.
+    Suites must import ``ApiClient`` and ``EntityStore`` under those names (``orders_service.resource``
+    does).  ``OrderPreconditionsLibrary`` and ``OrderPoolLibrary`` build on its building blocks.
+    """
+
+    ENTITY_STORE_LIBRARY_NAME = "EntityStore"
+
+    def __init__(self) -> None:
+        self._orders = OrdersApiLibrary()
+        self._customers = CustomersApiLibrary()
+        self._products = ProductsApiLibrary()
+        self._data = DataGeneratorLibrary()
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Create Orders In State")
+    def create_orders_in_state(
+        self,
+        token: str,
+        state: str = OrderStatus.DRAFT,
+        count: int = 1,
+        num_products: int = 1,
+        delivery: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[dict]:  # type: ignore[type-arg]
+        """Create *count* orders and bring each one into *state* along the shortest status path.
+
+        One customer and ``num_products`` products are created first and shared by all orders.  Each
+        order then runs its own chain (create, schedule delivery if needed, status changes / receives)
+        in a thread pool, so the HTTP round trips of different orders overlap instead of adding up.
+        Every id is tracked in ``EntityStore`` as soon as it exists, so a failing chain still gets
+        cleaned up; the first failure is raised after all chains have finished.
+
+        Args:
+            token: Bearer token used for every request.
+            state: Target status — ``Draft``, ``In Process``, ``Partially Received``, ``Received``
+                or ``Canceled``.
+            count: Number of orders.
+            num_products: Products per order; raised to two for ``Partially Received``.
+            delivery: Schedule a delivery even when the path to *state* does not need one.
+            max_workers: Orders progressing at the same time.
+
+        Returns:
+            The ``Order`` dicts returned by each order's last request, in creation order.
+        """
+        target = OrderStatus(state)
+        count = int(count)
+        num_products = min_products(target, num_products)
+        if count < 1:
+            return []
+        store = self.entity_store()
+        customer_id, product_ids = self.create_customer_and_products(token, num_products, store)
+
+        def chain(_: int) -> dict[str, Any]:
+            return self.create_order_in_state(token, target, customer_id, product_ids, delivery, store)
+
+        workers = max(1, min(int(max_workers), count))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="order-factory") as pool:
+            futures = [pool.submit(chain, index) for index in range(count)]
+        errors = [error for future in futures if (error := future.exception()) is not None]
+        if errors:
+            raise AssertionError(f"{len(errors)} of {count} orders did not reach '{target}': {errors[0]}")
+        orders = [future.result() for future in futures]
+        logger.info(f"Created {count} orders in status '{target}' ({workers} in parallel)")
+        return orders
+
+    # ------------------------------------------------------------------
+    # Building blocks (also used by OrderPreconditionsLibrary and OrderPoolLibrary)
+    # ------------------------------------------------------------------
+
+    def create_customer_and_products(
+        self, token: str, num_products: int, store: EntityStoreLibrary
+    ) -> tuple[str, list[str]]:
+        """Create one customer and *num_products* products (concurrently) and track them in *store*.
+
+        Must run on Robot's thread: it also resolves the orders endpoint's ``ApiClient`` there, so the
+        order chains on worker threads never do the namespace lookup themselves.
+        """
+        self._orders.resolve_client()
+        customer = expect_status(self._customers.create_customer(token, self._data.generate_customer_data()), 201)
+        customer_id: str = customer.body["Customer"]["_id"]
+        store.track_customer(customer_id)
+        product_bodies = [self._data.generate_product_data() for _ in range(num_products)]
+        product_ids: list[str] = []
+        for response in self._products.create_products_concurrently(token, product_bodies):
+            expect_status(response, 201)
+            product_ids.append(response.body["Product"]["_id"])
+            store.track_product(product_ids[-1])
+        return customer_id, product_ids
+
+    def create_order_in_state(
+        self,
+        token: str,
+        target: OrderStatus,
+        customer_id: str,
+        product_ids: list[str],
+        delivery: bool,
+        store: EntityStoreLibrary,
+    ) -> dict[str, Any]:
+        """Create one order and walk it to *target*; safe to run from worker threads."""
+        order_data = self._data.generate_order_data(customer_id, product_ids, len(product_ids))
+        order: dict[str, Any] = expect_status(self._orders.create_order(token, order_data), 201).body["Order"]
+        order_id: str = order["_id"]
+        store.track_order(order_id)
+        if delivery or target in _NEEDS_DELIVERY:
+            order = expect_status(
+                self._orders.add_order_delivery(token, order_id, self._data.generate_delivery_data()), 200
+            ).body["Order"]
+        for status in order_status_path(OrderStatus(order["status"]), target):
+            order = self._transition(token, order, status)
+        return order
+
+    def entity_store(self) -> EntityStoreLibrary:
+        """Return the current test's ``EntityStore``; must run on Robot's thread."""
+        return cast(EntityStoreLibrary, BuiltIn().get_library_instance(self.ENTITY_STORE_LIBRARY_NAME))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _transition(self, token: str, order: dict[str, Any], status: OrderStatus) -> dict[str, Any]:
+        order_id: str = order["_id"]
+        if status in (OrderStatus.PARTIALLY_RECEIVED, OrderStatus.RECEIVED):
+            line_ids = [product["_id"] for product in order["products"] if not product.get("received")]
+            if status is OrderStatus.PARTIALLY_RECEIVED:
+                line_ids = line_ids[:1]
+            response = self._orders.receive_order_products(token, order_id, {"products": line_ids})
+        else:
+            response = self._orders.update_order_status(token, order_id, {"status": status})
+        result: dict[str, Any] = expect_status(response, 200).body["Order"]
+        return result
+
+
+def min_products(target: OrderStatus, num_products: int | str) -> int:
+    """Return *num_products*, raised to the two products ``Partially Received`` needs."""
+    count = int(num_products)
+    return max(count, 2) if target is OrderStatus.PARTIALLY_RECEIVED else count
+
+
+def expect_status(response: ApiResponse, status: int) -> ApiResponse:
+    """Return *response*, or raise ``AssertionError`` when it does not have *status*."""
+    if response.status != status:
+        raise AssertionError(
+            f"{response.method} {response.url} returned {response.status}, expected {status}. "
+            f"Body: {response.body}"
+        )
+    return response
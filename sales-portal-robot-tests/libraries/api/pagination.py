@@ -0,0 +1,130 @@
+"""Page iterator for list endpoints that answer with a ``total`` / ``page`` / ``limit`` envelope."""
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from libraries.api.response import ApiResponse
+
+PageFetcher = Callable[[dict[str, Any]], ApiResponse]
+
+
+class PageIterator:
+    """Walks a paginated list endpoint, prefetching page N+1 while page N is being consumed.
+
+    ``fetch`` receives the query params for one page (``page`` and ``limit`` already set) and returns
+    the ``ApiResponse``.  The next request is submitted to a single background worker as soon as the
+    current page arrives, so network latency overlaps with the caller's work.  Stopping early —
+    ``break`` in a ``for`` loop, ``close()`` or leaving a ``with`` block — cancels the pending prefetch.
+    ``page_size`` must be at least 1.
+    """
+
+    def __init__(
+        self,
+        fetch: PageFetcher,
+        items_key: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+    ) -> None:
+        self._fetch = fetch
+        self._items_key = items_key
+        self._params: dict[str, Any] = dict(params or {})
+        self._page_size = int(page_size)
+        if self._page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {self._page_size}")
+        self._prefetch = prefetch
+        self._pages: Generator[list[dict[str, Any]], None, None] | None = None
+
+    def __enter__(self) -> PageIterator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.items()
+
+    def pages(self) -> Generator[list[dict[str, Any]], None, None]:
+        """Yield the item list of each page in order."""
+        if self._pages is None:
+            self._pages = self._walk()
+        return self._pages
+
+    def items(self) -> Iterator[dict[str, Any]]:
+        """Yield items one by one across all pages."""
+        try:
+            for page_items in self.pages():
+                yield from page_items
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop iterating and cancel any in-flight prefetch."""
+        if self._pages is not None:
+            self._pages.close()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _walk(self) -> Generator[list[dict[str, Any]], None, None]:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch") if self._prefetch else None
+        page = int(self._params.get("page", 1))
+        pending: Future[ApiResponse] | None = self._submit(executor, page)
+        try:
+            while pending is not None:
+                response = pending.result()
+                pending = None
+                if response.status != 200:
+                    raise AssertionError(
+                        f"Fetching page {page} failed with status {response.status}. Body: {response.body}"
+                    )
+                items: list[dict[str, Any]] = response.body.get(self._items_key) or []
+                total = int(response.body.get("total", 0))
+                limit = int(response.body.get("limit") or self._page_size)
+                has_next = bool(items) and page < math.ceil(total / limit)
+                if has_next and executor is not None:
+                    pending = self._submit(executor, page + 1)
+                if not items:
+                    return
+                yield items
+                page += 1
+                if has_next and pending is None:
+                    # Without prefetch the next page is only requested once the caller asks for it
+                    pending = self._submit(executor, page)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, executor: ThreadPoolExecutor | None, page: int) -> Future[ApiResponse]:
+        params = {**self._params, "page": page, "limit": self._page_size}
+        if executor is not None:
+            return executor.submit(self._fetch, params)
+        future: Future[ApiResponse] = Future()
+        future.set_result(self._fetch(params))
+        return future
+
+
+def collect_items(iterator: PageIterator, max_items: int | None = None) -> list[dict[str, Any]]:
+    """Gather items from *iterator*, stopping as soon as *max_items* have been collected."""
+    collected: list[dict[str, Any]] = []
+    with iterator:
+        for item in iterator:
+            collected.append(item)
+            if max_items is not None and len(collected) >= int(max_items):
+                break
+    return collected
+
+
+def find_item(iterator: PageIterator, field: str, value: object) -> dict[str, Any] | None:
+    """Return the first item whose *field* equals *value* (compared as strings), fetching no further pages."""
+    with iterator:
+        for item in iterator:
+            if str(item.get(field)) == str(value):
+                return item
+    return None
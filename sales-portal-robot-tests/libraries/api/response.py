@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import copy
+import json
+from dataclasses import dataclass, field, replace
 
 
 @dataclass
 class ApiResponse:
-    """Lightweight wrapper around an HTTP response returned by ApiClientLibrary."""
+    """Lightweight wrapper around an HTTP response returned by ApiClientLibrary.
+
+    ``method``, ``url`` and ``route`` (the matched path template, e.g. ``/api/orders/{order_id}``)
+    identify the request that produced the response for reporting and failure attribution.
+    ``content`` is the undecoded body, for parsers that work on bytes (``Parse Response As Model``).
+    """
 
     status: int
     body: dict  # type: ignore[type-arg]
     headers: dict[str, str] = field(default_factory=dict)
     text: str = ""
+    method: str = ""
+    url: str = ""
+    route: str = ""
+    content: bytes = field(default=b"", repr=False)
+
+    def copy(self) -> ApiResponse:
+        """Return a copy with its own ``body`` (decoded again from ``text``) and ``headers``."""
+        body = json.loads(self.text) if self.text else copy.deepcopy(self.body)
+        return replace(self, body=body, headers=dict(self.headers))
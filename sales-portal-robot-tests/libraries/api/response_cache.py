@@ -0,0 +1,137 @@
+"""Opt-in LRU + TTL cache for idempotent GET responses, invalidated per resource family."""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from libraries.api.response import ApiResponse
+
+CacheKey = tuple[str, str, tuple[tuple[str, str], ...], str]
+
+# Families whose cached responses embed data owned by another family: orders embed their customer and
+# products, customers expose /customers/{id}/orders, and metrics aggregate everything.
+_DEPENDENT_FAMILIES: dict[str, tuple[str, ...]] = {
+    "products": ("orders", "metrics"),
+    "customers": ("orders", "metrics"),
+    "orders": ("customers", "metrics"),
+}
+# A logout revokes the token, so every response cached for it would now be wrong.
+_FLUSH_ALL_FAMILIES = frozenset({"logout"})
+
+
+@dataclass
+class _Entry:
+    family: str
+    response: ApiResponse
+    expires_at: float
+
+
+def make_cache_key(
+    route: str,
+    path: str,
+    params: dict[str, Any] | None,
+    token: str | None,
+) -> CacheKey:
+    """Build a cache key from the route template, concrete path, query params and token identity.
+
+    The token is reduced to a short digest so raw credentials are never kept in memory as keys.
+    """
+    query = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    token_id = hashlib.sha256(token.encode()).hexdigest()[:16] if token else ""
+    return route, path, query, token_id
+
+
+class ResponseCache:
+    """Thread-safe response cache bounded by entry count (LRU eviction) and age (TTL).
+
+    Hits return a fresh copy of the stored response — the body is re-decoded from the stored text — so
+    a test mutating ``response.body`` cannot corrupt what the next test reads.
+
+    Every invalidation bumps the generation of the families it drops.  A GET takes the generation of
+    its family before it is sent and hands it to :meth:`put`, which skips responses whose family was
+    invalidated while they were in flight: they may predate the write that caused the invalidation.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl = float(ttl)
+        self._max_entries = int(max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._generations: dict[str, int] = {}
+        self._flushes = 0
+        self._stale_puts = 0
+
+    def get(self, key: CacheKey) -> ApiResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            response = entry.response
+        return response.copy()
+
+    def generation(self, family: str) -> tuple[int, int]:
+        """Return a token that changes whenever cached responses of *family* are invalidated."""
+        with self._lock:
+            return self._flushes, self._generations.get(family, 0)
+
+    def put(self, key: CacheKey, family: str, response: ApiResponse, generation: tuple[int, int] | None = None) -> None:
+        """Store *response*, unless *family* was invalidated since *generation* was taken."""
+        with self._lock:
+            if generation is not None and generation != (self._flushes, self._generations.get(family, 0)):
+                self._stale_puts += 1
+                return
+            self._entries[key] = _Entry(family, response, self._clock() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, family: str) -> int:
+        """Drop entries of *family* and of the families whose payloads embed it; return the count dropped."""
+        with self._lock:
+            if family in _FLUSH_ALL_FAMILIES:
+                self._flushes += 1
+                stale = list(self._entries)
+            else:
+                affected = {family, *_DEPENDENT_FAMILIES.get(family, ())}
+                for name in affected:
+                    self._generations[name] = self._generations.get(name, 0) + 1
+                stale = [key for key, entry in self._entries.items() if entry.family in affected]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "stale_puts_skipped": self._stale_puts,
+                "ttl_seconds": self._ttl,
+                "max_entries": self._max_entries,
+            }
@@ -0,0 +1,76 @@
+"""Parse API response bodies into the ``data.models`` Pydantic models in one pass over the raw bytes.
+
+The backend wraps every payload in an envelope — ``{"Order": {...}, "IsSuccess": true, "ErrorMessage": null}``
+or ``{"Orders": [...], ...}``.  For each (model, envelope key, list or not) a ``TypeAdapter`` over the
+``data.models.envelope`` model is built once and cached; ``validate_json`` then decodes and validates
+the response bytes in pydantic-core without an intermediate ``dict``.  Paging fields of list
+responses are skipped; unknown fields inside the payload fail like in the JSON schemas.
+"""
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+import data.models
+from data.models.envelope import envelope_model
+from libraries.api.response import ApiResponse
+
+# Validation errors listed in a failure message; the rest are summarised as a count
+_MAX_REPORTED_ERRORS = 5
+
+
+def resolve_model(model: str | type[BaseModel]) -> type[BaseModel]:
+    """Return the ``data.models`` class named *model* (``Order``, ``Product``, ...); classes pass through."""
+    if isinstance(model, type):
+        return model
+    resolved = getattr(data.models, model, None)
+    if not (isinstance(resolved, type) and issubclass(resolved, BaseModel)):
+        raise ValueError(f"Unknown model '{model}'; expected one of: {', '.join(data.models.__all__)}")
+    return resolved
+
+
+@functools.cache
+def envelope_adapter(model: type[BaseModel], key: str, many: bool) -> TypeAdapter[Any]:
+    """Return the cached adapter for ``{key: model}`` (``{key: [model, ...]}`` when *many*)."""
+    return TypeAdapter(envelope_model(model, key, many))
+
+
+def parse_response(
+    response: ApiResponse, model: str | type[BaseModel], key: str | None = None, many: bool = False
+) -> Any:
+    """Validate the payload under *key* of *response* into *model* instances.
+
+    Args:
+        response: Response whose ``content`` (or, for responses built without it, ``body``) is parsed.
+        model: Model class or its name in ``data.models``.
+        key: Envelope key; defaults to the model name, plus ``s`` when *many*.
+        many: The payload is a list of models.
+
+    Returns:
+        A model instance, or a list of them when *many*.
+
+    Raises:
+        AssertionError: If the payload is missing or does not match the model.
+    """
+    model_cls = resolve_model(model)
+    key = key or (f"{model_cls.__name__}s" if many else model_cls.__name__)
+    adapter = envelope_adapter(model_cls, key, many)
+    try:
+        if response.content:
+            envelope = adapter.validate_json(response.content)
+        else:
+            envelope = adapter.validate_python(response.body)
+    except ValidationError as exc:
+        errors = exc.errors(include_url=False)
+        details = "\n".join(
+            f"  - {'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in errors[:_MAX_REPORTED_ERRORS]
+        )
+        more = f"\n  ... and {len(errors) - _MAX_REPORTED_ERRORS} more" if len(errors) > _MAX_REPORTED_ERRORS else ""
+        expected = f"list[{model_cls.__name__}]" if many else model_cls.__name__
+        raise AssertionError(
+            f"{response.method} {response.url} ({response.status}): '{key}' does not match {expected}:\n{details}{more}"
+        ) from None
+    return envelope.payload
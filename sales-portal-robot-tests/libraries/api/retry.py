@@ -0,0 +1,107 @@
+"""Retry policy for transient API failures — exponential backoff with jitter, plus cost accounting."""
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+# Retried without being asked: repeating them cannot change server state.  PUT and DELETE are left out
+# on purpose — a DELETE retried after a 504 that did delete comes back 404 and fails the test.
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-sending a request.
+
+    ``attempts`` counts the first try; the default ``attempts=1`` disables retries.  The delay before retry *n*
+    is drawn uniformly from ``[0, min(max_backoff, backoff * 2 ** (n - 1))]`` ("full jitter"), which
+    spreads parallel workers that failed together instead of having them retry in lockstep.  A numeric
+    ``Retry-After`` header raises the delay, still capped at ``max_backoff``.
+    """
+
+    attempts: int = 1
+    backoff: float = 0.2
+    max_backoff: float = 5.0
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+    jitter: bool = True
+
+    def allows(self, method: str, force: bool | None = None) -> bool:
+        """Whether requests with *method* may be retried; *force* overrides the safe-method rule."""
+        if self.attempts <= 1 or force is False:
+            return False
+        return bool(force) or method in SAFE_METHODS
+
+    def is_retryable_error(self, error: BaseException) -> bool:
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+    def is_retryable_status(self, status: int) -> bool:
+        return status in self.retry_statuses
+
+    def delay(self, retry_number: int, headers: Mapping[str, str] | None = None) -> float:
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (retry_number - 1))
+        delay = random.uniform(0, ceiling) if self.jitter else ceiling
+        retry_after = (headers or {}).get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        return min(delay, self.max_backoff)
+
+
+class RetryStats:
+    """Thread-safe per-route record of retries and of the time they cost (failed attempts + backoff)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, dict[str, Any]] = {}
+
+    def record_retry(self, route_key: str, reason: str, cost: float) -> None:
+        with self._lock:
+            entry = self._entry(route_key)
+            entry["retries"] += 1
+            entry["cost_s"] += cost
+            entry["reasons"][reason] = entry["reasons"].get(reason, 0) + 1
+
+    def record_outcome(self, route_key: str, recovered: bool) -> None:
+        with self._lock:
+            self._entry(route_key)["recovered" if recovered else "exhausted"] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return totals plus a per-route breakdown, costliest route first."""
+        with self._lock:
+            routes = {
+                key: {
+                    "retries": entry["retries"],
+                    "recovered": entry["recovered"],
+                    "exhausted": entry["exhausted"],
+                    "cost_ms": round(entry["cost_s"] * 1000, 2),
+                    "reasons": dict(entry["reasons"]),
+                }
+                for key, entry in sorted(self._routes.items(), key=lambda item: -item[1]["cost_s"])
+            }
+        return {
+            "retries": sum(route["retries"] for route in routes.values()),
+            "recovered": sum(route["recovered"] for route in routes.values()),
+            "exhausted": sum(route["exhausted"] for route in routes.values()),
+            "cost_ms": round(sum(route["cost_ms"] for route in routes.values()), 2),
+            "routes": routes,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def _entry(self, route_key: str) -> dict[str, Any]:
+        entry = self._routes.get(route_key)
+        if entry is None:
+            entry = self._routes[route_key] = {
+                "retries": 0,
+                "recovered": 0,
+                "exhausted": 0,
+                "cost_s": 0.0,
+                "reasons": {},
+            }
+        return entry
@@ -0,0 +1,74 @@
+"""Single-flight request coalescing — concurrent identical calls share one execution and its result."""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[K, T]):
+    """Runs at most one call per key at a time; callers arriving while it is in flight wait for it.
+
+    Waiting callers receive the very same result object as the caller that executed the call, or the
+    same exception; callers that may change a mutable result must copy it.  Nothing is remembered once
+    the call completes — this is coalescing, not caching.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, _Call[T]] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: K, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Return ``(result, shared)`` where *shared* is true if the result came from another caller's call."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self._executed + self._coalesced,
+                "executed": self._executed,
+                "saved": self._coalesced,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._executed = 0
+            self._coalesced = 0
@@ -0,0 +1,178 @@
+"""Client-side API throttling — token-bucket rate limiting plus AIMD adaptive concurrency."""
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+# Responses that mean "the backend is overloaded": transport failures (status 0), 429 and 5xx.
+_OVERLOAD_STATUS_FLOOR = 500
+_TOO_MANY_REQUESTS = 429
+
+
+def is_overload(status: int) -> bool:
+    return status == 0 or status == _TOO_MANY_REQUESTS or status >= _OVERLOAD_STATUS_FLOOR
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, at most ``burst`` saved up.
+
+    Tokens are reserved under the lock and the caller sleeps outside it, so waiters are served in
+    arrival order and never hold the lock while sleeping.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return the seconds waited."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit driven by observed latency and overload responses.
+
+    Each healthy response adds ``1 / limit`` (≈ +1 per round of requests).  An overload response or a
+    short-term latency average above ``latency_tolerance`` times the long-term average multiplies the limit
+    by ``backoff``.  Decreases are at most one per ``cooldown`` seconds so a single burst of slow
+    responses does not collapse the limit to the floor.
+    """
+
+    _SHORT_ALPHA = 0.2
+    _LONG_ALPHA = 0.02
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self._limit = float(min(max(int(initial), self.min_limit), self.max_limit))
+        self._latency_tolerance = float(latency_tolerance)
+        self._backoff = float(backoff)
+        self._cooldown = float(cooldown)
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._short_latency: float | None = None
+        self._long_latency: float | None = None
+        self._last_decrease = float("-inf")
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> float:
+        """Block until a slot is free; return the seconds waited."""
+        waited = 0.0
+        with self._cond:
+            if self._in_flight >= int(self._limit):
+                start = time.perf_counter()
+                while self._in_flight >= int(self._limit):
+                    self._cond.wait()
+                waited = time.perf_counter() - start
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        return waited
+
+    def release(self, status: int, elapsed: float) -> None:
+        """Free the slot and adjust the limit from the request outcome."""
+        with self._cond:
+            self._in_flight -= 1
+            if is_overload(status):
+                self._decrease()
+            else:
+                short = self._ewma(self._short_latency, elapsed, self._SHORT_ALPHA)
+                long = self._ewma(self._long_latency, elapsed, self._LONG_ALPHA)
+                self._short_latency, self._long_latency = short, long
+                if short > long * self._latency_tolerance:
+                    self._decrease()
+                else:
+                    self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "concurrency_limit": int(self._limit),
+                "peak_in_flight": self._peak_in_flight,
+                "limit_decreases": self._decreases,
+            }
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self._backoff)
+        self._decreases += 1
+
+    @staticmethod
+    def _ewma(current: float | None, sample: float, alpha: float) -> float:
+        return sample if current is None else current + alpha * (sample - current)
+
+
+class ApiThrottle:
+    """Combines an optional :class:`TokenBucket` and an optional :class:`AdaptiveConcurrencyLimiter`."""
+
+    def __init__(self, bucket: TokenBucket | None, limiter: AdaptiveConcurrencyLimiter | None) -> None:
+        self._bucket = bucket
+        self._limiter = limiter
+        self._lock = threading.Lock()
+        self._waited = 0.0
+        self._throttled = 0
+
+    def acquire(self) -> None:
+        waited = self._bucket.acquire() if self._bucket is not None else 0.0
+        if self._limiter is not None:
+            waited += self._limiter.acquire()
+        if waited:
+            with self._lock:
+                self._waited += waited
+                self._throttled += 1
+
+    def release(self, status: int, elapsed: float) -> None:
+        if self._limiter is not None:
+            self._limiter.release(status, elapsed)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = {
+                "rate_limit": self._bucket.rate if self._bucket is not None else None,
+                "throttled_requests": self._throttled,
+                "throttled_ms": round(self._waited * 1000, 2),
+            }
+        if self._limiter is not None:
+            stats.update(self._limiter.stats())
+        return stats
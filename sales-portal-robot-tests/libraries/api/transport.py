@@ -0,0 +1,112 @@
+"""HTTP transports for ApiClientLibrary — requests (HTTP/1.1, pooled) and httpx (HTTP/2, optional)."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass(frozen=True)
+class RawResponse:
+    """Transport-neutral view of an HTTP response; ``headers`` is case-insensitive, ``content`` the raw body."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    text: str
+    http_version: str
+    content: bytes = b""
+
+
+class Transport(Protocol):
+    name: str
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        json: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+    ) -> RawResponse: ...
+
+    def close(self) -> None: ...
+
+
+class RequestsTransport:
+    """HTTP/1.1 over a ``requests.Session`` with a keep-alive pool of up to ``pool_maxsize`` connections per host."""
+
+    name = "requests"
+
+    def __init__(self, pool_maxsize: int = 10) -> None:
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=int(pool_maxsize))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        json: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+    ) -> RawResponse:
+        resp = self._session.request(method=method, url=url, headers=headers, json=json, params=params, timeout=timeout)
+        version = getattr(resp.raw, "version", 11)
+        http_version = "HTTP/2" if version == 20 else "HTTP/1.1"
+        return RawResponse(resp.status_code, resp.headers, resp.text, http_version, resp.content)
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class Http2Transport:
+    """HTTP/2 over one multiplexed ``httpx.Client`` connection per host; needs the ``http2`` extra.
+
+    Over TLS the protocol is negotiated via ALPN and servers without h2 transparently get HTTP/1.1.
+    Plain ``http://`` URLs only use HTTP/2 with ``prior_knowledge=True`` (h2c), which the server must
+    support.  httpx errors are re-raised as their ``requests`` counterparts so retry handling is
+    transport-agnostic, and header names — lower-case on the wire in HTTP/2 — are title-cased so
+    ``response.headers["Authorization"]`` keeps working.
+    """
+
+    name = "httpx-h2"
+
+    def __init__(self, prior_knowledge: bool = False, max_connections: int = 10) -> None:
+        import h2  # noqa: F401  — fail fast with ImportError when the extra is missing
+        import httpx
+
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http1=not prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(max_connections=int(max_connections)),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        json: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+    ) -> RawResponse:
+        httpx = self._httpx
+        try:
+            resp = self._client.request(method, url, headers=headers, json=json, params=params, timeout=timeout)
+        except httpx.TimeoutException as exc:
+            raise requests.Timeout(str(exc)) from exc
+        except httpx.TransportError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        response_headers = CaseInsensitiveDict({name.title(): value for name, value in resp.headers.items()})
+        return RawResponse(resp.status_code, response_headers, resp.text, resp.http_version, resp.content)
+
+    def close(self) -> None:
+        self._client.close()
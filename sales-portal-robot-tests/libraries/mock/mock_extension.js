@@ -1,4 +1,6 @@
 "use strict";
+const fs = require("fs");
+
 /**
  * Browser Library JS extension for network response mocking via Playwright route interception.
  *
@@ -41,10 +43,15 @@ routeMockResponse.rfdoc =
  * @param {string} body - JSON-serialized response body string
  * @param {number|string} status - HTTP status code
  * @param {string} contentType - value for the Content-Type response header
+ * @param {string} [method] - only fulfil requests with this HTTP method; others fall through
  */
-async function routeMockResponseRegex(page, regexStr, body, status, contentType) {
+async function routeMockResponseRegex(page, regexStr, body, status, contentType, method) {
   const pattern = new RegExp(regexStr);
   await page.route(pattern, async (route) => {
+    if (method && route.request().method() !== method.toUpperCase()) {
+      await route.fallback();
+      return;
+    }
     await route.fulfill({
       status: Number(status),
       contentType: contentType || "application/json",
@@ -65,4 +72,103 @@ async function unrouteAll(page) {
 }
 unrouteAll.rfdoc = "Remove all active route handlers from the current Playwright page.";
 
-module.exports = { routeMockResponse, routeMockResponseRegex, unrouteAll };
+// Every backend call the frontend makes goes through /api/ (on the API origin).
+const API_URL = /\/api\//;
+// ObjectIds, UUIDs and epoch timestamps — values that differ between a recording and its replay
+const VOLATILE_VALUE =
+  /^([0-9a-f]{24}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d{10,13})$/i;
+
+/**
+ * Reduce a request to a replay key that survives volatile ids and query params:
+ * `GET /api/orders/{order_id}?page=1&status=Draft`.
+ *
+ * @param {string} method - HTTP method
+ * @param {string} url - absolute request URL
+ * @param {Array<[string, string]>} routes - [regex source, path template] pairs, static routes first
+ * @param {string[]} ignoredParams - query params left out of the key (cache busters, timestamps)
+ */
+function normalizeApiRequest(method, url, routes, ignoredParams) {
+  const parsed = new URL(url);
+  const route = routes.find(([pattern]) => new RegExp("^" + pattern).test(parsed.pathname));
+  const path = route
+    ? route[1]
+    : parsed.pathname
+        .replace(/\/$/, "")
+        .split("/")
+        .map((segment) => (VOLATILE_VALUE.test(segment) ? "{id}" : segment))
+        .join("/");
+  const query = [...parsed.searchParams]
+    .filter(([name]) => !ignoredParams.includes(name))
+    .map(([name, value]) => `${name}=${VOLATILE_VALUE.test(value) ? "{id}" : value}`)
+    .sort();
+  return `${method.toUpperCase()} ${path}${query.length ? "?" + query.join("&") : ""}`;
+}
+
+/**
+ * Record every /api/ request of the current context into `harPath` through Playwright's HAR
+ * routing.  Requests still reach the backend; the HAR is written when the context is closed.
+ * Routes registered later (mock keywords) take precedence and are not recorded.
+ *
+ * @param {import('playwright').Page} page - injected by Browser Library
+ * @param {string} harPath - HAR file to write
+ */
+async function recordApiHar(page, harPath) {
+  await page.routeFromHAR(harPath, {
+    url: API_URL,
+    update: true,
+    updateContent: "embed",
+    updateMode: "minimal",
+  });
+}
+recordApiHar.rfdoc = "Record all /api/ traffic of the current context to a HAR file, written on context close.";
+
+/**
+ * Serve every /api/ request from the HAR recorded by `recordApiHar`.  Playwright's HAR router
+ * answers exact URL matches; requests whose URL changed since the recording (new ids, reordered
+ * or volatile query params) fall back to a normalized match, served in recorded order with the
+ * last response repeating.  Requests matching neither are aborted, or passed to the network when
+ * `notFound` is "fallback".
+ *
+ * @param {import('playwright').Page} page - injected by Browser Library
+ * @param {string} harPath - HAR file to replay
+ * @param {Array<[string, string]>} routes - [regex source, path template] pairs, static routes first
+ * @param {string[]} ignoredParams - query params ignored when matching
+ * @param {string} notFound - "abort" or "fallback"
+ * @param {Function} logger - injected by Browser Library
+ */
+async function replayApiHar(page, harPath, routes, ignoredParams, notFound, logger) {
+  const har = JSON.parse(fs.readFileSync(harPath, "utf8"));
+  const recorded = new Map();
+  for (const entry of har.log.entries) {
+    const key = normalizeApiRequest(entry.request.method, entry.request.url, routes, ignoredParams);
+    if (!recorded.has(key)) recorded.set(key, []);
+    recorded.get(key).push(entry.response);
+  }
+  await page.route(API_URL, async (route) => {
+    const request = route.request();
+    const key = normalizeApiRequest(request.method(), request.url(), routes, ignoredParams);
+    const responses = recorded.get(key);
+    if (!responses) {
+      logger(`No recorded response for ${key}`);
+      await (notFound === "fallback" ? route.fallback() : route.abort("connectionrefused"));
+      return;
+    }
+    const response = responses.length > 1 ? responses.shift() : responses[0];
+    const content = response.content || {};
+    await route.fulfill({
+      status: response.status,
+      headers: Object.fromEntries(
+        response.headers
+          .filter(({ name }) => !/^(content-length|content-encoding|transfer-encoding)$/i.test(name))
+          .map(({ name, value }) => [name, value]),
+      ),
+      body: Buffer.from(content.text || "", content.encoding === "base64" ? "base64" : "utf8"),
+    });
+  });
+  // Registered last, so Playwright's exact HAR match is tried before the normalized one
+  await page.routeFromHAR(harPath, { url: API_URL, notFound: "fallback" });
+  return har.log.entries.length;
+}
+replayApiHar.rfdoc = "Serve all /api/ traffic from a recorded HAR file, matching volatile URLs by normalized key.";
+
+module.exports = { routeMockResponse, routeMockResponseRegex, unrouteAll, recordApiHar, replayApiHar };
@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import cast
 
 from Browser import Browser
+from robot.api import logger
 from robot.api.deco import keyword, library
 from robot.libraries.BuiltIn import BuiltIn
 
+from libraries.api.routes import ROUTES
+from variables.env import API_HAR_DIR, API_HAR_MODE
+
 _EXTENSION_JS = Path(__file__).parent / "mock_extension.js"
+_HAR_MODES = ("off", "record", "replay", "auto")
+# Query params that never select different data (cache busters) — left out of replay matching
+_HAR_IGNORED_PARAMS = ["_", "t", "timestamp"]
+_UNSAFE_CHARS = re.compile(r"[^\w.-]+")
 
 
 @library(scope="TEST")
@@ -46,7 +55,13 @@ class MockLibrary:
             contentType="application/json",
         )
 
-    def _route_regex(self, regex_str: str, body: str, status: int = 200) -> None:
+    def _default_har_path(self) -> Path:
+        variables = BuiltIn()
+        suite = _UNSAFE_CHARS.sub("_", variables.get_variable_value("${SUITE NAME}"))
+        test = _UNSAFE_CHARS.sub("_", variables.get_variable_value("${TEST NAME}"))
+        return Path(API_HAR_DIR) / suite / f"{test}.har"
+
+    def _route_regex(self, regex_str: str, body: str, status: int = 200, method: str = "") -> None:
         self._ensure_extension()
         self._browser().call_js_keyword(
             "routeMockResponseRegex",
@@ -54,6 +69,7 @@ class MockLibrary:
             body=body,
             status=status,
             contentType="application/json",
+            method=method,
         )
 
     # ------------------------------------------------------------------
@@ -127,8 +143,101 @@ class MockLibrary:
         """
         self._route(url=f"**/api/orders/{order_id}/", body=json.dumps(body), status=status)
 
+    @keyword("Mock Route Response")
+    def mock_route_response(
+        self,
+        route: str,
+        body: dict[str, object],
+        status: int = 200,
+        **path_params: str,
+    ) -> None:
+        """Intercepts the endpoint registered as *route* in ``libraries/api/routes.py``.
+
+        Only requests with the route's HTTP method are fulfilled.  Path parameters left out match
+        any value, e.g. ``Mock Route Response    orders.get    ${body}`` mocks every order while
+        ``... orders.get    ${body}    order_id=${id}`` mocks one.
+        """
+        api_route = ROUTES.get(route)
+        self._route_regex(api_route.url_pattern(**path_params), json.dumps(body), int(status), api_route.method)
+
+    # ------------------------------------------------------------------
+    # HAR record / replay keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Record API To HAR")
+    def record_api_to_har(self, path: str) -> None:
+        """Records every ``/api/`` request of the current context into the HAR file *path*.
+
+        Requests still reach the backend; Playwright writes the HAR when the context is closed.
+        Mocks registered afterwards take precedence and are left out of the recording.
+        """
+        har_path = Path(path)
+        har_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_extension()
+        self._browser().call_js_keyword("recordApiHar", harPath=str(har_path.resolve()))
+
+    @keyword("Replay API From HAR")
+    def replay_api_from_har(self, path: str, not_found: str = "abort") -> int:
+        """Serves every ``/api/`` request of the current page from the HAR file *path*.
+
+        Exact URL matches go through Playwright's HAR router.  Other requests are matched on a
+        normalized key — path parameters reduced to their ``libraries/api/routes.py`` template,
+        ObjectIds / UUIDs / timestamps to ``{id}``, query params sorted and cache busters dropped —
+        so entity ids that differ from the recording still replay.  Unmatched requests are aborted,
+        or sent to the network with ``not_found=fallback``.
+
+        Returns:
+            The number of recorded entries.
+        """
+        if not_found not in ("abort", "fallback"):
+            raise ValueError(f"not_found must be 'abort' or 'fallback', got '{not_found}'")
+        har_path = Path(path)
+        if not har_path.is_file():
+            raise AssertionError(f"HAR file not found: {har_path} (record it with API_HAR_MODE=record)")
+        self._ensure_extension()
+        entries = self._browser().call_js_keyword(
+            "replayApiHar",
+            harPath=str(har_path.resolve()),
+            routes=_har_routes(),
+            ignoredParams=_HAR_IGNORED_PARAMS,
+            notFound=not_found,
+        )
+        return int(entries)
+
+    @keyword("Use API HAR")
+    def use_api_har(self, path: str | None = None, mode: str = API_HAR_MODE) -> str:
+        """Records or replays the current test's API traffic depending on *mode* (``API_HAR_MODE``).
+
+        ``record`` always records, ``replay`` requires an existing HAR, ``auto`` replays when the HAR
+        exists and records it otherwise, ``off`` does nothing.  *path* defaults to
+        ``${API_HAR_DIR}/<suite>/<test>.har``.
+
+        Returns:
+            The mode actually applied: ``record``, ``replay`` or ``off``.
+        """
+        mode = mode.lower()
+        if mode not in _HAR_MODES:
+            raise ValueError(f"API HAR mode must be one of {', '.join(_HAR_MODES)}, got '{mode}'")
+        if mode == "off":
+            return mode
+        har_path = Path(path) if path else self._default_har_path()
+        if mode == "auto":
+            mode = "replay" if har_path.is_file() else "record"
+        if mode == "record":
+            self.record_api_to_har(str(har_path))
+        else:
+            self.replay_api_from_har(str(har_path))
+        logger.info(f"API traffic {mode}: {har_path}")
+        return mode
+
     @keyword("Clear All Mocks")
     def clear_all_mocks(self) -> None:
         """Removes all active Playwright route handlers from the current page."""
         self._ensure_extension()
         self._browser().call_js_keyword("unrouteAll")
+
+
+def _har_routes() -> list[list[str]]:
+    """[regex source, template] pairs for replay matching; static routes first so ``/products/all`` wins."""
+    templates = {route.template: route.url_pattern() for route in ROUTES}
+    return [[pattern, template] for template, pattern in sorted(templates.items(), key=lambda i: i[0].count("{"))]
@@ -0,0 +1,143 @@
+"""RF keyword library serving canned API responses from a local HTTP server, for offline ApiClient tests."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from robot.api.deco import keyword, library
+
+_DEFAULT_BODY = {"IsSuccess": True, "ErrorMessage": None}
+
+
+@dataclass(frozen=True)
+class _Canned:
+    status: int
+    body: Any
+    delay: float
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@library(scope="SUITE")
+class StubApiServerLibrary:
+    """A ``ThreadingHTTPServer`` on ``127.0.0.1`` that answers every path with queued responses.
+
+    Responses are queued per HTTP method and handed out in order; a method with nothing queued gets
+    ``200 {"IsSuccess": true, "ErrorMessage": null}``.  Every request is recorded with its arrival
+    time, so tests can count round trips and measure the gaps between them (retries, backoff,
+    coalescing, throttling) without the portal backend.
+    """
+
+    def __init__(self) -> None:
+        self._server: ThreadingHTTPServer | None = None
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[_Canned]] = {}
+        self._requests: list[dict[str, Any]] = []
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Start Stub API Server")
+    def start_stub_api_server(self) -> str:
+        """Start the server on a free port and return its base URL, e.g. ``http://127.0.0.1:50123``."""
+        if self._server is None:
+            self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+            self._server.daemon_threads = True
+            threading.Thread(target=self._server.serve_forever, name="stub-api-server", daemon=True).start()
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @keyword("Stop Stub API Server")
+    def stop_stub_api_server(self) -> None:
+        """Shut the server down; requests still being answered are finished first."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @keyword("Queue Stub Response")
+    def queue_stub_response(
+        self,
+        method: str = "GET",
+        status: int = 200,
+        body: Any = None,
+        delay: float = 0.0,
+        headers: dict[str, str] | None = None,
+        times: int = 1,
+    ) -> None:
+        """Answer the next *times* requests with *method* with this response.
+
+        Args:
+            method: HTTP method the response is for.
+            status: Status code.
+            body: JSON body; defaults to a successful envelope.
+            delay: Seconds to wait before answering.
+            headers: Extra response headers, e.g. ``Retry-After``.
+            times: How many requests get this response.
+        """
+        canned = _Canned(int(status), _DEFAULT_BODY if body is None else body, float(delay), dict(headers or {}))
+        with self._lock:
+            self._queues.setdefault(method.upper(), deque()).extend([canned] * int(times))
+
+    @keyword("Get Stub Requests")
+    def get_stub_requests(self, method: str | None = None) -> list[dict[str, Any]]:
+        """Return the requests received so far (``method``, ``path``, ``body``, ``at``), oldest first.
+
+        ``at`` is the arrival time in seconds on the monotonic clock.  With *method* only requests
+        with that method are returned.
+        """
+        with self._lock:
+            return [dict(r) for r in self._requests if method is None or r["method"] == method.upper()]
+
+    @keyword("Reset Stub API Server")
+    def reset_stub_api_server(self) -> None:
+        """Forget queued responses and recorded requests."""
+        with self._lock:
+            self._queues.clear()
+            self._requests.clear()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _answer(self, method: str, path: str, raw_body: bytes) -> _Canned:
+        with self._lock:
+            self._requests.append(
+                {
+                    "method": method,
+                    "path": path,
+                    "body": json.loads(raw_body) if raw_body else None,
+                    "at": time.monotonic(),
+                }
+            )
+            queue = self._queues.get(method)
+            return queue.popleft() if queue else _Canned(200, _DEFAULT_BODY, 0.0)
+
+
+def _handler_for(stub: StubApiServerLibrary) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        def _respond(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            canned = stub._answer(self.command, self.path, self.rfile.read(length) if length else b"")
+            if canned.delay:
+                time.sleep(canned.delay)
+            payload = json.dumps(canned.body).encode()
+            self.send_response(canned.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in canned.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = _respond
+
+        def log_message(self, format: str, *args: Any) -> None:
+            """Keep the server quiet; requests are recorded by the library instead."""
+
+    return _Handler
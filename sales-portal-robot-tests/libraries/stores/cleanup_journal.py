@@ -0,0 +1,126 @@
+"""Append-only on-disk journal of tracked entity ids, so data created by a killed worker can be swept later.
+
+Every worker process appends to its own ``<host>-<pid>.jsonl`` file: one ``add`` line per tracked id and
+one ``remove`` line when the entity store is cleared after teardown.  Lines are flushed as they are
+written, so a journal survives the process being killed.  A process that exits with nothing left to
+clean deletes its journal; whatever remains on disk belongs to a run that never reached its teardown.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import socket
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO
+
+# Deletion order: orders reference customers and products, and customers with orders cannot be deleted
+JOURNAL_KINDS = ("orders", "products", "customers")
+
+
+class CleanupJournal:
+    """The current process's journal file; safe to share between threads."""
+
+    def __init__(self, directory: Path) -> None:
+        self.path = directory / f"{socket.gethostname()}-{os.getpid()}.jsonl"
+        self._directory = directory
+        self._file: IO[str] | None = None
+        self._pending: dict[str, set[str]] = {kind: set() for kind in JOURNAL_KINDS}
+        self._lock = threading.Lock()
+
+    def added(self, kind: str, entity_id: str) -> None:
+        """Journal a newly tracked id."""
+        with self._lock:
+            self._pending[kind].add(entity_id)
+            self._write({"op": "add", "kind": kind, "id": entity_id})
+
+    def removed(self, ids: dict[str, Iterable[str]]) -> None:
+        """Journal ids whose cleanup has run, keyed by kind."""
+        entries = {kind: sorted(values) for kind, values in ids.items() if values}
+        if not entries:
+            return
+        with self._lock:
+            for kind, values in entries.items():
+                self._pending[kind].difference_update(values)
+            self._write({"op": "remove", **entries})
+
+    def close(self) -> None:
+        """Close the file and delete it when nothing is left to clean up."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            if not any(self._pending.values()):
+                self.path.unlink(missing_ok=True)
+
+    def _write(self, entry: dict[str, object]) -> None:
+        if self._file is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+
+def read_journal(path: Path) -> dict[str, list[str]]:
+    """Return the ids a journal still holds (added and never removed), keyed by kind in deletion order.
+
+    A line torn by a kill mid-write is skipped.
+    """
+    pending: dict[str, dict[str, None]] = {kind: {} for kind in JOURNAL_KINDS}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if entry.get("op") == "add":
+            pending[entry["kind"]][entry["id"]] = None
+        elif entry.get("op") == "remove":
+            for kind in JOURNAL_KINDS:
+                for entity_id in entry.get(kind, []):
+                    pending[kind].pop(entity_id, None)
+    return {kind: list(ids) for kind, ids in pending.items()}
+
+
+def orphaned_journals(directory: Path, include_live: bool = False) -> list[Path]:
+    """Return the journals in *directory* whose writer is gone.
+
+    A journal counts as orphaned when it was written on this host by a process that no longer runs.
+    Journals from other hosts, and with *include_live* also those of running processes, are returned
+    as well — use that only when no test run is in progress.
+    """
+    if not directory.is_dir():
+        return []
+    host = socket.gethostname()
+    orphans = []
+    for path in sorted(directory.glob("*.jsonl")):
+        journal_host, _, pid = path.stem.rpartition("-")
+        if include_live or journal_host != host or not pid.isdigit() or not _is_running(int(pid)):
+            orphans.append(path)
+    return orphans
+
+
+_journals: dict[Path, CleanupJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def process_journal(directory: Path) -> CleanupJournal:
+    """Return this process's journal in *directory*, closed automatically at interpreter exit."""
+    with _journals_lock:
+        journal = _journals.get(directory)
+        if journal is None:
+            journal = _journals[directory] = CleanupJournal(directory)
+            atexit.register(journal.close)
+        return journal
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -0,0 +1,140 @@
+"""RF keyword library that isolates suites by snapshotting the portal's Mongo collections and restoring them."""
+from __future__ import annotations
+
+import time
+import uuid
+from typing import Any
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+from libraries.stores.mongo import connect_database
+from variables.env import DB_ISOLATION, MONGO_DB, MONGO_URI
+
+# Collections the tests write to through the API; users, roles and login tokens are left alone
+SNAPSHOT_COLLECTIONS = ("orders", "products", "customers", "notifications")
+SNAPSHOT_SUFFIX = "__snapshot_"
+
+
+@library(scope="SUITE")
+class DbSnapshotLibrary:
+    """Suite-level database isolation: copy the collections before a suite, put the copies back after it.
+
+    With ``DB_ISOLATION=snapshot`` every suite that imports this library (through
+    ``orders_service.resource``) gets a server-side ``$out`` copy of ``SNAPSHOT_COLLECTIONS`` before
+    its suite setup runs.  After its suite teardown the copies replace the collections with another
+    ``$out`` (which keeps the existing indexes) and are dropped, so whatever the suite created,
+    changed or leaked is gone in one bulk operation per collection.  ``Full Delete Entities`` then
+    skips its per-entity API deletes.
+
+    Restoring replaces whole collections, so snapshot isolation is for serial runs only: under pabot
+    (``${PABOTQUEUEINDEX}`` set) workers would roll back each other's data, so the library warns and
+    falls back to teardown isolation.  With ``DB_ISOLATION=teardown`` (the default) the library does
+    nothing.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(
+        self,
+        enabled: bool = DB_ISOLATION == "snapshot",
+        uri: str = MONGO_URI,
+        database: str = MONGO_DB,
+        collections: tuple[str, ...] = SNAPSHOT_COLLECTIONS,
+    ) -> None:
+        self._enabled = enabled
+        self._uri = uri
+        self._database_name = database
+        self._collections = tuple(collections)
+        self._database: Any = None
+        # collection name -> snapshot collection name, while a snapshot is held
+        self._snapshots: dict[str, str] = {}
+        self.ROBOT_LIBRARY_LISTENER = self
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Suite Is Snapshot Isolated")
+    def suite_is_snapshot_isolated(self) -> bool:
+        """Return ``True`` when the current suite's data is rolled back by a snapshot restore."""
+        return bool(self._snapshots)
+
+    @keyword("Snapshot Collections")
+    def snapshot_collections(self) -> float:
+        """Copy the isolated collections into snapshot collections; a held snapshot is kept as is.
+
+        Returns:
+            Seconds spent copying.
+        """
+        if self._snapshots:
+            return 0.0
+        start = time.perf_counter()
+        token = uuid.uuid4().hex[:8]
+        database = self._db()
+        existing = set(database.list_collection_names())
+        for name in self._collections:
+            snapshot = f"{name}{SNAPSHOT_SUFFIX}{token}"
+            if name in existing:
+                database[name].aggregate([{"$out": snapshot}])
+            self._snapshots[name] = snapshot
+        elapsed = time.perf_counter() - start
+        logger.info(f"Snapshot of {', '.join(self._collections)} taken in {elapsed * 1000:.0f}ms")
+        return elapsed
+
+    @keyword("Restore Collections")
+    def restore_collections(self) -> float:
+        """Replace the isolated collections with their snapshot copies and drop the copies.
+
+        Returns:
+            Seconds spent restoring.
+        """
+        if not self._snapshots:
+            return 0.0
+        start = time.perf_counter()
+        database = self._db()
+        existing = set(database.list_collection_names())
+        for name, snapshot in self._snapshots.items():
+            if snapshot in existing:
+                database[snapshot].aggregate([{"$out": name}])
+                database.drop_collection(snapshot)
+            else:
+                # The collection did not exist when the snapshot was taken
+                database[name].delete_many({})
+        self._snapshots = {}
+        elapsed = time.perf_counter() - start
+        logger.info(f"Restored {', '.join(self._collections)} in {elapsed * 1000:.0f}ms")
+        return elapsed
+
+    # ------------------------------------------------------------------
+    # Library listener (API v3)
+    # ------------------------------------------------------------------
+
+    def start_suite(self, data: Any, result: Any) -> None:
+        if self._enabled and data.tests and not self._under_pabot():
+            self.snapshot_collections()
+
+    def end_suite(self, data: Any, result: Any) -> None:
+        if self._snapshots:
+            self.restore_collections()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _under_pabot(self) -> bool:
+        pabot_index = BuiltIn().get_variable_value("${PABOTQUEUEINDEX}")
+        if pabot_index is None:
+            return False
+        logger.warn(
+            f"DB_ISOLATION=snapshot is not safe under pabot (worker {pabot_index}): restores would roll back "
+            "other workers' collections. Falling back to teardown isolation."
+        )
+        self._enabled = False
+        return True
+
+    def _db(self) -> Any:
+        if self._database is None:
+            self._database = connect_database(self._uri, self._database_name)
+        return self._database
@@ -1,29 +1,48 @@
 """RF keyword library for tracking entity IDs during test execution."""
 from __future__ import annotations
 
+from pathlib import Path
+
+from robot.api import logger
 from robot.api.deco import keyword, library
 
+from libraries.stores.cleanup_journal import CleanupJournal, process_journal
+from variables.env import CLEANUP_JOURNAL_DIR
+
+# 404: already deleted by someone else — the id is gone either way
+_GONE_STATUSES = frozenset({404})
+
 
 @library(scope="TEST")
 class EntityStoreLibrary:
-    """Per-test entity ID store for deterministic cleanup in teardown."""
+    """Per-test entity ID store for deterministic cleanup in teardown.
 
-    def __init__(self) -> None:
+    Tracked IDs are also appended to the worker's cleanup journal in ``CLEANUP_JOURNAL_DIR`` (empty
+    disables it), so entities of a test that never reached its teardown can be deleted later with
+    ``scripts/sweep_orphans.py``.  Only deletes confirmed with ``Record Deletion`` are journaled as
+    removed; an id whose DELETE failed stays in the journal for the sweeper.
+    """
+
+    def __init__(self, journal_dir: str = CLEANUP_JOURNAL_DIR) -> None:
         self._products: set[str] = set()
         self._customers: set[str] = set()
         self._orders: set[str] = set()
+        self._journal: CleanupJournal | None = process_journal(Path(journal_dir)) if journal_dir else None
 
     @keyword("Track Product")
     def track_product(self, product_id: str) -> None:
         self._products.add(product_id)
+        self._journal_added("products", product_id)
 
     @keyword("Track Customer")
     def track_customer(self, customer_id: str) -> None:
         self._customers.add(customer_id)
+        self._journal_added("customers", customer_id)
 
     @keyword("Track Order")
     def track_order(self, order_id: str) -> None:
         self._orders.add(order_id)
+        self._journal_added("orders", order_id)
 
     @keyword("Get Tracked Products")
     def get_tracked_products(self) -> list[str]:
@@ -37,8 +56,50 @@ class EntityStoreLibrary:
     def get_tracked_orders(self) -> list[str]:
         return list(self._orders)
 
+    @keyword("Record Deletion")
+    def record_deletion(self, kind: str, entity_id: str, status: int) -> bool:
+        """Untrack *entity_id* and journal its removal when its DELETE returned *status* 2xx or 404.
+
+        Any other status keeps the id tracked, and in the journal once the store is cleared.
+
+        Args:
+            kind: ``orders``, ``products`` or ``customers``.
+            entity_id: The deleted entity's id.
+            status: Status code of the DELETE response.
+
+        Returns:
+            ``True`` when the entity is gone.
+        """
+        tracked = self._tracked(kind)
+        if not (200 <= int(status) < 300 or int(status) in _GONE_STATUSES):
+            logger.warn(f"Cleanup of {kind} {entity_id} failed with status {status}; left for the orphan sweep")
+            return False
+        tracked.discard(entity_id)
+        if self._journal is not None:
+            self._journal.removed({kind: [entity_id]})
+        return True
+
     @keyword("Clear Entity Store")
-    def clear_entity_store(self) -> None:
+    def clear_entity_store(self, removed: bool = False) -> None:
+        """Forget every tracked id.
+
+        Args:
+            removed: Journal the ids as removed too — for data cleaned up some other way, e.g. by a
+                snapshot restore.  Without it ids not confirmed by ``Record Deletion`` stay in the
+                journal for ``scripts/sweep_orphans.py``.
+        """
+        if removed and self._journal is not None:
+            self._journal.removed({"orders": self._orders, "products": self._products, "customers": self._customers})
         self._products.clear()
         self._customers.clear()
         self._orders.clear()
+
+    def _tracked(self, kind: str) -> set[str]:
+        stores = {"orders": self._orders, "products": self._products, "customers": self._customers}
+        if kind not in stores:
+            raise ValueError(f"Unknown entity kind {kind!r}; expected one of {', '.join(stores)}")
+        return stores[kind]
+
+    def _journal_added(self, kind: str, entity_id: str) -> None:
+        if self._journal is not None:
+            self._journal.added(kind, entity_id)
@@ -0,0 +1,28 @@
+"""Connection helper shared by the libraries that talk to the portal's MongoDB directly."""
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+MONGOMOCK_SCHEME = "mongomock://"
+
+
+def connect_database(uri: str, database: str) -> Any:
+    """Return the *database* handle of the process-wide client for *uri*.
+
+    ``mongomock://`` gives an in-memory ``mongomock`` client, shared like a real server so every library
+    sees the same data.  ``pymongo`` (the ``mongo`` extra) is imported lazily, so modules using this
+    stay importable without it.
+    """
+    return _client(uri)[database]
+
+
+@functools.cache
+def _client(uri: str) -> Any:
+    if uri.startswith(MONGOMOCK_SCHEME):
+        import mongomock
+
+        return mongomock.MongoClient()
+    import pymongo
+
+    return pymongo.MongoClient(uri, tz_aware=True)
@@ -0,0 +1,260 @@
+"""RF keyword library that bulk-inserts generated fixtures straight into the portal's MongoDB."""
+from __future__ import annotations
+
+import itertools
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+
+from data.enums.order_status import OrderHistoryAction, OrderStatus
+from data.generators.generate_customer_data import generate_customer_data
+from data.generators.generate_order_data import generate_order_data
+from data.generators.generate_product_data import generate_product_data
+from libraries.stores.mongo import connect_database
+from variables.constants import TEST_DATA_PREFIX
+from variables.env import MONGO_DB, MONGO_URI, USER_NAME
+
+DEFAULT_BATCH_SIZE = 5_000
+# Seed Orders without explicit pools creates this many customers / products to reference
+DEFAULT_POOL_SIZE = 50
+# Deleted in this order so no order ever points at a missing customer or product
+_COLLECTIONS = ("orders", "products", "customers")
+
+Document = dict[str, Any]
+
+
+@library(scope="SUITE")
+class MongoSeedLibrary:
+    """Seeds products, customers and orders with ``insert_many`` instead of one API call per entity.
+
+    Documents are built from the ``data/generators`` output in the shape the backend's mongoose models
+    store (``createdOn`` dates, embedded order products and a creation history entry), inserted in
+    batches of ``batch_size`` and returned as id strings.  Every seeded id is remembered so
+    ``Delete Seeded Entities`` can remove them with a few ``delete_many`` calls.
+
+    Needs ``pymongo`` (the ``mongo`` extra).  ``uri=mongomock://`` runs against an in-memory
+    ``mongomock`` client instead of a ``mongod``.
+    """
+
+    def __init__(self, uri: str = MONGO_URI, database: str = MONGO_DB, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self._uri = uri
+        self._database_name = database
+        self._batch_size = int(batch_size)
+        self._database: Any = None
+        self._seeded: dict[str, list[Any]] = {name: [] for name in _COLLECTIONS}
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Seed Products")
+    def seed_products(self, count: int, batch_size: int | None = None) -> list[str]:
+        """Insert *count* generated products and return their ids.
+
+        Args:
+            count: Number of products.
+            batch_size: Documents per ``insert_many``; defaults to the library's ``batch_size``.
+
+        Returns:
+            The inserted ``_id`` values as strings, in insertion order.
+        """
+        now = _utc_now()
+
+        def build(index: int) -> Document:
+            product = generate_product_data().model_dump(exclude_none=True)
+            return {**product, "createdOn": now - timedelta(seconds=index)}
+
+        return self._insert("products", build, int(count), batch_size)
+
+    @keyword("Seed Customers")
+    def seed_customers(self, count: int, batch_size: int | None = None) -> list[str]:
+        """Insert *count* generated customers and return their ids.
+
+        Emails get a per-call token and a running number, so they stay unique across batches and runs.
+
+        Args:
+            count: Number of customers.
+            batch_size: Documents per ``insert_many``; defaults to the library's ``batch_size``.
+
+        Returns:
+            The inserted ``_id`` values as strings, in insertion order.
+        """
+        now = _utc_now()
+        token = uuid.uuid4().hex[:8]
+
+        def build(index: int) -> Document:
+            customer = generate_customer_data(email=f"{TEST_DATA_PREFIX.lower()}.seed.{token}.{index}@example.com")
+            return {**customer.model_dump(exclude_none=True), "createdOn": now - timedelta(seconds=index)}
+
+        return self._insert("customers", build, int(count), batch_size)
+
+    @keyword("Seed Orders")
+    def seed_orders(
+        self,
+        count: int,
+        customer_ids: list[str] | None = None,
+        product_ids: list[str] | None = None,
+        batch_size: int | None = None,
+    ) -> list[str]:
+        """Insert *count* ``Draft`` orders and return their ids.
+
+        Customers are taken from their pool in turn; each order gets a random pick of
+        ``MIN_PRODUCTS_PER_ORDER`` to ``MAX_PRODUCTS_PER_ORDER`` products from theirs.  Pools that are
+        not given are seeded first (``DEFAULT_POOL_SIZE`` entities each, fewer for small counts).
+
+        Args:
+            count: Number of orders.
+            customer_ids: Existing customer ids to pick from.
+            product_ids: Existing product ids to pick from.
+            batch_size: Documents per ``insert_many``; defaults to the library's ``batch_size``.
+
+        Returns:
+            The inserted ``_id`` values as strings, in insertion order.
+        """
+        count = int(count)
+        pool_size = max(1, min(count, DEFAULT_POOL_SIZE))
+        customer_ids = list(customer_ids or self.seed_customers(pool_size))
+        product_ids = list(product_ids or self.seed_products(pool_size))
+        from bson import ObjectId
+
+        products = {
+            str(product["_id"]): product
+            for product in self._db()["products"].find({"_id": {"$in": [ObjectId(i) for i in product_ids]}})
+        }
+        missing = set(product_ids) - products.keys()
+        if missing:
+            raise AssertionError(f"Products not found in '{self._database_name}': {', '.join(sorted(missing))}")
+        performer = self._performer()
+        now = _utc_now()
+
+        def build(index: int) -> Document:
+            order = generate_order_data(customer_ids[index % len(customer_ids)], product_ids)
+            return _order_document(order.customer, [products[i] for i in order.products], performer, now, index)
+
+        return self._insert("orders", build, count, batch_size)
+
+    @keyword("Get Seeded Ids")
+    def get_seeded_ids(self, collection: str) -> list[str]:
+        """Return the ids seeded into *collection* (``orders``, ``products`` or ``customers``) so far."""
+        return [str(object_id) for object_id in self._seeded[collection]]
+
+    @keyword("Get Collection Count")
+    def get_collection_count(self, collection: str) -> int:
+        """Return the number of documents in *collection*."""
+        return int(self._db()[collection].count_documents({}))
+
+    @keyword("Delete Seeded Entities")
+    def delete_seeded_entities(self) -> dict[str, int]:
+        """Delete everything this library seeded (orders → products → customers) in batched ``delete_many`` calls.
+
+        Returns:
+            Deleted document counts per collection.
+        """
+        deleted: dict[str, int] = {}
+        for name in _COLLECTIONS:
+            ids, self._seeded[name] = self._seeded[name], []
+            deleted[name] = sum(
+                self._db()[name].delete_many({"_id": {"$in": batch}}).deleted_count
+                for batch in _batches(iter(ids), self._batch_size)
+            )
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _db(self) -> Any:
+        if self._database is None:
+            self._database = connect_database(self._uri, self._database_name)
+        return self._database
+
+    def _insert(
+        self, collection: str, build: Callable[[int], Document], count: int, batch_size: int | None
+    ) -> list[str]:
+        from bson import ObjectId
+
+        size = int(batch_size or self._batch_size)
+        documents = ({"_id": ObjectId(), **build(index)} for index in range(count))
+        inserted: list[Any] = []
+        for batch in _batches(documents, size):
+            result = self._db()[collection].insert_many(batch, ordered=False)
+            inserted.extend(result.inserted_ids)
+        self._seeded[collection].extend(inserted)
+        logger.info(f"Seeded {len(inserted)} {collection} into '{self._database_name}' in batches of {size}")
+        return [str(object_id) for object_id in inserted]
+
+    def _performer(self) -> Document:
+        user = self._db()["users"].find_one({"username": USER_NAME}, {"password": 0})
+        if user is None:
+            # Same admin the backend seeds on startup (mongo/init.ts)
+            from bson import ObjectId
+
+            user = {
+                "_id": ObjectId(),
+                "username": USER_NAME,
+                "firstName": "Admin",
+                "lastName": "Admin",
+                "roles": ["ADMIN"],
+                "createdOn": _utc_now().strftime("%Y/%m/%d %H:%M:%S"),
+            }
+        return {**user, "_id": str(user["_id"])}
+
+
+def _order_document(
+    customer_id: str, products: list[Document], performer: Document, now: datetime, index: int
+) -> Document:
+    """Build an order as ``OrderService.create`` stores it: Draft, priced, with one history entry."""
+    from bson import ObjectId
+
+    line_items = [
+        {
+            "_id": product["_id"],
+            "name": product["name"],
+            "amount": product["amount"],
+            "price": product["price"],
+            "manufacturer": product["manufacturer"],
+            "notes": product.get("notes", ""),
+            "received": False,
+        }
+        for product in products
+    ]
+    created_on = now - timedelta(seconds=index)
+    total_price = sum(item["price"] for item in line_items)
+    return {
+        "status": OrderStatus.DRAFT.value,
+        "customer": ObjectId(customer_id),
+        "products": line_items,
+        "delivery": None,
+        "total_price": total_price,
+        "createdOn": created_on,
+        "comments": [],
+        "history": [
+            {
+                "status": OrderStatus.DRAFT.value,
+                "customer": customer_id,
+                "products": line_items,
+                "total_price": total_price,
+                "delivery": None,
+                "changedOn": created_on,
+                "action": OrderHistoryAction.CREATED.value,
+                "performer": performer,
+                "assignedManager": None,
+            }
+        ],
+        "assignedManager": None,
+    }
+
+
+def _batches(items: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    while batch := list(itertools.islice(items, size)):
+        yield batch
+
+
+def _utc_now() -> datetime:
+    # Mongo stores milliseconds; truncating keeps read-back values equal to what was written
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
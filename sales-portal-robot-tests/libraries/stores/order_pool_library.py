@@ -0,0 +1,247 @@
+"""RF keyword library that keeps a background-filled reserve of orders per status and leases them to tests."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+import variables.api_config as api
+from data.enums.order_status import OrderStatus
+from libraries.api.api_client import ApiClientLibrary
+from libraries.api.order_factory_library import OrderFactoryLibrary
+from libraries.stores.entity_store_library import EntityStoreLibrary
+from variables.env import DB_ISOLATION, ORDER_POOL_SIZE, ORDER_POOL_WORKERS
+
+POOLED_STATUSES = (OrderStatus.DRAFT, OrderStatus.IN_PROCESS, OrderStatus.RECEIVED, OrderStatus.CANCELED)
+DEFAULT_LEASE_TIMEOUT = 60.0
+# Products shared by every pool order; "Partially Received" orders (built on demand) need two
+_POOL_PRODUCTS = 2
+_DELETE_URL = {"orders": api.order_by_id, "products": api.product_by_id, "customers": api.customer_by_id}
+# 404: the leasing test's teardown already deleted the order
+_GONE = {200, 204, 404}
+
+
+@library(scope="GLOBAL")
+class OrderPoolLibrary:
+    """Orders built ahead of time, so a test that needs one in a given status gets it without waiting.
+
+    ``Start Order Pool`` (or the first ``Lease Order In Status``) creates a customer and products and
+    starts filling a reserve of ``size`` orders for each of ``POOLED_STATUSES`` on ``workers`` background
+    threads, using the ``OrderFactoryLibrary`` order factory.  ``Lease Order In Status`` pops a
+    ready order, hands its id to the test's ``EntityStore`` (so the test's teardown deletes it) and
+    immediately starts building its replacement.  Statuses that are not pooled are built on demand.
+
+    The pool lives for the whole run (one per pabot worker).  When Robot Framework closes the library,
+    background building stops and every order, product and customer the pool created is deleted; all
+    of them are also in the cleanup journal for ``scripts/sweep_orphans.py``.
+
+    Wait times of every lease are recorded; ``Get Order Pool Stats`` returns them and a summary is
+    printed at the end of the run.  Under ``DB_ISOLATION=snapshot`` a suite's restore would remove
+    whatever the pool built during it, so the pool is disabled (``size=0``) and every lease is built
+    on demand.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+    ENTITY_STORE_LIBRARY_NAME = "EntityStore"
+
+    def __init__(
+        self,
+        size: int = 0 if DB_ISOLATION == "snapshot" else ORDER_POOL_SIZE,
+        workers: int = ORDER_POOL_WORKERS,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+    ) -> None:
+        self._size = int(size)
+        self._workers = max(1, int(workers))
+        self._lease_timeout = float(lease_timeout)
+        self._factory = OrderFactoryLibrary()
+        # The pool's own entities, journaled so a killed run can be swept
+        self._store = EntityStoreLibrary()
+        self._token: str | None = None
+        self._customer_id = ""
+        self._product_ids: list[str] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._condition = threading.Condition()
+        self._ready: dict[OrderStatus, deque[dict[str, Any]]] = {status: deque() for status in POOLED_STATUSES}
+        self._building: dict[OrderStatus, int] = dict.fromkeys(POOLED_STATUSES, 0)
+        # status -> error of its last failed build, until a build of that status succeeds
+        self._errors: dict[OrderStatus, BaseException] = {}
+        self._closed = False
+        # status -> seconds each lease of it waited
+        self._waits: dict[str, list[float]] = {}
+        self.ROBOT_LIBRARY_LISTENER = self
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Start Order Pool")
+    def start_order_pool(self, token: str) -> None:
+        """Create the pool's customer and products and start filling the reserve in the background.
+
+        Later calls only replace the token used for new orders.  Call it in suite setup to warm the
+        pool before the first test asks for an order.
+
+        Args:
+            token: Bearer token used by the background builders.
+        """
+        self._token = token
+        if self._product_ids:
+            return
+        self._customer_id, self._product_ids = self._factory.create_customer_and_products(
+            token, _POOL_PRODUCTS, self._store
+        )
+        if self._size > 0:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="order-pool")
+            with self._condition:
+                self._refill()
+            logger.info(f"Order pool filling {self._size} order(s) per status on {self._workers} thread(s)")
+
+    @keyword("Lease Order In Status")
+    def lease_order_in_status(self, token: str, status: str = OrderStatus.DRAFT) -> dict:  # type: ignore[type-arg]
+        """Take an order in *status* from the pool; it belongs to the current test from now on.
+
+        Waits (up to ``lease_timeout`` seconds) when the reserve for *status* is empty.  The order is
+        tracked in ``EntityStore`` and a replacement is queued.  With the pool disabled (``size=0``)
+        the order is built on the spot, together with its own customer and products.
+
+        Args:
+            token: Bearer token; starts the pool on first use.
+            status: ``Draft``, ``In Process``, ``Received`` and ``Canceled`` come from the pool, any
+                other status is built on demand.
+
+        Returns:
+            The ``Order`` dict as of the last request that built it.
+        """
+        target = OrderStatus(status)
+        start = time.perf_counter()
+        order: dict[str, Any]
+        if self._size <= 0:
+            # Pool disabled: the test gets its own customer and products, all tracked in its EntityStore
+            order = self._factory.create_orders_in_state(token, target)[0]
+        elif target in self._ready:
+            self.start_order_pool(token)
+            order = self._take(target)
+        else:
+            self.start_order_pool(token)
+            product_ids = self._product_ids[: 2 if target is OrderStatus.PARTIALLY_RECEIVED else 1]
+            order = self._factory.create_order_in_state(
+                token, target, self._customer_id, product_ids, False, self._store
+            )
+        waited = time.perf_counter() - start
+        self._waits.setdefault(target.value, []).append(waited)
+        self._entity_store().track_order(order["_id"])
+        logger.info(f"Leased order {order['_id']} in status '{target}' after {waited * 1000:.0f}ms")
+        return order
+
+    @keyword("Get Order Pool Stats")
+    def get_order_pool_stats(self) -> dict[str, dict[str, float]]:
+        """Return lease statistics per status: ``leases``, ``ready`` and ``mean_wait_ms`` / ``max_wait_ms``."""
+        with self._condition:
+            ready = {status.value: len(orders) for status, orders in self._ready.items()}
+        stats: dict[str, dict[str, float]] = {}
+        for status in dict.fromkeys([*ready, *self._waits]):
+            waits = self._waits.get(status, [])
+            stats[status] = {
+                "leases": len(waits),
+                "ready": ready.get(status, 0),
+                "mean_wait_ms": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "max_wait_ms": round(max(waits) * 1000, 1) if waits else 0.0,
+            }
+        return stats
+
+    # ------------------------------------------------------------------
+    # Library listener (API v3)
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        summary = ", ".join(
+            f"{status} {int(s['leases'])} lease(s) avg {s['mean_wait_ms']}ms max {s['max_wait_ms']}ms"
+            for status, s in self.get_order_pool_stats().items()
+            if s["leases"]
+        )
+        if summary:
+            logger.console(f"Order pool: {summary}")
+        if self._token is not None:
+            self._delete_pool_entities(self._token)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _take(self, status: OrderStatus) -> dict[str, Any]:
+        deadline = time.monotonic() + self._lease_timeout
+        with self._condition:
+            if not self._ready[status] and not self._building[status]:
+                # Nothing on the way, e.g. after earlier builds failed: try again
+                self._refill()
+            while not self._ready[status]:
+                if not self._building[status]:
+                    reason = self._errors.get(status) or "the pool is closed"
+                    raise AssertionError(f"Order pool could not build a '{status}' order: {reason}")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise AssertionError(f"No '{status}' order became ready within {self._lease_timeout:g}s")
+                self._condition.wait(remaining)
+            order = self._ready[status].popleft()
+            self._refill()
+        return order
+
+    def _refill(self) -> None:
+        """Queue builds for every status below ``size``; call with the condition held."""
+        if self._executor is None or self._closed:
+            return
+        for status in POOLED_STATUSES:
+            for _ in range(self._size - len(self._ready[status]) - self._building[status]):
+                self._building[status] += 1
+                self._executor.submit(self._build, status)
+
+    def _build(self, status: OrderStatus) -> None:
+        order: dict[str, Any] | None = None
+        error: BaseException | None = None
+        try:
+            order = self._factory.create_order_in_state(
+                cast(str, self._token), status, self._customer_id, self._product_ids[:1], False, self._store
+            )
+        except Exception as exc:  # surfaced to the next lease of this status
+            error = exc
+        with self._condition:
+            self._building[status] -= 1
+            if order is not None:
+                self._ready[status].append(order)
+                self._errors.pop(status, None)
+            elif error is not None:
+                self._errors[status] = error
+            self._condition.notify_all()
+
+    def _delete_pool_entities(self, token: str) -> None:
+        client = ApiClientLibrary()
+        tracked = {
+            "orders": self._store.get_tracked_orders(),
+            "products": self._store.get_tracked_products(),
+            "customers": self._store.get_tracked_customers(),
+        }
+        failed = 0
+        for kind, ids in tracked.items():
+            request_list = [{"method": "DELETE", "url": _DELETE_URL[kind](item), "token": token} for item in ids]
+            if request_list:
+                responses = client.send_api_requests_concurrently(request_list, max_workers=self._workers)
+                failed += sum(response.status not in _GONE for response in responses)
+        if failed:
+            # Left in the cleanup journal for scripts/sweep_orphans.py
+            logger.warn(f"Order pool could not delete {failed} of its entities")
+            return
+        self._store.clear_entity_store(removed=True)
+
+    def _entity_store(self) -> EntityStoreLibrary:
+        return cast(EntityStoreLibrary, BuiltIn().get_library_instance(self.ENTITY_STORE_LIBRARY_NAME))
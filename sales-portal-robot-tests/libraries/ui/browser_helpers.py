@@ -0,0 +1,375 @@
+"""RF keyword library with Browser helpers that batch DOM reads into single round trips."""
+
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+from typing import Any, cast
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+from libraries.ui.page_settle import SettleStats
+
+# Runs inside the page against the matched <table>; returns one record per body row.  The frontend's
+# "No records created yet" placeholder (a single spanning cell) is skipped.
+_TABLE_TO_RECORDS_JS = """(table, opts) => {
+  const clean = (node) => (node ? node.textContent.replace(/\\s+/g, " ").trim() : "");
+  const headers = Array.from(table.querySelectorAll("thead th")).map(clean);
+  const keys = headers.map((header, i) =>
+    opts.skip.includes(header) ? null : (opts.columns[header] ?? (header || `column_${i + 1}`)));
+  const records = [];
+  for (const body of table.tBodies) {
+    for (const row of body.rows) {
+      const cells = Array.from(row.cells);
+      if (cells.length === 1 && cells[0].colSpan > 1) continue;
+      const texts = cells.map(clean);
+      if (opts.rowId !== null && !texts.includes(opts.rowId)) continue;
+      const record = {};
+      keys.forEach((key, i) => { if (key !== null) record[key] = texts[i] ?? ""; });
+      records.push(record);
+      if (opts.rowId !== null) return records;
+    }
+  }
+  return records;
+}"""
+
+# Fills fields in order through the native value setter and fires bubbling input + change events, which is
+# what the frontend's jQuery ``form.on("input" | "change")`` validators listen to.  Fields that cannot be
+# filled here (missing, hidden, disabled/readonly, unsupported element, unknown <select> option) are
+# returned by index so the caller can hand them to Playwright.
+_FILL_FORM_JS = """(fields) => {
+  const pending = [];
+  fields.forEach((field, index) => {
+    const el = document.querySelector(field.css);
+    const skip = (tag) => pending.push({ index, tag });
+    if (!el || el.disabled || el.readOnly || el.getClientRects().length === 0) return skip(el ? el.tagName : "");
+    if (el instanceof HTMLSelectElement) {
+      const option = Array.from(el.options).find((o) => o.text.trim() === field.value || o.label === field.value);
+      if (!option) return skip(el.tagName);
+      el.value = option.value;
+    } else if (el instanceof HTMLTextAreaElement || (el instanceof HTMLInputElement && !["checkbox", "radio",
+        "file"].includes(el.type))) {
+      const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+      el.focus();
+      setter.call(el, field.value);
+    } else {
+      return skip(el.tagName);
+    }
+    el.dispatchEvent(new Event("input", { bubbles: true }));
+    el.dispatchEvent(new Event("change", { bubbles: true }));
+  });
+  return pending;
+}"""
+
+# Installs (once per document) a counter of in-flight ``/api/`` XHR/fetch calls and a MutationObserver that
+# timestamps the last DOM change, then resolves as soon as no API call is pending, no spinner is visible,
+# the optional ready element is visible and the DOM has been quiet for ``quietMs``.  A 100 ms re-check
+# covers state changes that produce no mutation (e.g. CSS-only visibility).
+_PAGE_SETTLED_JS = """(opts) => {
+  if (!window.__salesPortalActivity) {
+    const activity = { inFlight: 0, lastActivity: performance.now(), listeners: new Set() };
+    const touch = () => {
+      activity.lastActivity = performance.now();
+      activity.listeners.forEach((listener) => listener());
+    };
+    const isApi = (url) => {
+      try { return new URL(String(url), location.href).pathname.startsWith("/api/"); } catch { return false; }
+    };
+    const open = XMLHttpRequest.prototype.open;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url, ...rest) {
+      this.__salesPortalApi = isApi(url);
+      return open.call(this, method, url, ...rest);
+    };
+    XMLHttpRequest.prototype.send = function (...args) {
+      if (this.__salesPortalApi) {
+        activity.inFlight++;
+        touch();
+        this.addEventListener("loadend", () => { activity.inFlight--; touch(); }, { once: true });
+      }
+      return send.apply(this, args);
+    };
+    const originalFetch = window.fetch;
+    window.fetch = function (input, init) {
+      const result = originalFetch.call(this, input, init);
+      if (!isApi(input instanceof Request ? input.url : input)) return result;
+      activity.inFlight++;
+      touch();
+      return result.finally(() => { activity.inFlight--; touch(); });
+    };
+    new MutationObserver(touch).observe(document.documentElement,
+      { childList: true, subtree: true, attributes: true, characterData: true });
+    window.__salesPortalActivity = activity;
+  }
+  const activity = window.__salesPortalActivity;
+  const started = performance.now();
+  const visible = (el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+  const anyVisible = (css) => Array.from(document.querySelectorAll(css)).some(visible);
+  const state = () => ({
+    inFlight: activity.inFlight,
+    spinner: anyVisible(opts.spinner),
+    readyMissing: opts.ready !== null && !anyVisible(opts.ready),
+  });
+  return new Promise((resolve) => {
+    let quietTimer;
+    const finish = (settled) => {
+      clearTimeout(quietTimer);
+      clearTimeout(deadline);
+      clearInterval(recheck);
+      activity.listeners.delete(check);
+      resolve({ settled, ...state(), waitedMs: performance.now() - started,
+        settledMs: Math.max(0, activity.lastActivity - started) });
+    };
+    const check = () => {
+      clearTimeout(quietTimer);
+      const current = state();
+      if (current.inFlight || current.spinner || current.readyMissing) return;
+      const idle = performance.now() - activity.lastActivity;
+      if (idle >= opts.quietMs) return finish(true);
+      quietTimer = setTimeout(check, opts.quietMs - idle);
+    };
+    const deadline = setTimeout(() => finish(false), opts.timeoutMs);
+    const recheck = setInterval(check, 100);
+    activity.listeners.add(check);
+    check();
+  });
+}"""
+
+# Selectors the page can resolve with document.querySelector: ``css=…`` or Browser's implicit CSS strategy.
+# Other engines (``xpath=``, ``text=``, ``id=``, ``//…``) and chained/frame selectors go to Playwright.
+_EXPLICIT_STRATEGY = re.compile(r"^[a-z-]+=", re.IGNORECASE)
+
+
+@library(scope="SUITE")
+class BrowserHelpersLibrary:
+    """Utility keywords wrapping Browser Library for common UI operations.
+
+    Asserting on a table with ``Get Element Count`` plus one ``Get Text`` per cell costs one gRPC
+    round trip to the Playwright process per call.  The keywords here read the whole table in a single
+    ``Evaluate JavaScript`` call instead; ``Fill Form Fast`` does the same for filling a form.
+
+    ``Wait Until Page Settled`` replaces element-state polling after navigations and clicks with a wait
+    driven by the page's own API traffic and DOM mutations.  The time it saves against the polling
+    schedule is printed at the end of every suite that used it.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+    BROWSER_LIBRARY_NAME = "Browser"
+    DEFAULT_SKIPPED_COLUMNS = ("Actions",)
+    SPINNER_SELECTOR = ".spinner-border"
+
+    def __init__(self) -> None:
+        self._browser_instance: Any = None
+        self._settle_stats = SettleStats()
+        self.ROBOT_LIBRARY_LISTENER = self
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Get Table As Records")
+    def get_table_as_records(
+        self,
+        selector: str,
+        columns: dict[str, str] | None = None,
+        row_id: str | None = None,
+        skip_columns: list[str] | None = None,
+    ) -> list[dict[str, str]]:
+        """Return the body rows of the table matched by ``selector`` as a list of dicts.
+
+        Keys are the header texts (whitespace-normalised); ``columns`` renames them, e.g.
+        ``{"Order Number": "id"}``.  Headers listed in ``skip_columns`` (default: ``Actions``) are
+        left out.  With ``row_id`` only the first row having a cell whose text equals it is returned.
+
+        Args:
+            selector: Browser selector of the ``<table>`` element.
+            columns: Optional header → key mapping.
+            row_id: Optional cell text identifying a single row (e.g. an order ``_id``).
+            skip_columns: Headers to omit; defaults to ``["Actions"]``.
+
+        Returns:
+            A list of ``{column: cell text}`` dicts in table order.
+
+        Example:
+            | ${orders}= | Get Table As Records | css=#table-orders | columns={"Order Number": "id"} |
+            | Should Be Equal | ${orders}[0][Status] | Draft |
+        """
+        options = {
+            "columns": dict(columns or {}),
+            "rowId": None if row_id is None else str(row_id),
+            "skip": list(self.DEFAULT_SKIPPED_COLUMNS if skip_columns is None else skip_columns),
+        }
+        records: list[dict[str, str]] = self._browser.evaluate_javascript(
+            selector, _TABLE_TO_RECORDS_JS, arg=options
+        )
+        return records
+
+    @keyword("Get Table Row As Record")
+    def get_table_row_as_record(
+        self,
+        selector: str,
+        row_id: str,
+        columns: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        """Return the row containing a cell equal to ``row_id`` as a dict; fail if there is none.
+
+        Args:
+            selector: Browser selector of the ``<table>`` element.
+            row_id: Cell text identifying the row (e.g. an order ``_id``).
+            columns: Optional header → key mapping, as for ``Get Table As Records``.
+
+        Returns:
+            A ``{column: cell text}`` dict.
+        """
+        records = cast(list[dict[str, str]], self.get_table_as_records(selector, columns=columns, row_id=row_id))
+        if not records:
+            raise AssertionError(f"No row with a cell equal to '{row_id}' in table '{selector}'")
+        return records[0]
+
+    @keyword("Fill Form Fast")
+    def fill_form_fast(
+        self,
+        fields: dict[str, Any],
+        keyboard_fields: list[str] | None = None,
+    ) -> None:
+        """Fill several inputs, textareas and selects in one in-page script instead of one call per field.
+
+        Fields are filled in mapping order, so a select that reveals or unlocks later inputs (e.g. delivery
+        location ``Other``) can precede them.  Selects are matched by option text.  Each filled element
+        receives bubbling ``input`` and ``change`` events.  Any field the script cannot fill — not rendered
+        yet, hidden, disabled/readonly, a non-CSS selector or an unknown option — is then filled with
+        ``Fill Text`` / ``Select Options By``, keeping Playwright's waiting and error messages.  Fields
+        listed in ``keyboard_fields`` (masked inputs, autocompletes reacting to key events) always go
+        through ``Type Text``.
+
+        Args:
+            fields: Selector → value mapping; values are converted to strings.
+            keyboard_fields: Selectors from ``fields`` that need real keyboard input.
+
+        Example:
+            | VAR | &{fields} | ${INPUT_NAME}=${name} | ${INPUT_MANUFACTURER}=Apple |
+            | Fill Form Fast | ${fields} |
+        """
+        keyboard = set(keyboard_fields or ())
+        unknown = keyboard.difference(fields)
+        if unknown:
+            raise ValueError(f"keyboard_fields not present in fields: {', '.join(sorted(unknown))}")
+        items = [(selector, str(value)) for selector, value in fields.items()]
+        in_page = {
+            index: css
+            for index, (selector, _) in enumerate(items)
+            if selector not in keyboard and (css := self._in_page_css(selector)) is not None
+        }
+        fallback = {index: "" for index in range(len(items)) if index not in in_page}
+        if in_page:
+            order = list(in_page)
+            pending: list[dict[str, Any]] = self._browser.evaluate_javascript(
+                None, _FILL_FORM_JS, arg=[{"css": in_page[index], "value": items[index][1]} for index in order]
+            )
+            fallback.update({order[entry["index"]]: entry["tag"] for entry in pending})
+        for index in sorted(fallback):
+            selector, value = items[index]
+            if selector in keyboard:
+                self._run_browser_keyword("Type Text", selector, value)
+                continue
+            tag = fallback[index] or self._run_browser_keyword("Get Property", selector, "tagName")
+            if str(tag).upper() == "SELECT":
+                self._run_browser_keyword("Select Options By", selector, "text", value)
+            else:
+                self._run_browser_keyword("Fill Text", selector, value)
+
+    @keyword("Wait Until Page Settled")
+    def wait_until_page_settled(
+        self,
+        timeout: timedelta = timedelta(seconds=10),
+        ready_selector: str | None = None,
+        quiet_period: timedelta = timedelta(milliseconds=50),
+    ) -> float:
+        """Wait until the page's ``/api/*`` calls have finished, no spinner is visible and the DOM is quiet.
+
+        Returns as soon as those conditions hold, without polling delays.  The activity tracker is
+        installed on first use in each document, so requests started before it (the initial load after
+        ``Go To``) are covered by the spinner and ``ready_selector`` checks only.
+
+        Args:
+            timeout: Maximum time to wait.
+            ready_selector: Optional element that must also be visible, e.g. the orders table.
+            quiet_period: How long the DOM must stay unchanged to count as settled.
+
+        Returns:
+            Seconds spent waiting.
+
+        Example:
+            | Click | ${SAVE_BTN} |
+            | Wait Until Page Settled | timeout=${SPINNER_TIMEOUT} |
+        """
+        ready_css = None
+        if ready_selector is not None:
+            ready_css = self._in_page_css(ready_selector)
+            if ready_css is None:
+                self._run_browser_keyword("Wait For Elements State", ready_selector, "visible", timeout)
+        options = {
+            "timeoutMs": timeout.total_seconds() * 1000,
+            "quietMs": quiet_period.total_seconds() * 1000,
+            "spinner": self.SPINNER_SELECTOR,
+            "ready": ready_css,
+        }
+        result: dict[str, Any] = self._browser.evaluate_javascript(None, _PAGE_SETTLED_JS, arg=options)
+        self._settle_stats.record(result["waitedMs"], result["settledMs"], result["settled"])
+        if not result["settled"]:
+            pending = [f"{result['inFlight']} API request(s) in flight"] if result["inFlight"] else []
+            if result["spinner"]:
+                pending.append("spinner still visible")
+            if result["readyMissing"]:
+                pending.append(f"'{ready_selector}' not visible")
+            pending = pending or ["DOM still changing"]
+            raise AssertionError(f"Page did not settle within {timeout.total_seconds():g}s: {', '.join(pending)}")
+        waited = float(result["waitedMs"]) / 1000
+        logger.info(f"Page settled after {waited * 1000:.0f} ms")
+        return waited
+
+    @keyword("Get Page Settle Stats")
+    def get_page_settle_stats(self) -> dict[str, float | int]:
+        """Return this suite's ``Wait Until Page Settled`` totals.
+
+        Keys: ``waits``, ``waited_ms``, ``polling_estimate_ms``, ``saved_ms`` and ``timeouts``.
+        """
+        return self._settle_stats.snapshot()
+
+    # ------------------------------------------------------------------
+    # Library listener (API v3)
+    # ------------------------------------------------------------------
+
+    def end_suite(self, data: object, result: object) -> None:
+        stats = self._settle_stats
+        if stats.waits:
+            logger.console(
+                f"Page waits: {stats.waits} waits, {stats.waited_ms / 1000:.2f}s waited, "
+                f"{stats.saved_ms / 1000:+.2f}s saved vs element-state polling"
+            )
+            stats.reset()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _run_browser_keyword(self, name: str, *args: Any) -> Any:
+        return BuiltIn().run_keyword(f"{self.BROWSER_LIBRARY_NAME}.{name}", *args)
+
+    @staticmethod
+    def _in_page_css(selector: str) -> str | None:
+        if selector.startswith("css="):
+            selector = selector[len("css=") :]
+        elif _EXPLICIT_STRATEGY.match(selector) or selector.startswith(("//", "..")):
+            return None
+        if ">>" in selector:
+            return None
+        return selector
+
+    @property
+    def _browser(self) -> Any:
+        if self._browser_instance is None:
+            self._browser_instance = BuiltIn().get_library_instance(self.BROWSER_LIBRARY_NAME)
+        return self._browser_instance
@@ -0,0 +1,148 @@
+"""One Playwright browser server per machine, shared by parallel UI workers.
+
+Under pabot every worker runs ``New Browser`` and pays a Chromium cold start plus a few hundred MB of
+RAM.  :func:`start_browser_server` launches a single ``launchServer()`` browser in a detached node
+process (using the Playwright copy installed by ``rfbrowser init``) and records its websocket endpoint
+and pid in a state file.  Workers started with ``BROWSER_WS_ENDPOINT`` set connect to it with
+``Connect To Browser`` and create their own isolated contexts; ``Close Browser`` then only disconnects.
+:func:`stop_browser_server` closes the browser and removes the state file.
+"""
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_STATE_PATH = Path(tempfile.gettempdir()) / "sales-portal-browser-server.json"
+
+# Prints the endpoint as one JSON line, then keeps the server alive until SIGTERM / SIGINT.
+_SERVER_JS = """
+const [modulePath, browserName, headless] = process.argv.slice(1);
+const playwright = require(modulePath);
+(async () => {
+  const server = await playwright[browserName].launchServer({ headless: headless === "true" });
+  const shutdown = async () => { await server.close(); process.exit(0); };
+  process.on("SIGTERM", shutdown);
+  process.on("SIGINT", shutdown);
+  process.stdout.write(JSON.stringify({ wsEndpoint: server.wsEndpoint() }) + "\\n");
+})().catch((error) => { console.error(error); process.exit(1); });
+"""
+
+
+def playwright_module_path() -> Path:
+    """Return the ``playwright`` node module bundled with robotframework-browser."""
+    import Browser
+
+    module = Path(Browser.__file__).parent / "wrapper" / "node_modules" / "playwright"
+    if not module.is_dir():
+        raise RuntimeError(f"Playwright node module not found at {module}; run 'rfbrowser init' first")
+    return module
+
+
+def read_server_state(state_path: Path = DEFAULT_STATE_PATH) -> dict[str, Any] | None:
+    """Return the recorded server state if its process is still alive, else ``None``."""
+    try:
+        state: dict[str, Any] = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state if _is_alive(int(state.get("pid", 0))) else None
+
+
+def start_browser_server(
+    state_path: Path = DEFAULT_STATE_PATH,
+    browser: str = "chromium",
+    headless: bool = True,
+    timeout: float = 30.0,
+) -> dict[str, Any]:
+    """Launch the shared browser server, or return the running one recorded in *state_path*.
+
+    Returns:
+        The state dict: ``wsEndpoint``, ``pid``, ``browser``, ``headless``, ``started_at``.
+    """
+    running = read_server_state(state_path)
+    if running is not None:
+        return running
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path = state_path.with_suffix(".log")
+    with log_path.open("ab") as log:
+        process = subprocess.Popen(
+            ["node", "-e", _SERVER_JS, str(playwright_module_path()), browser, str(headless).lower()],
+            stdout=subprocess.PIPE,
+            stderr=log,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    endpoint = _read_endpoint(process, timeout)
+    if endpoint is None:
+        process.kill()
+        raise RuntimeError(f"Browser server did not start within {timeout:g}s; see {log_path}")
+    state = {
+        "wsEndpoint": endpoint,
+        "pid": process.pid,
+        "browser": browser,
+        "headless": headless,
+        "started_at": time.time(),
+    }
+    tmp_path = state_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    os.replace(tmp_path, state_path)
+    return state
+
+
+def stop_browser_server(state_path: Path = DEFAULT_STATE_PATH, timeout: float = 10.0) -> bool:
+    """Close the shared browser server; return ``False`` if none was running."""
+    state = read_server_state(state_path)
+    state_path.unlink(missing_ok=True)
+    if state is None:
+        return False
+    pid = int(state["pid"])
+    os.kill(pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    while _is_alive(pid):
+        if time.monotonic() >= deadline:
+            os.killpg(pid, signal.SIGKILL)
+            break
+        time.sleep(0.05)
+    return True
+
+
+# ------------------------------------------------------------------
+# Internal helpers
+# ------------------------------------------------------------------
+
+
+def _read_endpoint(process: subprocess.Popen[bytes], timeout: float) -> str | None:
+    stdout = process.stdout
+    if stdout is None:
+        return None
+    lines: list[bytes] = []
+    reader = threading.Thread(target=lambda: lines.append(stdout.readline()), daemon=True)
+    reader.start()
+    reader.join(timeout)
+    if not lines or not lines[0]:
+        return None
+    endpoint: str = json.loads(lines[0])["wsEndpoint"]
+    return endpoint
+
+
+def _is_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    # A stopped server we spawned ourselves lingers as a zombie until reaped.
+    try:
+        reaped, _ = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return True
+    return reaped == 0
@@ -0,0 +1,74 @@
+"""RF keyword library that prepares order preconditions for UI tests over the HTTP API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+
+from data.enums.order_status import OrderStatus
+from libraries.api.endpoints.orders_api_library import OrdersApiLibrary
+from libraries.api.order_factory_library import OrderFactoryLibrary, expect_status, min_products
+
+
+@library(scope="SUITE")
+class OrderPreconditionsLibrary:
+    """Builds orders in a requested state through the API so UI tests only drive the behaviour under test.
+
+    Orders come from the API-layer ``OrderFactoryLibrary``; comments, the manager and the final read
+    go through ``OrdersApiLibrary``.  Every created entity is tracked in the test-scoped
+    ``EntityStore``, so the usual ``Full Delete Entities`` teardown cleans up.  Suites must import
+    ``ApiClient`` and ``EntityStore`` under those names (``orders_service.resource`` does).
+    """
+
+    def __init__(self) -> None:
+        self._factory = OrderFactoryLibrary()
+        self._orders = OrdersApiLibrary()
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Prepare Order Via API")
+    def prepare_order_via_api(
+        self,
+        token: str,
+        status: str = OrderStatus.DRAFT,
+        num_products: int = 1,
+        delivery: bool = False,
+        comments: int = 0,
+        manager_id: str | None = None,
+    ) -> dict:  # type: ignore[type-arg]
+        """Create a customer, products and an order, then bring the order into the requested state.
+
+        Args:
+            token: Bearer token used for every request.
+            status: Target status — ``Draft``, ``In Process``, ``Partially Received``, ``Received``
+                or ``Canceled``.
+            num_products: Products in the order; ``Partially Received`` needs at least two, so it
+                is raised to two when lower.
+            delivery: Schedule a delivery even for ``Draft``/``Canceled`` (always done for the
+                statuses that require one).
+            comments: Number of comments (``Comment 1`` … ``Comment N``) to add.
+            manager_id: ``_id`` of a manager to assign.
+
+        Returns:
+            The final ``Order`` dict as returned by ``GET /api/orders/{id}``.
+        """
+        target = OrderStatus(status)
+        store = self._factory.entity_store()
+        customer_id, product_ids = self._factory.create_customer_and_products(
+            token, min_products(target, num_products), store
+        )
+        order = self._factory.create_order_in_state(token, target, customer_id, product_ids, delivery, store)
+        order_id: str = order["_id"]
+
+        for n in range(1, int(comments) + 1):
+            expect_status(self._orders.add_order_comment(token, order_id, {"comment": f"Comment {n}"}), 200)
+        if manager_id:
+            expect_status(self._orders.assign_manager_to_order(token, order_id, manager_id), 200)
+
+        final: dict[str, Any] = expect_status(self._orders.get_order_by_id(token, order_id), 200).body["Order"]
+        logger.info(f"Prepared order {order_id} in status '{final['status']}'")
+        return final
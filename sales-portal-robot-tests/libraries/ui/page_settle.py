@@ -0,0 +1,62 @@
+"""Bookkeeping for event-driven page waits and the polling cost they replace.
+
+``Wait For Elements State`` re-checks the selector on Playwright's retry schedule (0, 20, 50, 100, 100 ms,
+then every 500 ms), so a page that becomes ready at 300 ms is only noticed at 770 ms.  The event-driven
+wait in ``BrowserHelpersLibrary`` resolves when the page settles; :class:`SettleStats` compares each wait
+with the moment the polling schedule would have noticed the same state.
+"""
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+# Playwright's waitForSelector retry timeouts; the last one repeats.
+PLAYWRIGHT_POLL_INTERVALS_MS: tuple[float, ...] = (0, 20, 50, 100, 100, 500)
+
+
+def _poll_ticks() -> Iterator[float]:
+    intervals = itertools.chain(PLAYWRIGHT_POLL_INTERVALS_MS, itertools.repeat(PLAYWRIGHT_POLL_INTERVALS_MS[-1]))
+    return itertools.accumulate(intervals)
+
+
+def polling_detection_ms(settled_ms: float) -> float:
+    """Return when element-state polling that started with the wait would first see a state reached at *settled_ms*."""
+    return next(tick for tick in _poll_ticks() if tick >= settled_ms)
+
+
+@dataclass
+class SettleStats:
+    """Per-suite totals of event-driven waits versus the estimated polling equivalent."""
+
+    waits: int = 0
+    waited_ms: float = 0.0
+    polling_ms: float = 0.0
+    timeouts: int = 0
+
+    def record(self, waited_ms: float, settled_ms: float, settled: bool = True) -> None:
+        self.waits += 1
+        self.waited_ms += waited_ms
+        if settled:
+            self.polling_ms += polling_detection_ms(settled_ms)
+        else:
+            self.timeouts += 1
+            self.polling_ms += waited_ms
+
+    @property
+    def saved_ms(self) -> float:
+        return self.polling_ms - self.waited_ms
+
+    def snapshot(self) -> dict[str, float | int]:
+        return {
+            "waits": self.waits,
+            "waited_ms": round(self.waited_ms, 1),
+            "polling_estimate_ms": round(self.polling_ms, 1),
+            "saved_ms": round(self.saved_ms, 1),
+            "timeouts": self.timeouts,
+        }
+
+    def reset(self) -> None:
+        self.waits = 0
+        self.waited_ms = self.polling_ms = 0.0
+        self.timeouts = 0
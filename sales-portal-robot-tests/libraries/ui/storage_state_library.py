@@ -0,0 +1,161 @@
+"""RF keyword library that builds the Playwright storage state from an API login instead of the UI."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from requests.structures import CaseInsensitiveDict
+from robot.api import logger
+from robot.api.deco import keyword, library
+
+import variables.api_config as api
+from libraries.api.api_client import ApiClientLibrary
+from libraries.api.endpoints.base_api_library import BaseApiLibrary
+from variables.env import SALES_PORTAL_URL, STORAGE_STATE_PATH, USER_NAME, USER_PASSWORD
+
+# The frontend keeps the bearer token in this cookie and the logged-in user under this localStorage key
+_AUTH_COOKIE = "Authorization"
+_USER_KEY = "user"
+# Reused state must stay valid at least this long — a full UI run should not outlive its token
+_MIN_TOKEN_TTL_SECONDS = 30 * 60
+
+
+def token_expiry(token: str) -> float | None:
+    """Return the ``exp`` claim of a JWT as a Unix timestamp, or ``None`` if it cannot be read.
+
+    The signature is not verified — the backend does that; this only avoids reusing a token that is
+    about to expire.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError, binascii.Error):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def build_storage_state(token: str, user: dict[str, Any], frontend_url: str) -> dict[str, Any]:
+    """Return a Playwright ``storageState`` equal to what the sign-in page leaves behind.
+
+    The sign-in page sets ``document.cookie = "Authorization=<token>"`` and
+    ``localStorage.user = JSON.stringify(User)`` on the frontend origin.
+    """
+    parts = urlsplit(frontend_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    expiry = token_expiry(token)
+    return {
+        "cookies": [
+            {
+                "name": _AUTH_COOKIE,
+                "value": token,
+                "domain": parts.hostname or "localhost",
+                "path": "/",
+                "expires": expiry if expiry is not None else -1,
+                "httpOnly": False,
+                "secure": parts.scheme == "https",
+                "sameSite": "Lax",
+            }
+        ],
+        "origins": [
+            {
+                "origin": origin,
+                "localStorage": [{"name": _USER_KEY, "value": json.dumps(user, separators=(",", ":"))}],
+            }
+        ],
+    }
+
+
+def read_reusable_state(path: Path, frontend_url: str, min_ttl: float) -> tuple[str, dict[str, Any]] | None:
+    """Return ``(token, user)`` from an existing state file if it targets *frontend_url* and is fresh enough."""
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+        token = next(c["value"] for c in state["cookies"] if c["name"] == _AUTH_COOKIE)
+        origin = next(o for o in state["origins"] if frontend_url.startswith(o["origin"]))
+        user = json.loads(next(i["value"] for i in origin["localStorage"] if i["name"] == _USER_KEY))
+    except (OSError, ValueError, KeyError, TypeError, StopIteration):
+        return None
+    expiry = token_expiry(token)
+    if expiry is None or expiry - time.time() < min_ttl or not isinstance(user, dict):
+        return None
+    return token, user
+
+
+def ensure_storage_state(
+    client: ApiClientLibrary,
+    path: Path,
+    frontend_url: str,
+    username: str,
+    password: str,
+    force: bool = False,
+    min_ttl: float = _MIN_TOKEN_TTL_SECONDS,
+) -> bool:
+    """Write a storage state for *username* to *path* unless a valid one exists; return ``True`` if written.
+
+    An existing file is reused only when its token is far enough from expiry and the backend still
+    accepts it (a logout revokes the token server-side before it expires).
+    """
+    if not force:
+        reusable = read_reusable_state(path, frontend_url, min_ttl)
+        if reusable is not None:
+            token, user = reusable
+            probe = client.send_api_request("GET", api.user_by_id(user["_id"]), token=token, use_cache=False)
+            if probe.status == 200:
+                return False
+
+    response = client.send_api_request("POST", api.LOGIN, body={"username": username, "password": password})
+    if response.status != 200:
+        raise AssertionError(f"API login as '{username}' failed with status {response.status}: {response.body}")
+    token = CaseInsensitiveDict(response.headers)[_AUTH_COOKIE]
+    state = build_storage_state(token, response.body["User"], frontend_url)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    tmp.replace(path)  # atomic, so parallel workers never read a half-written file
+    return True
+
+
+@library(scope="GLOBAL")
+class StorageStateLibrary(BaseApiLibrary):
+    """Keywords for creating the browser auth state without driving the login form."""
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("Create Storage State From API Login")
+    def create_storage_state_from_api_login(
+        self,
+        path: str = STORAGE_STATE_PATH,
+        username: str = USER_NAME,
+        password: str = USER_PASSWORD,
+        frontend_url: str = SALES_PORTAL_URL,
+        force: bool = False,
+    ) -> str:
+        """Log in via ``POST /api/login`` and write a Playwright storage state file; return its path.
+
+        The file holds the ``Authorization`` cookie and the ``user`` localStorage entry the frontend
+        expects, so ``New Context    storageState=...`` opens the portal already signed in.  A still-valid
+        file is reused unless ``force`` is true.
+
+        Args:
+            path: Target file; defaults to ``STORAGE_STATE_PATH``.
+            username: Login e-mail; defaults to ``USER_NAME``.
+            password: Login password; defaults to ``USER_PASSWORD``.
+            frontend_url: Frontend base URL the state is scoped to; defaults to ``SALES_PORTAL_URL``.
+            force: Always log in again and overwrite the file.
+
+        Returns:
+            The absolute path of the storage state file.
+        """
+        target = Path(path).resolve()
+        written = ensure_storage_state(self._client, target, frontend_url, username, password, force=force)
+        logger.info(f"{'Created' if written else 'Reused'} storage state {target}")
+        return str(target)
@@ -0,0 +1,153 @@
+"""RF keyword library that keeps a Playwright trace per test and writes it to the output dir only on failure."""
+
+from __future__ import annotations
+
+import re
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+from variables.env import TRACE_ON_FAILURE
+
+_UNSAFE_CHARS = re.compile(r"[^\w.-]+")
+
+
+@dataclass
+class _TracedContext:
+    context_id: str
+    pending: Path
+    options: dict[str, Any]
+
+
+@library(scope="SUITE")
+class TraceOnFailureLibrary:
+    """Per-test trace chunks for UI suites, saved to ``${OUTPUT DIR}/traces`` only when a test fails.
+
+    Browser Library records a trace per context and writes it when the context is closed.  Contexts
+    opened with ``New Traced Context`` trace into a pending file; at the end of each test the context is
+    closed with ``save_trace`` set to the test's failure status, so passing tests never write anything.
+    A suite-level context (opened in suite setup) is then replaced with a fresh traced context, which
+    bounds every trace to a single test.  The replacement is opened after Browser's own end-of-test
+    auto-closing has run, so Browser does not close it again.
+
+    With ``TRACE_ON_FAILURE`` off the keywords behave like plain ``New Context`` / ``Close Context``.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+    BROWSER_LIBRARY_NAME = "Browser"
+    TRACES_DIR = "traces"
+
+    def __init__(self, enabled: bool = TRACE_ON_FAILURE) -> None:
+        self._enabled = enabled
+        # A suite-level context outlives a test and is swapped for a fresh one after each test
+        self._suite_context: _TracedContext | None = None
+        self._test_context: _TracedContext | None = None
+        self._test_name: str | None = None
+        self.ROBOT_LIBRARY_LISTENER = self
+
+    # ------------------------------------------------------------------
+    # Public RF keywords
+    # ------------------------------------------------------------------
+
+    @keyword("New Traced Context")
+    def new_traced_context(self, **options: Any) -> str:
+        """Open a browser context like ``New Context``; trace it when ``TRACE_ON_FAILURE`` is on.
+
+        Opened outside a test (suite setup), the context is recycled after every test; opened inside a
+        test, it is closed at the end of that test unless ``Close Traced Context`` did so already.
+
+        Args:
+            options: ``New Context`` arguments, e.g. ``storageState=${path}``.
+
+        Returns:
+            The context id.
+        """
+        if not self._enabled:
+            return str(self._run_browser_keyword("New Context", options))
+        pending = self._traces_dir() / f".pending-{uuid.uuid4().hex}.zip"
+        context_id = str(self._run_browser_keyword("New Context", {**options, "tracing": str(pending)}))
+        traced = _TracedContext(context_id, pending, options)
+        if self._test_name is None:
+            self._suite_context = traced
+        else:
+            self._test_context = traced
+        return context_id
+
+    @keyword("Close Traced Context")
+    def close_traced_context(self) -> None:
+        """Close the current context; its trace is kept only if the current test has failed."""
+        traced = self._test_context
+        if traced is None:
+            self._run_browser_keyword("Close Context", {})
+            return
+        self._test_context = None
+        failed = BuiltIn().get_variable_value("${TEST STATUS}") == "FAIL"
+        self._close_traced(traced, failed)
+
+    # ------------------------------------------------------------------
+    # Library listener (API v3)
+    # ------------------------------------------------------------------
+
+    def start_test(self, data: Any, result: Any) -> None:
+        self._test_name = result.full_name
+
+    def end_test(self, data: Any, result: Any) -> None:
+        if self._test_context is not None:
+            self._close_traced(self._test_context, bool(result.failed))
+            self._test_context = None
+        suite_context = self._suite_context
+        if suite_context is not None:
+            self._close_traced(suite_context, bool(result.failed))
+        self._test_name = None
+        if suite_context is not None:
+            self.new_traced_context(**suite_context.options)
+            self._run_browser_keyword("New Page", {"url": "about:blank"})
+
+    def end_suite(self, data: Any, result: Any) -> None:
+        traced = self._suite_context
+        self._suite_context = None
+        if traced is None:
+            return
+        if traced.context_id in self._open_context_ids():
+            self._run_browser_keyword(
+                "Close Context", {"context": traced.context_id, "browser": "ALL", "save_trace": False}
+            )
+        traced.pending.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _close_traced(self, traced: _TracedContext, failed: bool) -> None:
+        # Browser's auto-closing may already have closed (and saved) a context opened during the test
+        if traced.context_id in self._open_context_ids():
+            self._run_browser_keyword(
+                "Close Context", {"context": traced.context_id, "browser": "ALL", "save_trace": failed}
+            )
+        if not failed or not traced.pending.exists():
+            traced.pending.unlink(missing_ok=True)
+            return
+        name = _UNSAFE_CHARS.sub("_", self._test_name or traced.context_id)
+        target = traced.pending.with_name(f"{name}.zip")
+        if target.exists():
+            target = target.with_name(f"{name}-{_UNSAFE_CHARS.sub('_', traced.context_id)}.zip")
+        traced.pending.replace(target)
+        logger.info(f'Trace of failed test: <a href="{target.as_uri()}">{target.name}</a>', html=True)
+        logger.console(f"Trace saved: {target}  (open with 'rfbrowser show-trace {target}')")
+
+    def _traces_dir(self) -> Path:
+        directory = Path(BuiltIn().get_variable_value("${OUTPUT DIR}")) / self.TRACES_DIR
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    def _open_context_ids(self) -> list[str]:
+        ids: list[str] = self._run_browser_keyword("Get Context Ids", {"context": "ALL", "browser": "ALL"})
+        return ids
+
+    def _run_browser_keyword(self, name: str, named: dict[str, Any]) -> Any:
+        return BuiltIn().run_keyword(f"{self.BROWSER_LIBRARY_NAME}.{name}", *(f"{k}={v}" for k, v in named.items()))
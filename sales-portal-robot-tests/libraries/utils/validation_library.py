@@ -2,10 +2,54 @@
 
 from __future__ import annotations
 
+import copy
+import json
+import random
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
 import jsonschema
+from robot.api import logger
 from robot.api.deco import keyword, library
 
+from data.schemas.compiled import LazySchema
 from libraries.api.response import ApiResponse
+from libraries.api.response_models import parse_response
+from variables.env import (
+    DEFER_SCHEMA_VALIDATION,
+    SCHEMA_EXHAUSTIVE_IN_BACKGROUND,
+    SCHEMA_ITEM_COUNT,
+    SCHEMA_ITEM_MODE,
+    SCHEMA_VALIDATION_WORKERS,
+)
+
+# How ``Validate Response`` picks the items of list payloads it schema-checks on the spot
+ITEM_MODES = ("all", "sample", "edges")
+
+
+@dataclass(frozen=True)
+class _Step:
+    """A keyword call on the listener's stack."""
+
+    name: str
+    source: str | Path | None
+    lineno: int | None
+
+
+@dataclass(frozen=True)
+class _DeferredCheck:
+    """A schema check queued by ``Validate Response`` and the step that queued it."""
+
+    step: str
+    request: str
+    schema: str
+    result: Future[str | None]
+
+    def describe(self, error: str) -> str:
+        return f"{self.step}\n      {self.request} vs {self.schema}: {error}"
 
 
 @library(scope="GLOBAL")
@@ -15,8 +59,42 @@ class ValidationLibrary:
     All assertion failures are gathered and raised as a single
     ``AssertionError`` at the end of ``Validate Response``, mirroring the
     ``pytest-check`` / ``assertpy`` soft-assertion behaviour.
+
+    With ``defer_schemas`` (``DEFER_SCHEMA_VALIDATION``) the schema check of ``Validate Response``
+    inside a test is queued to ``workers`` background threads instead of running on the test's
+    critical path; status and ``IsSuccess`` are still checked on the spot.  Queued failures are
+    raised by ``Schema Validation Checkpoint`` or, at the latest, fail the test when it ends — each
+    one names the keyword chain and ``file:line`` of the ``Validate Response`` call that queued it.
+
+    For list responses with tens of thousands of items the on-the-spot check can be bounded with
+    ``item_mode``: the envelope is always validated in full, but of each top-level list only a
+    deterministic random ``sample`` of ``item_count`` items or its first and last ``item_count``
+    (``edges``) are checked.  The policy and the picked items are logged.  With
+    ``exhaustive_in_background`` a bounded check that passed queues the full check as a deferred one.
     """
 
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(
+        self,
+        defer_schemas: bool = DEFER_SCHEMA_VALIDATION,
+        workers: int = SCHEMA_VALIDATION_WORKERS,
+        item_mode: str = SCHEMA_ITEM_MODE,
+        item_count: int = SCHEMA_ITEM_COUNT,
+        exhaustive_in_background: bool = SCHEMA_EXHAUSTIVE_IN_BACKGROUND,
+    ) -> None:
+        self._defer_schemas = defer_schemas
+        self._workers = max(1, int(workers))
+        self._item_mode = _item_mode(item_mode)
+        self._item_count = _item_count(self._item_mode, item_count)
+        self._exhaustive_in_background = exhaustive_in_background
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[_DeferredCheck] = []
+        # Name of the running test (None in suite setup/teardown) and its keyword stack, from the listener
+        self._test: str | None = None
+        self._keywords: list[_Step] = []
+        self.ROBOT_LIBRARY_LISTENER = self
+
     # ------------------------------------------------------------------
     # Public RF keywords
     # ------------------------------------------------------------------
@@ -26,20 +104,34 @@ class ValidationLibrary:
         self,
         response: ApiResponse,
         expected_status: int,
-        schema: dict | None = None,  # type: ignore[type-arg]
+        schema: Mapping[str, Any] | None = None,
+        defer: bool | None = None,
+        items: str | None = None,
+        item_count: int | None = None,
     ) -> None:
         """Soft-assert HTTP status, ``IsSuccess``, ``ErrorMessage``, and optional JSON schema.
 
         Args:
             response: An ``ApiResponse`` instance returned by ``Send API Request``.
             expected_status: The expected HTTP status code (e.g. 200, 201, 400).
-            schema: Optional JSON Schema dict.  When provided the response body
-                    is validated against it and any violation is appended to the
-                    error list.
+            schema: Optional JSON Schema, usually a generated ``LazySchema`` from
+                    ``data/schemas`` (validated with its cached validator) or a
+                    plain dict.  Any violation is appended to the error list.
+            defer: Queue the schema check to the background pool; defaults to the
+                   library's ``defer_schemas``.  Ignored outside a test (suite
+                   setup and teardown validate on the spot).  Queued checks
+                   always cover every item.
+            items: Items of top-level lists checked on the spot — ``all``,
+                   ``sample`` or ``edges``; defaults to the library's ``item_mode``.
+            item_count: Sample size, or items taken from each end for ``edges``;
+                        defaults to the library's ``item_count``.  Must be at
+                        least 1 with ``sample`` and ``edges``.
 
         Raises:
             AssertionError: If any of the checked conditions fail; the message
                             contains *all* individual failures.
+            ValueError: If *items* is unknown, or *item_count* is below 1 for a
+                        bounded mode.
         """
         errors: list[str] = []
 
@@ -58,29 +150,225 @@ class ValidationLibrary:
             if response.body.get("IsSuccess", True):
                 errors.append(f"Expected IsSuccess=False on error response, got: {response.body.get('IsSuccess')}")
 
-        # 3 — optional JSON Schema validation
-        if schema is not None:
+        # 3 — optional JSON Schema validation, on the spot or queued
+        if schema is not None and self._should_defer(defer):
+            self._defer(response, schema)
+        elif schema is not None:
+            mode = _item_mode(items or self._item_mode)
+            count = self._item_count if item_count is None else _item_count(mode, item_count)
+            selection = _select_items(response, mode, count)
             try:
-                jsonschema.validate(instance=response.body, schema=schema)
+                _validate_schema(_with_items(response.body, selection), schema)
             except jsonschema.ValidationError as exc:
-                errors.append(f"JSON schema validation failed: {exc.message}")
+                errors.append(f"JSON schema validation failed: {exc.message}{_item_location(exc, selection)}")
+            else:
+                if selection and self._exhaustive_in_background and self._should_defer(True):
+                    self._defer(response, schema)
 
         if errors:
             raise AssertionError("Response validation failed:\n" + "\n".join(f"  - {e}" for e in errors))
 
+    @keyword("Schema Validation Checkpoint")
+    def schema_validation_checkpoint(self) -> None:
+        """Wait for the schema checks queued so far in this test and fail on any that did not pass.
+
+        Place it where later steps rely on the shape of earlier responses; without it queued
+        failures fail the test when it ends.
+
+        Raises:
+            AssertionError: Listing every failed check with the step that queued it.
+        """
+        failures = self._collect()
+        if failures:
+            raise AssertionError(failures)
+
     @keyword("Validate Json Schema")
     def validate_json_schema(
         self,
         body: dict,  # type: ignore[type-arg]
-        schema: dict,  # type: ignore[type-arg]
+        schema: Mapping[str, Any],
     ) -> None:
-        """Validate *body* against a JSON Schema *schema* dict.
+        """Validate *body* against a JSON Schema *schema*.
 
         Args:
             body: The dict to validate (typically ``response.body``).
-            schema: A JSON Schema expressed as a Python dict.
+            schema: A generated ``LazySchema`` or a JSON Schema expressed as a Python dict.
 
         Raises:
             ``jsonschema.ValidationError``: if the body does not conform to the schema.
         """
+        _validate_schema(body, schema)
+
+    @keyword("Parse Response As Model")
+    def parse_response_as_model(self, response: ApiResponse, model: str, key: str | None = None) -> Any:
+        """Validate the response payload into a ``data.models`` model straight from the raw bytes.
+
+        Replaces ``json`` decoding plus ``Validate Json Schema`` for the payload: the model checks
+        types and required fields, and the result is read as ``${order.status}``,
+        ``${order.products[0].name}`` instead of ``${resp.body["Order"]["products"]}``.
+
+        Args:
+            response: An ``ApiResponse`` instance returned by ``Send API Request``.
+            model: Model name in ``data.models``, e.g. ``Order``, ``Product``, ``Customer``.
+            key: Envelope key holding the payload; defaults to the model name.
+
+        Raises:
+            AssertionError: If the payload is missing or does not match the model.
+        """
+        return parse_response(response, model, key)
+
+    @keyword("Parse Response As Model List")
+    def parse_response_as_model_list(
+        self, response: ApiResponse, model: str, key: str | None = None
+    ) -> list[Any]:
+        """Like ``Parse Response As Model`` for list payloads; *key* defaults to the model name plus ``s``."""
+        parsed: list[Any] = parse_response(response, model, key, many=True)
+        return parsed
+
+    # ------------------------------------------------------------------
+    # Library listener (API v3)
+    # ------------------------------------------------------------------
+
+    def start_test(self, data: Any, result: Any) -> None:
+        self._test = str(data.name)
+        self._keywords = []
+
+    def start_keyword(self, data: Any, result: Any) -> None:
+        if self._test is not None:
+            name = getattr(result, "full_name", None) or getattr(data, "name", "?")
+            self._keywords.append(_Step(str(name), getattr(data, "source", None), getattr(data, "lineno", None)))
+
+    def end_keyword(self, data: Any, result: Any) -> None:
+        if self._keywords:
+            self._keywords.pop()
+
+    def end_test(self, data: Any, result: Any) -> None:
+        self._test = None
+        self._keywords = []
+        failures = self._collect()
+        if not failures:
+            return
+        result.message = f"{result.message}\n\nAlso: {failures}" if result.failed else failures
+        result.status = "FAIL"
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _should_defer(self, defer: bool | None) -> bool:
+        return (self._defer_schemas if defer is None else defer) and self._test is not None
+
+    def _defer(self, response: ApiResponse, schema: Mapping[str, Any]) -> None:
+        """Queue the schema check of *response*, recording the step that asked for it."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="schema-check")
+        # The worker decodes its own copy, so the test may change response.body meanwhile
+        payload: bytes | Any = response.content or copy.deepcopy(response.body)
+        self._pending.append(
+            _DeferredCheck(
+                step=self._call_site(),
+                request=f"{response.method} {response.url} ({response.status})",
+                schema=getattr(schema, "name", "schema"),
+                result=self._executor.submit(_schema_error, payload, schema),
+            )
+        )
+
+    def _call_site(self) -> str:
+        """Return ``Test > Keyword > ... (file:line)`` for the ``Validate Response`` step being run."""
+        chain = " > ".join([self._test or "?", *(step.name for step in self._keywords[:-1])])
+        if not self._keywords or self._keywords[-1].lineno is None:
+            return chain
+        call = self._keywords[-1]
+        return f"{chain} ({Path(call.source or '').name}:{call.lineno})"
+
+    def _collect(self) -> str:
+        """Wait for the queued checks and return the failure report, empty when all of them passed."""
+        pending, self._pending = self._pending, []
+        failed: list[str] = []
+        for check in pending:
+            error = check.result.result()
+            if error is not None:
+                failed.append(check.describe(error))
+        if pending:
+            logger.debug(f"{len(pending)} deferred schema check(s) done, {len(failed)} failed")
+        if not failed:
+            return ""
+        return f"Deferred schema validation failed in {len(failed)} step(s):\n" + "\n".join(
+            f"  - {failure}" for failure in failed
+        )
+
+
+def _item_mode(mode: str) -> str:
+    mode = mode.strip().lower()
+    if mode not in ITEM_MODES:
+        raise ValueError(f"Unknown item mode '{mode}'; expected one of: {', '.join(ITEM_MODES)}")
+    return mode
+
+
+def _item_count(mode: str, count: int | str) -> int:
+    count = int(count)
+    if mode != "all" and count < 1:
+        raise ValueError(f"Item mode '{mode}' needs an item count of at least 1, got {count}")
+    return count
+
+
+def _select_items(response: ApiResponse, mode: str, count: int) -> dict[str, list[int]]:
+    """Return the indices to check of every top-level list of *response* longer than *mode* allows."""
+    if mode == "all" or not isinstance(response.body, dict):
+        return {}
+    selection: dict[str, list[int]] = {}
+    for key, value in response.body.items():
+        if not isinstance(value, list) or len(value) <= (count if mode == "sample" else 2 * count):
+            continue
+        total = len(value)
+        if mode == "sample":
+            # Seeded by the request and list size, so a rerun checks the same items
+            seed = f"{response.method} {response.url} {key} {total}"
+            selection[key] = sorted(random.Random(seed).sample(range(total), count))
+            policy = f"a random sample of {count} (seed '{seed}')"
+        else:
+            selection[key] = [*range(count), *range(total - count, total)]
+            policy = f"the first and last {count}"
+        shown = ", ".join(map(str, selection[key][:20])) + (", ..." if len(selection[key]) > 20 else "")
+        logger.info(f"Schema-checking {policy} of {total} '{key}' items: [{shown}]")
+    return selection
+
+
+def _with_items(body: Any, selection: dict[str, list[int]]) -> Any:
+    """Return *body* with each selected list cut down to its selected items (a shallow copy)."""
+    if not selection:
+        return body
+    return {**body, **{key: [body[key][index] for index in indices] for key, indices in selection.items()}}
+
+
+def _item_location(error: jsonschema.ValidationError, selection: dict[str, list[int]]) -> str:
+    """Point a failure inside a cut-down list at the item's index in the full response."""
+    path = list(error.absolute_path)
+    if len(path) < 2 or path[0] not in selection or not isinstance(path[1], int):
+        return ""
+    return f" (at {path[0]}[{selection[path[0]][path[1]]}])"
+
+
+def _schema_error(payload: bytes | Any, schema: Mapping[str, Any]) -> str | None:
+    """Run a queued schema check on a worker thread; return its failure message or ``None``."""
+    try:
+        _validate_schema(json.loads(payload) if isinstance(payload, bytes) else payload, schema)
+    except jsonschema.ValidationError as exc:
+        return f"JSON schema validation failed: {exc.message}"
+    except Exception as exc:  # reported like a failed check instead of being lost on the worker
+        return f"Schema check could not run: {exc!r}"
+    return None
+
+
+def _validate_schema(body: Any, schema: Mapping[str, Any]) -> None:
+    """Raise the best-matching ``ValidationError``, like ``jsonschema.validate``, without re-checking the schema."""
+    if isinstance(schema, LazySchema):
+        error = jsonschema.exceptions.best_match(schema.validator.iter_errors(body))
+        if error is not None:
+            raise error
+    else:
         jsonschema.validate(instance=body, schema=schema)
@@ -0,0 +1,65 @@
+"""Benchmark: per-test ``Full Delete Entities`` teardown vs suite-level snapshot/restore isolation.
+
+Runs the given suites twice with ``python -m robot`` — once with ``DB_ISOLATION=teardown`` and once with
+``DB_ISOLATION=snapshot`` — and reads both ``output.xml`` files.  For each mode it reports the total
+run time, the time spent in test teardowns and the time spent in the snapshot/restore keywords
+(both restores happen outside any keyword, so their cost is part of the suite's elapsed time only).
+
+Usage (from the project root, backend and MongoDB running, ``mongo`` extra installed)::
+
+    python scripts/benchmarks/bench_db_isolation.py [suite ...]   # default: tests/api/orders
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from robot.api import ExecutionResult, ResultVisitor
+from robot.result import TestCase
+
+_ROOT = Path(__file__).resolve().parents[2]
+_MODES = ("teardown", "snapshot")
+
+
+class _TeardownTime(ResultVisitor):  # type: ignore[misc]
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.tests = 0
+        self.failed = 0
+
+    def visit_test(self, test: TestCase) -> None:
+        self.tests += 1
+        self.failed += int(test.failed)
+        if test.has_teardown:
+            self.seconds += test.teardown.elapsed_time.total_seconds()
+
+
+def _run(mode: str, suites: list[str], output_dir: Path) -> dict[str, float]:
+    output = output_dir / f"output-{mode}.xml"
+    command = [sys.executable, "-m", "robot", "--output", str(output), "--report", "NONE", "--log", "NONE",
+               "--console", "dotted", "--exclude", "setup", *suites]
+    start = time.perf_counter()
+    subprocess.run(command, cwd=_ROOT, env={**os.environ, "DB_ISOLATION": mode}, check=False)
+    wall = time.perf_counter() - start
+    teardowns = _TeardownTime()
+    ExecutionResult(str(output)).visit(teardowns)
+    return {"wall": wall, "teardown": teardowns.seconds, "tests": teardowns.tests, "failed": teardowns.failed}
+
+
+def main() -> None:
+    suites = sys.argv[1:] or ["tests/api/orders"]
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = {mode: _run(mode, suites, Path(tmp)) for mode in _MODES}
+    print(f"\n{'mode':<9} {'tests':>5} {'failed':>6} {'total':>9} {'test teardowns':>15}")
+    for mode, row in rows.items():
+        print(f"{mode:<9} {row['tests']:>5.0f} {row['failed']:>6.0f} {row['wall']:>8.1f}s {row['teardown']:>14.1f}s")
+    saved = rows["teardown"]["wall"] - rows["snapshot"]["wall"]
+    print(f"snapshot isolation saved {saved:.1f}s ({saved / rows['teardown']['wall']:.0%} of the teardown run)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Microbenchmark: per-keyword overhead of the endpoint libraries, without network I/O.
+
+Runs an in-memory Robot Framework suite in which ``ApiClient`` is replaced by a client that returns a
+canned response, so the measured time is pure keyword dispatch + client resolution.  Compares the
+cached ``BaseApiLibrary._client`` with the former per-call ``BuiltIn().get_library_instance()`` lookup.
+
+Usage (from the project root)::
+
+    python scripts/benchmarks/bench_endpoint_overhead.py [iterations]
+"""
+from __future__ import annotations
+
+import io
+import sys
+import time
+from pathlib import Path
+from typing import cast
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path[:0] = [str(_ROOT), str(Path(__file__).resolve().parent)]
+
+from robot.api import TestSuite  # noqa: E402
+from robot.api.deco import keyword, library  # noqa: E402
+from robot.libraries.BuiltIn import BuiltIn  # noqa: E402
+
+from libraries.api.api_client import ApiClientLibrary  # noqa: E402
+from libraries.api.endpoints.products_api_library import ProductsApiLibrary  # noqa: E402
+from libraries.api.response import ApiResponse  # noqa: E402
+
+_CANNED = ApiResponse(status=200, body={"IsSuccess": True, "ErrorMessage": None, "Product": {}})
+
+
+class OfflineApiClient(ApiClientLibrary):
+    """ApiClient stand-in that skips the network so only keyword overhead is measured."""
+
+    def send_api_request(self, *args: object, **kwargs: object) -> ApiResponse:
+        return _CANNED
+
+
+@library(scope="SUITE")
+class UncachedProductsApi(ProductsApiLibrary):
+    """Products library with the pre-cache behaviour: one namespace lookup per request."""
+
+    @property
+    def _client(self) -> ApiClientLibrary:
+        return cast(ApiClientLibrary, BuiltIn().get_library_instance("ApiClient"))
+
+
+@library(scope="GLOBAL")
+class LookupTimer:
+    """Times the bare client resolution inside a live execution context."""
+
+    @keyword("Time Client Resolution")
+    def time_client_resolution(self, iterations: int) -> None:
+        n = int(iterations)
+        start = time.perf_counter()
+        for _ in range(n):
+            BuiltIn().get_library_instance("ApiClient")
+        lookup = (time.perf_counter() - start) / n
+        cached = cast(ProductsApiLibrary, BuiltIn().get_library_instance("ProductsApi"))
+        start = time.perf_counter()
+        for _ in range(n):
+            cached._client  # noqa: B018
+        attribute = (time.perf_counter() - start) / n
+        print(f"get_library_instance(): {lookup * 1e6:8.2f} us/call", file=sys.__stdout__)
+        print(f"cached _client:         {attribute * 1e6:8.2f} us/call", file=sys.__stdout__)
+
+
+def _build_suite(iterations: int) -> TestSuite:
+    suite = TestSuite("Endpoint Overhead")
+    suite.resource.imports.library("bench_endpoint_overhead.OfflineApiClient", alias="ApiClient")
+    suite.resource.imports.library("libraries/api/endpoints/products_api_library.py", alias="ProductsApi")
+    suite.resource.imports.library("bench_endpoint_overhead.UncachedProductsApi", alias="UncachedApi")
+    suite.resource.imports.library("bench_endpoint_overhead.LookupTimer")
+    for name, kw in (("Cached", "ProductsApi.Get Product By Id"), ("Uncached", "UncachedApi.Get Product By Id")):
+        test = suite.tests.create(name)
+        loop = test.body.create_for(assign=["${_}"], flavor="IN RANGE", values=[str(iterations)])
+        loop.body.create_keyword(kw, args=["token", "id"])
+    suite.tests.create("Resolution").body.create_keyword("Time Client Resolution", args=[str(iterations)])
+    return suite
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    result = _build_suite(iterations).run(output=None, stdout=io.StringIO(), console="none")
+    for test in result.suite.tests:
+        if test.status != "PASS":
+            raise SystemExit(f"{test.name} failed: {test.message}")
+        if test.name != "Resolution":
+            per_call = test.elapsed_time.total_seconds() / iterations
+            print(f"{test.name:<9} keyword:      {per_call * 1e6:8.2f} us/call ({iterations} calls)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark: concurrent product creation over pooled HTTP/1.1 vs multiplexed HTTP/2.
+
+Logs in against the configured backend (``SALES_PORTAL_API_URL``), creates ``count`` products with
+``workers`` threads through ``Send API Requests Concurrently`` once per transport, and deletes them
+again (cleanup is not timed).  The HTTP/2 run needs the ``http2`` extra; against a plain ``http://``
+backend it uses h2c prior knowledge, so a server without cleartext HTTP/2 support is reported as such.
+
+Usage (from the project root, backend running)::
+
+    python scripts/benchmarks/bench_http2.py [count] [workers]
+"""
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT))
+
+import requests  # noqa: E402
+from requests.structures import CaseInsensitiveDict  # noqa: E402
+
+import variables.api_config as api  # noqa: E402
+from data.generators.generate_product_data import generate_product_data  # noqa: E402
+from libraries.api.api_client import ApiClientLibrary  # noqa: E402
+from libraries.api.routes import ROUTES  # noqa: E402
+from variables.env import CREDENTIALS  # noqa: E402
+
+
+def _login(client: ApiClientLibrary) -> str:
+    response = client.send_api_request("POST", api.LOGIN, body=CREDENTIALS)
+    if response.status != 200:
+        raise SystemExit(f"Login failed with status {response.status}: {response.body}")
+    return str(CaseInsensitiveDict(response.headers)["Authorization"])
+
+
+def _run(client: ApiClientLibrary, token: str, count: int, workers: int) -> dict[str, Any]:
+    bodies = [generate_product_data().model_dump(exclude_none=True) for _ in range(count)]
+    request_list = [{"method": "POST", "url": api.PRODUCTS, "token": token, "body": body} for body in bodies]
+    client.reset_api_client_stats()
+    start = time.perf_counter()
+    responses = client.send_api_requests_concurrently(request_list, max_workers=workers)
+    elapsed = time.perf_counter() - start
+    stats = client.get_api_client_stats()
+
+    created = [r.body["Product"]["_id"] for r in responses if r.status == 201]
+    client.send_api_requests_concurrently(
+        [{"method": "DELETE", "url": api.product_by_id(pid), "token": token} for pid in created],
+        max_workers=workers,
+    )
+    route = stats["routes"].get(ROUTES.get("products.create").key, {})
+    return {
+        "elapsed": elapsed,
+        "ok": len(created),
+        "avg_ms": route.get("avg_ms", 0.0),
+        "protocols": stats["transport"]["protocols"],
+    }
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    rounds = 3
+
+    client = ApiClientLibrary()
+    client.configure_api_retries(attempts=1)
+    token = _login(client)
+    prior_knowledge = api.LOGIN.startswith("http://")
+
+    print(f"{count} concurrent product creations, {workers} workers, best/median of {rounds} rounds")
+    print(f"{'transport':<12} {'protocols':<22} {'best s':>8} {'median s':>9} {'req/s':>8} {'avg ms':>8}")
+    for mode in ("HTTP/1.1", "HTTP/2"):
+        if mode == "HTTP/1.1":
+            client.use_http1_transport(pool_maxsize=workers)
+        elif not client.use_http2_transport(prior_knowledge=prior_knowledge):
+            print(f"{mode:<12} skipped — install the http2 extra: pip install -e '.[http2]'")
+            continue
+        try:
+            results = [_run(client, token, count, workers) for _ in range(rounds)]
+        except requests.ConnectionError as exc:
+            print(f"{mode:<12} failed — {exc}")
+            continue
+        times = sorted(r["elapsed"] for r in results)
+        protocols = ",".join(f"{k}={v}" for k, v in results[-1]["protocols"].items())
+        print(
+            f"{mode:<12} {protocols:<22} {times[0]:>8.3f} {statistics.median(times):>9.3f} "
+            f"{count / times[0]:>8.1f} {statistics.median(r['avg_ms'] for r in results):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark: reading an orders list response — ``json`` + ``jsonschema`` vs Pydantic models from the raw bytes.
+
+Builds a ``GET /api/orders`` style response body (orders with line items, a delivery, a comment and a
+history entry) that satisfies both ``GET_ALL_ORDERS_SCHEMA`` and the ``Order`` model, then times:
+
+* ``json.loads`` + ``jsonschema.validate`` — a plain-dict schema, re-checked and compiled on every call;
+* ``json.loads`` + the cached validator of the generated ``LazySchema`` — ``Validate Response``;
+* ``json.loads`` + ``TypeAdapter.validate_python`` — models on an already decoded ``dict``;
+* ``TypeAdapter.validate_json`` on the bytes — ``Parse Response As Model List``.
+
+No backend is needed.
+
+Usage (from the project root)::
+
+    python scripts/benchmarks/bench_response_parsing.py [orders] [iterations]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT))
+
+import jsonschema  # noqa: E402
+
+from data.generators.mock_data_builders import build_mock_customer, build_mock_order  # noqa: E402
+from data.schemas.orders.create_order_schema import GET_ALL_ORDERS_SCHEMA  # noqa: E402
+from libraries.api.response import ApiResponse  # noqa: E402
+from libraries.api.response_models import envelope_adapter, parse_response, resolve_model  # noqa: E402
+
+_PERFORMER = {
+    "_id": "6720b6f8a1b2c3d4e5f60718",
+    "username": "admin@example.com",
+    "firstName": "Admin",
+    "lastName": "Admin",
+    "roles": ["ADMIN"],
+    "createdOn": "2026/01/01 10:00:00",
+}
+
+
+def _order(index: int, products: int) -> dict[str, Any]:
+    line_items: list[dict[str, Any]] = [
+        {
+            "_id": f"{index:012x}{n:012x}",
+            "name": f"Product {index}-{n}",
+            "amount": 5,
+            "price": 100 + n,
+            "manufacturer": "Samsung",
+            "notes": "",
+            "received": False,
+        }
+        for n in range(products)
+    ]
+    customer = build_mock_customer(notes="")
+    total_price = sum(item["price"] for item in line_items)
+    delivery = {
+        "address": {"country": "USA", "city": "Boston", "street": "Main Street", "house": 10, "flat": 2},
+        "condition": "Delivery",
+        "finalDate": "2026-12-01T00:00:00.000Z",
+    }
+    history = {
+        "status": "Draft",
+        "customer": customer["_id"],
+        "products": line_items,
+        "total_price": total_price,
+        "delivery": delivery,
+        "assignedManager": None,
+        "changedOn": "2026-01-01T10:00:00.000Z",
+        "action": "Order created",
+        "performer": _PERFORMER,
+    }
+    comment = {"_id": f"{index:024x}", "text": "Call before delivery", "createdOn": "2026-01-01T10:05:00.000Z"}
+    return build_mock_order(
+        customer=customer,
+        products=line_items,
+        total_price=total_price,
+        delivery=delivery,
+        comments=[comment],
+        history=[history],
+    )
+
+
+def _time(run: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        run()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    body = {"IsSuccess": True, "ErrorMessage": None, "Orders": [_order(i, 3) for i in range(orders)]}
+    content = json.dumps(body).encode()
+    response = ApiResponse(status=200, body=body, content=content, method="GET", url="/api/orders")
+    adapter = envelope_adapter(resolve_model("Order"), "Orders", True)
+
+    plain_schema = dict(GET_ALL_ORDERS_SCHEMA)
+
+    def schema_path() -> None:
+        jsonschema.validate(instance=json.loads(content), schema=plain_schema)
+
+    def cached_schema_path() -> None:
+        GET_ALL_ORDERS_SCHEMA.validator.validate(json.loads(content))
+
+    def dict_models_path() -> None:
+        adapter.validate_python(json.loads(content))
+
+    def bytes_models_path() -> None:
+        parse_response(response, "Order", many=True)
+
+    # Both paths must accept the payload, otherwise the comparison is meaningless
+    cached_schema_path()
+    bytes_models_path()
+    print(f"{orders} orders, {len(content) / 1024:.0f} KiB, {iterations} iterations")
+    baseline = _time(schema_path, iterations)
+    for name, seconds in (
+        ("json.loads + jsonschema.validate", baseline),
+        ("json.loads + cached validator", _time(cached_schema_path, iterations)),
+        ("json.loads + validate_python", _time(dict_models_path, iterations)),
+        ("validate_json (bytes)", _time(bytes_models_path, iterations)),
+    ):
+        print(f"{name:<34} {seconds * 1000:9.2f} ms  {baseline / seconds:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
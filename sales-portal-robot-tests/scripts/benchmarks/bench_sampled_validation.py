@@ -0,0 +1,48 @@
+"""Benchmark: ``Validate Response`` on a huge orders list — every item vs a sample vs the first and last N.
+
+Builds a ``GET /api/orders`` style body with many orders (the same payload as
+``bench_response_parsing.py``) and times the schema check of ``Validate Response`` against
+``GET_ALL_ORDERS_SCHEMA`` with ``items=all``, ``items=sample`` and ``items=edges``.  The body is
+decoded once up front, as ``Send API Request`` does.  No backend is needed.
+
+Usage (from the project root)::
+
+    python scripts/benchmarks/bench_sampled_validation.py [orders] [item_count] [iterations]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT))
+
+from bench_response_parsing import _order  # noqa: E402
+
+from data.schemas.orders.create_order_schema import GET_ALL_ORDERS_SCHEMA  # noqa: E402
+from libraries.api.response import ApiResponse  # noqa: E402
+from libraries.utils.validation_library import ValidationLibrary  # noqa: E402
+
+
+def main() -> None:
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    item_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    iterations = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    body = {"IsSuccess": True, "ErrorMessage": None, "Orders": [_order(i, 3) for i in range(orders)]}
+    response = ApiResponse(status=200, body=body, method="GET", url="/api/orders")
+    validation = ValidationLibrary()
+
+    print(f"{orders} orders, item_count {item_count}, {iterations} iterations")
+    baseline = 0.0
+    for mode in ("all", "sample", "edges"):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            validation.validate_response(response, 200, GET_ALL_ORDERS_SCHEMA, items=mode, item_count=item_count)
+        seconds = (time.perf_counter() - start) / iterations
+        baseline = baseline or seconds
+        print(f"items={mode:<8} {seconds * 1000:10.2f} ms  {baseline / seconds:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
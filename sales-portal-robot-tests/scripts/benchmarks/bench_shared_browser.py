@@ -0,0 +1,145 @@
+"""Benchmark: N parallel UI workers each launching Chromium vs connecting to one shared browser server.
+
+Every worker is a real ``python -m robot`` process running a one-test suite that goes through
+``Open Or Connect Browser`` (``resources/ui/ui_suite_setup.resource``), opens a context and a page, and
+holds it for ``hold`` seconds so all workers are alive at once.  For each worker count the script
+reports the mean per-worker startup (process start until the page is open), the wall time, and the
+peak proportional set size (PSS) of the whole process tree — workers, their Browser node processes,
+browsers and, in shared mode, the browser server.  PSS is read from ``/proc``, so Linux only.
+
+Usage (from the project root, after ``rfbrowser init``)::
+
+    python scripts/benchmarks/bench_shared_browser.py [workers ...]   # default: 4 8 16
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT))
+
+from libraries.ui.browser_server import start_browser_server, stop_browser_server  # noqa: E402
+
+_HOLD_SECONDS = 3.0
+_SUITE = """*** Settings ***
+Library     Browser
+Resource    resources/ui/ui_suite_setup.resource
+
+*** Test Cases ***
+Open Page
+    ${started}=    Evaluate    float(os.environ["BENCH_STARTED"])    modules=os
+    Open Or Connect Browser
+    New Context
+    New Page    about:blank
+    ${startup}=    Evaluate    time.time() - ${started}    modules=time
+    Evaluate    open(os.environ["BENCH_RESULT"], "w").write(str(${startup}))    modules=os
+    Sleep    ${HOLD}
+    Close Browser
+"""
+
+
+def _children() -> dict[int, list[int]]:
+    tree: dict[int, list[int]] = {}
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        tree.setdefault(ppid, []).append(int(entry.name))
+    return tree
+
+
+def _tree_pss_kb(roots: list[int]) -> int:
+    tree = _children()
+    total, stack, seen = 0, list(roots), set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(tree.get(pid, []))
+        try:
+            rollup = Path(f"/proc/{pid}/smaps_rollup").read_text()
+        except OSError:
+            continue
+        total += next((int(line.split()[1]) for line in rollup.splitlines() if line.startswith("Pss:")), 0)
+    return total
+
+
+def _run(workers: int, endpoint: str, server_pid: int | None, work_dir: Path) -> dict[str, float]:
+    suite = work_dir / "bench_open_page.robot"
+    suite.write_text(_SUITE, encoding="utf-8")
+    results = [work_dir / f"startup-{index}.txt" for index in range(workers)]
+    start = time.perf_counter()
+    processes = []
+    for result in results:
+        env = {
+            **os.environ,
+            "BROWSER_WS_ENDPOINT": endpoint,
+            "BENCH_STARTED": str(time.time()),
+            "BENCH_RESULT": str(result),
+        }
+        command = [sys.executable, "-m", "robot", "--output", "NONE", "--report", "NONE", "--log", "NONE",
+                   "--console", "none", "--variable", f"HOLD:{_HOLD_SECONDS}", str(suite)]
+        processes.append(subprocess.Popen(command, cwd=_ROOT, env=env))
+
+    peak_kb = 0
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak_kb
+        roots = [process.pid for process in processes] + ([server_pid] if server_pid else [])
+        while not done.is_set():
+            peak_kb = max(peak_kb, _tree_pss_kb(roots))
+            time.sleep(0.2)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    failed = sum(process.wait() != 0 for process in processes)
+    done.set()
+    sampler.join()
+    wall = time.perf_counter() - start
+    if failed:
+        raise SystemExit(f"{failed}/{workers} workers failed")
+    startups = [float(result.read_text()) for result in results]
+    return {"startup": statistics.mean(startups), "wall": wall - _HOLD_SECONDS, "peak_mb": peak_kb / 1024}
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or [4, 8, 16]
+    state_path = Path(tempfile.gettempdir()) / "bench-shared-browser-server.json"
+    print(f"{'workers':>7}  {'mode':<8} {'startup/worker':>14} {'wall':>8} {'peak PSS':>10}")
+    for workers in counts:
+        rows = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            rows["private"] = _run(workers, "", None, Path(tmp))
+        server = start_browser_server(state_path)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                rows["shared"] = _run(workers, server["wsEndpoint"], int(server["pid"]), Path(tmp))
+        finally:
+            stop_browser_server(state_path)
+        for mode, row in rows.items():
+            print(
+                f"{workers:>7}  {mode:<8} {row['startup'] * 1000:>12.0f}ms {row['wall']:>7.2f}s "
+                f"{row['peak_mb']:>8.0f}MB"
+            )
+        private, shared = rows["private"], rows["shared"]
+        print(
+            f"{'':>7}  saved    {(private['startup'] - shared['startup']) * 1000:>12.0f}ms "
+            f"{private['wall'] - shared['wall']:>7.2f}s {private['peak_mb'] - shared['peak_mb']:>8.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: reading a 100-row orders table — per-cell / per-row ``Get Text`` vs ``Get Table As Records``.
+
+Renders a static copy of the orders list markup (same ``thead``/``tbody`` structure the frontend's
+``generateTableBootstrap`` produces) in headless Chromium, so no backend is needed.  Each strategy
+runs in its own test; the test's elapsed time is reported.
+
+Usage (from the project root, after ``rfbrowser init``)::
+
+    python scripts/benchmarks/bench_table_extraction.py [rows]
+"""
+from __future__ import annotations
+
+import io
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT))
+
+from robot.api import TestSuite  # noqa: E402
+
+_HEADERS = ["Order Number", "Email", "Price", "Delivery", "Status", "Assigned Manager", "Created On", "Actions"]
+_TABLE = "css=#table-orders"
+
+
+def _table_html(rows: int) -> str:
+    head = "".join(f"<th scope='col'><div><div>{h}</div></div></th>" for h in _HEADERS)
+    body = "".join(
+        f"<tr><td>{i:024x}</td><td>user{i}@example.com</td><td>${i * 10}</td><td>-</td><td>Draft</td>"
+        f"<td>-</td><td>2026/01/01 10:00:00</td><td><a title='Details'>Details</a></td></tr>"
+        for i in range(rows)
+    )
+    return f"<table id='table-orders'><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _build_suite(rows: int) -> TestSuite:
+    suite = TestSuite("Table Extraction")
+    suite.resource.imports.library("Browser")
+    suite.resource.imports.library("libraries/ui/browser_helpers.py", alias="BrowserHelpers")
+    suite.setup.config(name="Open Table Page", args=[_table_html(rows)])
+    suite.teardown.config(name="Close Browser")
+    open_page = suite.resource.keywords.create("Open Table Page", args=["${html}"])
+    open_page.body.create_keyword("New Browser", args=["chromium", "headless=True"])
+    open_page.body.create_keyword("New Page", args=["about:blank"])
+    open_page.body.create_keyword(
+        "Evaluate JavaScript", args=["${None}", "(html) => document.body.innerHTML = html", "arg=${html}"]
+    )
+
+    columns = len(_HEADERS) - 1
+    per_cell = suite.tests.create("Per Cell Get Text")
+    per_cell.body.create_keyword("Get Element Count", assign=["${rows}"], args=[f"{_TABLE} tbody tr"])
+    row_loop = per_cell.body.create_for(assign=["${r}"], flavor="IN RANGE", values=["1", "${rows + 1}"])
+    cell_loop = row_loop.body.create_for(assign=["${c}"], flavor="IN RANGE", values=["1", str(columns + 1)])
+    cell_loop.body.create_keyword("Get Text", args=[f"{_TABLE} tbody tr:nth-child(${{r}}) td:nth-child(${{c}})"])
+
+    per_row = suite.tests.create("Per Row Get Text")
+    per_row.body.create_keyword("Get Element Count", assign=["${rows}"], args=[f"{_TABLE} tbody tr"])
+    row_loop = per_row.body.create_for(assign=["${r}"], flavor="IN RANGE", values=["1", "${rows + 1}"])
+    row_loop.body.create_keyword("Get Text", args=[f"{_TABLE} tbody tr:nth-child(${{r}})"])
+
+    records = suite.tests.create("Get Table As Records")
+    records.body.create_keyword("BrowserHelpers.Get Table As Records", assign=["${records}"], args=[_TABLE])
+    records.body.create_keyword("Length Should Be", args=["${records}", str(rows)])
+
+    lookup = suite.tests.create("Get Table Row As Record")
+    lookup.body.create_keyword("BrowserHelpers.Get Table Row As Record", args=[_TABLE, f"{rows - 1:024x}"])
+    return suite
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    result = _build_suite(rows).run(output=None, stdout=io.StringIO(), console="none")
+    if result.suite.setup.status == "FAIL":
+        raise SystemExit(f"Setup failed: {result.suite.setup.message}")
+    print(f"{rows}-row table, {len(_HEADERS)} columns")
+    for test in result.suite.tests:
+        if test.status != "PASS":
+            raise SystemExit(f"{test.name} failed: {test.message}")
+        print(f"{test.name:<24} {test.elapsed_time.total_seconds() * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
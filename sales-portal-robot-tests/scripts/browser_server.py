@@ -0,0 +1,49 @@
+"""Start, stop or inspect the machine-wide browser server shared by parallel UI workers.
+
+``start`` prints the websocket endpoint; export it as ``BROWSER_WS_ENDPOINT`` so the UI suite setup
+connects to the shared browser instead of launching its own.
+
+Usage (from the project root)::
+
+    export BROWSER_WS_ENDPOINT=$(python scripts/browser_server.py start)
+    pabot --processes 8 tests/ui/
+    python scripts/browser_server.py stop
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from libraries.ui.browser_server import (
+    DEFAULT_STATE_PATH,
+    read_server_state,
+    start_browser_server,
+    stop_browser_server,
+)
+from variables.env import BROWSER, HEADLESS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["start", "stop", "status"])
+    parser.add_argument("--state", type=Path, default=DEFAULT_STATE_PATH, help="server state file")
+    parser.add_argument("--browser", default=BROWSER, help="chromium, firefox or webkit")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        print(start_browser_server(args.state, args.browser, HEADLESS)["wsEndpoint"])
+    elif args.command == "stop":
+        stopped = stop_browser_server(args.state)
+        print("Browser server stopped" if stopped else "No browser server running", file=sys.stderr)
+    else:
+        state = read_server_state(args.state)
+        if state is None:
+            sys.exit("No browser server running")
+        print(f"{state['browser']} pid={state['pid']} {state['wsEndpoint']}")
+
+
+if __name__ == "__main__":
+    main()
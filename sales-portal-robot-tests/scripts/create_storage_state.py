@@ -0,0 +1,32 @@
+"""Create the Playwright storage state (``STORAGE_STATE_PATH``) from an API login — no browser needed.
+
+Usage (from the project root)::
+
+    python scripts/create_storage_state.py [--force] [--path PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from libraries.api.api_client import ApiClientLibrary
+from libraries.ui.storage_state_library import ensure_storage_state
+from variables.env import SALES_PORTAL_URL, STORAGE_STATE_PATH, USER_NAME, USER_PASSWORD
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=STORAGE_STATE_PATH, help="storage state file to write")
+    parser.add_argument("--force", action="store_true", help="log in again even if the file is still valid")
+    args = parser.parse_args()
+
+    target = Path(args.path).resolve()
+    written = ensure_storage_state(ApiClientLibrary(), target, SALES_PORTAL_URL, USER_NAME, USER_PASSWORD, args.force)
+    print(f"{'Created' if written else 'Reused'} storage state {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Generate the response JSON schemas from the Pydantic models in ``data/models``.
+
+Writes ``data/schemas/response_schemas.json``, which tests read through ``data.schemas.compiled``.
+The mapping of schema names to models is ``data/schemas/sources.py``.  ``--check`` only compares
+and fails when the committed artifact no longer matches the models.
+
+Usage (from the project root)::
+
+    python scripts/generate_schemas.py [--check]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data.schemas.compiled import ARTIFACT_PATH
+from data.schemas.sources import SCHEMA_SOURCES
+
+_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+
+def render() -> str:
+    schemas = {
+        name: {"$schema": _DIALECT, **model.model_json_schema(by_alias=True)}
+        for name, model in SCHEMA_SOURCES.items()
+    }
+    artifact = {"generated_by": "scripts/generate_schemas.py", "schemas": schemas}
+    return json.dumps(artifact, indent=2, ensure_ascii=False) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail if the artifact is out of date")
+    args = parser.parse_args()
+
+    rendered = render()
+    current = ARTIFACT_PATH.read_text(encoding="utf-8") if ARTIFACT_PATH.exists() else ""
+    if args.check:
+        if rendered != current:
+            raise SystemExit(f"{ARTIFACT_PATH} is out of date with data/models; run 'make schemas'")
+        print(f"{ARTIFACT_PATH.name} is up to date ({len(SCHEMA_SOURCES)} schemas)")
+        return
+    ARTIFACT_PATH.write_text(rendered, encoding="utf-8")
+    print(f"Wrote {len(SCHEMA_SOURCES)} schemas to {ARTIFACT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Bulk-seed the portal's MongoDB with generated orders (plus their customers and products).
+
+Seeded data is left in place; the ids are written to ``--ids`` so the store can be emptied later.
+
+Usage (from the project root)::
+
+    python scripts/seed_mongo.py 100000 [--customers 1000] [--products 500] [--batch-size 5000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from libraries.stores.mongo_seed_library import DEFAULT_BATCH_SIZE, MongoSeedLibrary
+from variables.env import MONGO_DB, MONGO_URI
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("orders", type=int, help="number of orders to insert")
+    parser.add_argument("--customers", type=int, default=1000, help="customers referenced by the orders")
+    parser.add_argument("--products", type=int, default=500, help="products referenced by the orders")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="documents per insert_many")
+    parser.add_argument("--uri", default=MONGO_URI, help="MongoDB URI")
+    parser.add_argument("--db", default=MONGO_DB, help="database name")
+    parser.add_argument("--ids", type=Path, default=Path("results/seeded-ids.json"), help="where to write the ids")
+    args = parser.parse_args()
+
+    seeder = MongoSeedLibrary(args.uri, args.db, args.batch_size)
+    start = time.perf_counter()
+    customers = seeder.seed_customers(args.customers)
+    products = seeder.seed_products(args.products)
+    orders = seeder.seed_orders(args.orders, customers, products)
+    elapsed = time.perf_counter() - start
+
+    args.ids.parent.mkdir(parents=True, exist_ok=True)
+    args.ids.write_text(json.dumps({"orders": orders, "products": products, "customers": customers}), encoding="utf-8")
+    total = len(orders) + len(products) + len(customers)
+    print(f"Seeded {total} documents in {elapsed:.1f}s ({total / elapsed:.0f}/s); ids in {args.ids}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Delete test data leaked by runs that never reached their teardown.
+
+Reads the cleanup journals left in ``CLEANUP_JOURNAL_DIR`` by worker processes that are no longer running
+and deletes the ids they still hold: orders, then products, then customers, each in concurrent batches.
+A journal is removed once all of its ids are gone (deleted now or already missing).  ``--prefix``
+additionally deletes every product and customer whose name or email starts with ``TEST_DATA_PREFIX``,
+together with the customers' orders; only use it when no test run is in progress.
+
+Usage (from the project root)::
+
+    python scripts/sweep_orphans.py [--prefix] [--include-live] [--dry-run] [--workers 16]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from requests.structures import CaseInsensitiveDict
+
+import variables.api_config as api
+from libraries.api.api_client import ApiClientLibrary
+from libraries.stores.cleanup_journal import JOURNAL_KINDS, orphaned_journals, read_journal
+from variables.constants import TEST_DATA_PREFIX
+from variables.env import CLEANUP_JOURNAL_DIR, CREDENTIALS
+
+_DELETE_URL = {"orders": api.order_by_id, "products": api.product_by_id, "customers": api.customer_by_id}
+# 404: already deleted by someone else — the id is gone either way
+_GONE = {200, 204, 404}
+_BATCH_SIZE = 200
+
+
+def _login(client: ApiClientLibrary) -> str:
+    response = client.send_api_request("POST", api.LOGIN, body=CREDENTIALS)
+    if response.status != 200:
+        raise SystemExit(f"Login failed with status {response.status}: {response.body}")
+    return str(CaseInsensitiveDict(response.headers)["Authorization"])
+
+
+def _delete(client: ApiClientLibrary, token: str, kind: str, ids: list[str], workers: int) -> list[str]:
+    """Delete *ids* in concurrent batches; return those that could not be deleted."""
+    failed: list[str] = []
+    for start in range(0, len(ids), _BATCH_SIZE):
+        batch = ids[start : start + _BATCH_SIZE]
+        request_list = [{"method": "DELETE", "url": _DELETE_URL[kind](item), "token": token} for item in batch]
+        responses = client.send_api_requests_concurrently(request_list, max_workers=workers)
+        failed.extend(item for item, response in zip(batch, responses, strict=True) if response.status not in _GONE)
+    return failed
+
+
+def _prefixed(client: ApiClientLibrary, token: str) -> dict[str, list[str]]:
+    """Collect products and customers named with ``TEST_DATA_PREFIX`` and the orders of those customers."""
+    prefix = TEST_DATA_PREFIX.lower()
+
+    def ids(url: str, key: str, *fields: str) -> list[str]:
+        items: list[dict[str, Any]] = client.send_api_request("GET", url, token=token).body.get(key) or []
+        return [item["_id"] for item in items if any(str(item.get(f, "")).lower().startswith(prefix) for f in fields)]
+
+    customers = ids(api.CUSTOMERS_ALL, "Customers", "name", "email")
+    orders: list[str] = []
+    for customer_id in customers:
+        response = client.send_api_request("GET", api.customer_orders(customer_id), token=token)
+        orders.extend(order["_id"] for order in response.body.get("Orders") or [])
+    return {"orders": orders, "products": ids(api.PRODUCTS_ALL, "Products", "name"), "customers": customers}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--journal-dir", type=Path, default=Path(CLEANUP_JOURNAL_DIR), help="journal directory")
+    parser.add_argument("--include-live", action="store_true", help="also sweep journals of running processes")
+    parser.add_argument("--prefix", action="store_true", help=f"also delete untracked '{TEST_DATA_PREFIX}' data")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be deleted")
+    parser.add_argument("--workers", type=int, default=16, help="concurrent delete requests")
+    args = parser.parse_args()
+
+    journals = orphaned_journals(args.journal_dir, args.include_live)
+    targets: dict[str, dict[str, None]] = {kind: {} for kind in JOURNAL_KINDS}
+    for journal in journals:
+        for kind, ids in read_journal(journal).items():
+            targets[kind].update(dict.fromkeys(ids))
+
+    client = ApiClientLibrary()
+    token = _login(client)
+    if args.prefix:
+        for kind, ids in _prefixed(client, token).items():
+            targets[kind].update(dict.fromkeys(ids))
+
+    summary = ", ".join(f"{len(targets[kind])} {kind}" for kind in JOURNAL_KINDS)
+    print(f"{len(journals)} orphaned journal(s); to delete: {summary}")
+    if args.dry_run:
+        return
+    failed = {kind: _delete(client, token, kind, list(targets[kind]), args.workers) for kind in JOURNAL_KINDS}
+    if any(failed.values()):
+        details = ", ".join(f"{len(ids)} {kind}" for kind, ids in failed.items() if ids)
+        raise SystemExit(f"Could not delete {details}; journals kept for the next sweep")
+    for journal in journals:
+        journal.unlink(missing_ok=True)
+    print("Sweep complete")
+
+
+if __name__ == "__main__":
+    main()
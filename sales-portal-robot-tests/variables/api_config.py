@@ -2,79 +2,41 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 
 from dotenv import load_dotenv
 
+from libraries.api.routes import ROUTES as _ROUTES
+
 load_dotenv(".env.dev" if os.getenv("TEST_ENV") == "dev" else ".env")
 
 _BASE_URL: str = os.environ.get("SALES_PORTAL_API_URL", "http://localhost:8686")
 
 # Static endpoint constants (become RF variables when loaded as variable file)
-LOGIN: str = f"{_BASE_URL}/api/login"
-LOGOUT: str = f"{_BASE_URL}/api/logout"
-PRODUCTS: str = f"{_BASE_URL}/api/products"
-PRODUCTS_ALL: str = f"{_BASE_URL}/api/products/all"
-CUSTOMERS: str = f"{_BASE_URL}/api/customers"
-CUSTOMERS_ALL: str = f"{_BASE_URL}/api/customers/all"
-ORDERS: str = f"{_BASE_URL}/api/orders"
-NOTIFICATIONS: str = f"{_BASE_URL}/api/notifications"
-NOTIFICATIONS_MARK_ALL_READ: str = f"{_BASE_URL}/api/notifications/mark-all-read"
-METRICS: str = f"{_BASE_URL}/api/metrics"
-USERS: str = f"{_BASE_URL}/api/users"
-
-
-# Parameterised endpoint builder functions (called from keyword libraries)
-def product_by_id(product_id: str) -> str:
-    return f"{PRODUCTS}/{product_id}"
-
-
-def customer_by_id(customer_id: str) -> str:
-    return f"{CUSTOMERS}/{customer_id}"
-
-
-def customer_orders(customer_id: str) -> str:
-    return f"{CUSTOMERS}/{customer_id}/orders"
-
-
-def order_by_id(order_id: str) -> str:
-    return f"{ORDERS}/{order_id}"
-
-
-def order_delivery(order_id: str) -> str:
-    return f"{ORDERS}/{order_id}/delivery"
-
-
-def order_status(order_id: str) -> str:
-    return f"{ORDERS}/{order_id}/status"
-
-
-def order_receive(order_id: str) -> str:
-    return f"{ORDERS}/{order_id}/receive"
-
-
-def order_comments(order_id: str) -> str:
-    return f"{ORDERS}/{order_id}/comments"
-
-
-def order_comment_by_id(order_id: str, comment_id: str) -> str:
-    return f"{ORDERS}/{order_id}/comments/{comment_id}"
-
-
-def assign_manager(order_id: str, manager_id: str) -> str:
-    return f"{ORDERS}/{order_id}/assign-manager/{manager_id}"
-
-
-def unassign_manager(order_id: str) -> str:
-    return f"{ORDERS}/{order_id}/unassign-manager"
-
-
-def notification_read(notification_id: str) -> str:
-    return f"{NOTIFICATIONS}/{notification_id}/read"
-
-
-def user_by_id(user_id: str) -> str:
-    return f"{USERS}/{user_id}"
-
-
-def user_password(user_id: str) -> str:
-    return f"{USERS}/password/{user_id}"
+LOGIN: str = _ROUTES.url("login", _BASE_URL)
+LOGOUT: str = _ROUTES.url("logout", _BASE_URL)
+PRODUCTS: str = _ROUTES.url("products.list", _BASE_URL)
+PRODUCTS_ALL: str = _ROUTES.url("products.all", _BASE_URL)
+CUSTOMERS: str = _ROUTES.url("customers.list", _BASE_URL)
+CUSTOMERS_ALL: str = _ROUTES.url("customers.all", _BASE_URL)
+ORDERS: str = _ROUTES.url("orders.list", _BASE_URL)
+NOTIFICATIONS: str = _ROUTES.url("notifications.list", _BASE_URL)
+NOTIFICATIONS_MARK_ALL_READ: str = _ROUTES.url("notifications.read_all", _BASE_URL)
+METRICS: str = _ROUTES.url("metrics", _BASE_URL)
+USERS: str = _ROUTES.url("users.list", _BASE_URL)
+
+# Parameterised endpoint builders (called from keyword libraries) — precompiled from the route registry
+product_by_id: Callable[[str], str] = _ROUTES.builder("products.get", _BASE_URL)
+customer_by_id: Callable[[str], str] = _ROUTES.builder("customers.get", _BASE_URL)
+customer_orders: Callable[[str], str] = _ROUTES.builder("customers.orders", _BASE_URL)
+order_by_id: Callable[[str], str] = _ROUTES.builder("orders.get", _BASE_URL)
+order_delivery: Callable[[str], str] = _ROUTES.builder("orders.delivery", _BASE_URL)
+order_status: Callable[[str], str] = _ROUTES.builder("orders.status", _BASE_URL)
+order_receive: Callable[[str], str] = _ROUTES.builder("orders.receive", _BASE_URL)
+order_comments: Callable[[str], str] = _ROUTES.builder("orders.comments.create", _BASE_URL)
+order_comment_by_id: Callable[[str, str], str] = _ROUTES.builder("orders.comments.delete", _BASE_URL)
+assign_manager: Callable[[str, str], str] = _ROUTES.builder("orders.assign_manager", _BASE_URL)
+unassign_manager: Callable[[str], str] = _ROUTES.builder("orders.unassign_manager", _BASE_URL)
+notification_read: Callable[[str], str] = _ROUTES.builder("notifications.read", _BASE_URL)
+user_by_id: Callable[[str], str] = _ROUTES.builder("users.get", _BASE_URL)
+user_password: Callable[[str], str] = _ROUTES.builder("users.password", _BASE_URL)
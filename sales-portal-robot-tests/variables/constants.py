@@ -15,3 +15,6 @@ VIEWPORT_HEIGHT: int = 1080
 # Orders
 MAX_PRODUCTS_PER_ORDER: int = 5
 MIN_PRODUCTS_PER_ORDER: int = 1
+
+# Generated product / customer names and customer emails start with this, so leftovers can be found and swept
+TEST_DATA_PREFIX: str = "Autotest"
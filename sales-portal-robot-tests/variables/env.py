@@ -16,6 +16,24 @@ MANAGER_IDS: list[str] = json.loads(os.environ.get("MANAGER_IDS", "[]"))
 STORAGE_STATE_PATH: str = os.path.abspath(os.getenv("STORAGE_STATE_PATH", "src/.auth/user.json"))
 HEADLESS: bool = os.getenv("HEADLESS", "True").lower() == "true"
 BROWSER: str = os.getenv("BROWSER", "chromium")
+BROWSER_WS_ENDPOINT: str = os.getenv("BROWSER_WS_ENDPOINT", "")
+TRACE_ON_FAILURE: bool = os.getenv("TRACE_ON_FAILURE", "False").lower() == "true"
+API_HAR_MODE: str = os.getenv("API_HAR_MODE", "off")
+API_HAR_DIR: str = os.path.abspath(os.getenv("API_HAR_DIR", "data/har"))
+MONGO_URI: str = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+MONGO_DB: str = os.getenv("MONGO_DB", "aqa-course")
+CLEANUP_JOURNAL_DIR: str = os.getenv("CLEANUP_JOURNAL_DIR", ".cleanup-journal")
+DB_ISOLATION: str = os.getenv("DB_ISOLATION", "teardown").lower()
+ORDER_POOL_SIZE: int = int(os.getenv("ORDER_POOL_SIZE", "2"))
+ORDER_POOL_WORKERS: int = int(os.getenv("ORDER_POOL_WORKERS", "4"))
+DEFER_SCHEMA_VALIDATION: bool = os.getenv("DEFER_SCHEMA_VALIDATION", "False").lower() == "true"
+SCHEMA_VALIDATION_WORKERS: int = int(os.getenv("SCHEMA_VALIDATION_WORKERS", "2"))
+SCHEMA_ITEM_MODE: str = os.getenv("SCHEMA_ITEM_MODE", "all").lower()
+SCHEMA_ITEM_COUNT: int = int(os.getenv("SCHEMA_ITEM_COUNT", "100"))
+SCHEMA_EXHAUSTIVE_IN_BACKGROUND: bool = os.getenv("SCHEMA_EXHAUSTIVE_IN_BACKGROUND", "False").lower() == "true"
+API_RETRY_ATTEMPTS: int = int(os.getenv("API_RETRY_ATTEMPTS", "1"))
+API_RATE_LIMIT: float = float(os.getenv("API_RATE_LIMIT", "0"))
+API_MAX_CONCURRENCY: int = int(os.getenv("API_MAX_CONCURRENCY", "0"))
 TELEGRAM_BOT_TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID: str = os.getenv("TELEGRAM_CHAT_ID", "")
 